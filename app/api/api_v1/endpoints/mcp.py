@@ -1,10 +1,11 @@
 from typing import Any
-from fastapi import APIRouter, WebSocket, Depends, HTTPException, BackgroundTasks
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, WebSocket, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
-from app.api import deps
+from app.config import settings
 from app.core.mcp_handler import mcp_handler
-from app.core.mcp_protocol import mcp_protocol
+from app.core.job_manager import job_manager, MCPJob
+from app.core.sse import format_sse, SSE_HEADERS, SSE_KEEPALIVE, SSE_KEEPALIVE_SECONDS
 
 router = APIRouter()
 
@@ -15,38 +16,91 @@ async def websocket_endpoint(websocket: WebSocket):
     """
     await mcp_handler.handle_websocket(websocket)
 
-@router.post("/message")
+@router.get("/metrics")
+async def get_metrics() -> Any:
+    """
+    MCP 연결별 전송 대기열 지표 조회
+    """
+    return mcp_handler.connection_manager.get_metrics()
+
+@router.post("/message", status_code=202)
 async def process_message(
     *,
-    background_tasks: BackgroundTasks,
-    db: AsyncSession = Depends(deps.get_db),
+    request: Request,
     message: dict,
+    wait: float = Query(0, ge=0),
 ) -> Any:
     """
     MCP 메세지 처리 (REST API)
+    
+    요청을 작업으로 등록하고 작업 ID 를 반환한다.
+    결과는 GET /jobs/{job_id} (long-poll) 또는 GET /jobs/{job_id}/events (SSE) 로 조회한다.
+    wait 를 지정하면 그 시간(초)까지 완료를 기다렸다가 결과를 함께 반환한다.
+    """
+    # 메세지 유형 확인
+    message_type = message.get("message_type")
+    content = message.get("content", {})
+    
+    if message_type != "request":
+        raise HTTPException(status_code=400, detail=f"Unsupported message type: {message_type}")
+    if not isinstance(content, dict):
+        raise HTTPException(status_code=400, detail="Message content must be an object")
+    
+    action = content.get("action")
+    params = content.get("params", {})
+    request_id = content.get("request_id", "unknown")
+    
+    if not isinstance(params, dict):
+        raise HTTPException(status_code=400, detail="Request params must be an object")
+    
+    # 지원하는 작업인지 확인
+    if action not in mcp_handler.action_handlers:
+        raise HTTPException(status_code=400, detail=f"Unsupported action: {action}")
+    
+    # WebSocket 과 같은 작업 핸들러로 비동기 실행
+    job = job_manager.submit(action, request_id, lambda: mcp_handler.dispatch(action, params))
+    await job_manager.wait(job, min(wait, settings.MCP_JOB_MAX_WAIT_SECONDS))
+    return _job_response(request, job)
+
+@router.get("/jobs/{job_id}", name="get_mcp_job")
+async def get_job(
+    *,
+    request: Request,
+    job_id: str,
+    wait: float = Query(0, ge=0),
+) -> Any:
+    """
+    MCP 작업 결과 조회 (wait 초까지 완료를 기다리는 long-poll)
+    """
+    job = job_manager.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    await job_manager.wait(job, min(wait, settings.MCP_JOB_MAX_WAIT_SECONDS))
+    return _job_response(request, job)
+
+@router.get("/jobs/{job_id}/events", name="get_mcp_job_events")
+async def get_job_events(job_id: str) -> Any:
+    """
+    MCP 작업 결과 조회 (SSE: status 이벤트 후 완료 시 result 이벤트)
+    """
+    job = job_manager.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    async def stream():
+        yield format_sse({"job_id": job.job_id, "status": job.status}, event="status")
+        while not await job_manager.wait(job, SSE_KEEPALIVE_SECONDS):
+            yield SSE_KEEPALIVE
+        yield format_sse(job.to_dict(), event="result")
+    
+    return StreamingResponse(stream(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+def _job_response(request: Request, job: MCPJob) -> dict:
+    """
+    작업 상태 응답 생성 (결과 조회 URL 포함)
     """
-    try:
-        # 메세지 유형 확인
-        message_type = message.get("message_type")
-        content = message.get("content", {})
-        
-        if message_type == "request":
-            action = content.get("action")
-            params = content.get("params", {})
-            request_id = content.get("request_id", "unknown")
-            
-            # 지원하는 작업인지 확인
-            if action in mcp_handler.action_handlers:
-                # 비동기 처리를 위해 백그라운드 태스크로 처리
-                # (WebSocket대신 REST API로 처리하는 경우에 사용)
-                return {
-                    "message": f"Processing {action} request",
-                    "request_id": request_id,
-                    "status": "accepted"
-                }
-            else:
-                raise HTTPException(status_code=400, detail=f"Unsupported action: {action}")
-        else:
-            raise HTTPException(status_code=400, detail=f"Unsupported message type: {message_type}")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing message: {str(e)}")
+    response = job.to_dict()
+    response["result_url"] = str(request.url_for("get_mcp_job", job_id=job.job_id))
+    response["events_url"] = str(request.url_for("get_mcp_job_events", job_id=job.job_id))
+    return response
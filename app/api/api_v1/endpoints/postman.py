@@ -1,9 +1,14 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from typing import Any, List, Optional
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query, Response
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.api import deps
+from app.api.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
+from app.core.postman_handler import postman_handler
+from app.core.postman_reader import load_json_file
 from app.models.postman import PostmanCollection, PostmanEnvironment, PostmanTestData
 from app.models.user import User
 
@@ -16,34 +21,35 @@ async def upload_collection(
     current_user: User = Depends(deps.get_current_user),
     name: str = Form(...),
     description: str = Form(None),
+    collection_id: Optional[int] = Form(None),
     collection_file: UploadFile = File(...),
 ) -> Any:
     """
-    Postman Collection 파일 업로드
+    Postman Collection 파일 업로드 (collection_id 지정 시 기존 Collection 재업로드)
     """
+    # 재업로드 대상 확인
+    if collection_id is not None:
+        collection = await db.get(PostmanCollection, collection_id)
+        if not collection or collection.user_id != current_user.user_id:
+            raise HTTPException(status_code=404, detail="Collection not found")
+    
     try:
-        # 파일 내용 읽기
-        content = await collection_file.read()
-        collection_data = content.decode()
-        
-        # Collection 생성
-        collection = PostmanCollection(
-            name=name,
-            description=description,
-            collection_data=collection_data,
-            user_id=current_user.user_id
-        )
-        
-        db.add(collection)
-        await db.commit()
-        await db.refresh(collection)
-        
-        return {
-            "message": "Collection uploaded successfully",
-            "collection_id": collection.collection_id
-        }
-    except Exception as e:
+        # 파일 내용 파싱 (이벤트 루프를 막지 않도록 스레드에서 실행)
+        collection_data = await run_in_threadpool(load_json_file, collection_file.file)
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    
+    result = await postman_handler.process_collection(
+        db, collection_data, name, description, current_user.user_id, collection_id
+    )
+    if result["status"] != "success":
+        raise HTTPException(status_code=400, detail=result["message"])
+    
+    return {
+        "message": "Collection uploaded successfully",
+        "collection_id": result["collection_id"],
+        "version": result["version"]
+    }
 
 @router.post("/environments", response_model=dict)
 async def upload_environment(
@@ -134,25 +140,47 @@ async def list_collections(
     *,
     db: AsyncSession = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_user),
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    after: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
 ) -> Any:
     """
-    사용자의 Postman Collection 목록 조회
+    사용자의 Postman Collection 목록 조회 (최신순, keyset 페이지네이션)
+    
+    collection_data 컬럼은 조회하지 않는다.
+    다음 페이지가 있으면 X-Next-Cursor 헤더의 값을 after 로 전달한다.
     """
+    # 커서: 마지막 행의 collection_id
+    cursor = decode_cursor(after, 1, (int,)) if after else None
+    
     try:
-        query = select(PostmanCollection).where(PostmanCollection.user_id == current_user.user_id)
-        result = await db.execute(query)
-        collections = result.scalars().all()
+        query = (
+            select(
+                PostmanCollection.collection_id,
+                PostmanCollection.name,
+                PostmanCollection.description,
+                PostmanCollection.created_at,
+                PostmanCollection.updated_at
+            )
+            .where(PostmanCollection.user_id == current_user.user_id)
+            .order_by(PostmanCollection.collection_id.desc())
+            .limit(limit + 1)
+        )
+        if created_after:
+            query = query.where(PostmanCollection.created_at >= created_after)
+        if created_before:
+            query = query.where(PostmanCollection.created_at < created_before)
+        if cursor:
+            query = query.where(PostmanCollection.collection_id < cursor[0])
+        
+        rows = (await db.execute(query)).mappings().all()
+        if len(rows) > limit:
+            rows = rows[:limit]
+            response.headers[NEXT_CURSOR_HEADER] = encode_cursor([rows[-1]["collection_id"]])
         
-        return [
-            {
-                "collection_id": c.collection_id,
-                "name": c.name,
-                "description": c.description,
-                "created_at": c.created_at,
-                "updated_at": c.updated_at
-            }
-            for c in collections
-        ]
+        return [dict(row) for row in rows]
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
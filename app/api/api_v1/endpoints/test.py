@@ -1,12 +1,20 @@
 from typing import Any, List, Optional
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+import asyncio
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.api import deps
+from app.api.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
 from app.models.test_run import TestRun, TestResult
 from app.models.user import User
-from app.core.test_handler import test_handler
+from app.core.test_handler import test_handler, TERMINAL_EVENTS
+from app.core.test_scheduler import test_scheduler
+from app.core.event_bus import event_bus, make_topic
+from app.core.sse import format_sse, SSE_HEADERS, SSE_KEEPALIVE, SSE_KEEPALIVE_SECONDS
+from app.config import settings
 
 router = APIRouter()
 
@@ -18,6 +26,10 @@ async def run_test(
     collection_id: int,
     environment_id: Optional[int] = None,
     test_data_id: Optional[int] = None,
+    concurrency: int = 1,
+    iteration_concurrency: int = 1,
+    shards: int = 0,
+    priority: int = 0,
 ) -> Any:
     """
     테스트 실행
@@ -28,7 +40,11 @@ async def run_test(
             collection_id=collection_id,
             environment_id=environment_id,
             test_data_id=test_data_id,
-            user_id=current_user.user_id
+            user_id=current_user.user_id,
+            concurrency=concurrency,
+            iteration_concurrency=iteration_concurrency,
+            shards=shards,
+            priority=priority
         )
         
         if result["status"] == "error":
@@ -38,36 +54,74 @@ async def run_test(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/queue", response_model=dict)
+async def get_queue_status(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_user),
+) -> Any:
+    """
+    테스트 실행 대기열 상태 조회
+    """
+    try:
+        return await test_scheduler.get_queue_status(db, user_id=current_user.user_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/runs", response_model=List[dict])
 async def list_test_runs(
     *,
     db: AsyncSession = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_user),
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    after: Optional[str] = None,
+    status: Optional[str] = None,
+    started_after: Optional[datetime] = None,
+    started_before: Optional[datetime] = None,
 ) -> Any:
     """
-    사용자의 테스트 실행 목록 조회
+    사용자의 테스트 실행 목록 조회 (최신순, keyset 페이지네이션)
+    
+    다음 페이지가 있으면 X-Next-Cursor 헤더의 값을 after 로 전달한다.
     """
+    # 커서: 마지막 행의 test_run_id (생성 순서대로 증가하고 바뀌지 않음)
+    cursor = decode_cursor(after, 1, (int,)) if after else None
+    
     try:
-        query = select(TestRun).where(TestRun.user_id == current_user.user_id)
-        result = await db.execute(query)
-        test_runs = result.scalars().all()
+        query = (
+            select(
+                TestRun.test_run_id,
+                TestRun.collection_id,
+                TestRun.environment_id,
+                TestRun.test_data_id,
+                TestRun.status,
+                TestRun.start_time,
+                TestRun.end_time,
+                TestRun.total_tests,
+                TestRun.passed_tests,
+                TestRun.failed_tests,
+                TestRun.skipped_tests
+            )
+            .where(TestRun.user_id == current_user.user_id)
+            .order_by(TestRun.test_run_id.desc())
+            .limit(limit + 1)
+        )
+        if status:
+            query = query.where(TestRun.status == status)
+        if started_after:
+            query = query.where(TestRun.start_time >= started_after)
+        if started_before:
+            query = query.where(TestRun.start_time < started_before)
+        if cursor:
+            query = query.where(TestRun.test_run_id < cursor[0])
         
-        return [
-            {
-                "test_run_id": tr.test_run_id,
-                "collection_id": tr.collection_id,
-                "environment_id": tr.environment_id,
-                "test_data_id": tr.test_data_id,
-                "status": tr.status,
-                "start_time": tr.start_time,
-                "end_time": tr.end_time,
-                "total_tests": tr.total_tests,
-                "passed_tests": tr.passed_tests,
-                "failed_tests": tr.failed_tests,
-                "skipped_tests": tr.skipped_tests
-            }
-            for tr in test_runs
-        ]
+        rows = (await db.execute(query)).mappings().all()
+        if len(rows) > limit:
+            rows = rows[:limit]
+            response.headers[NEXT_CURSOR_HEADER] = encode_cursor([rows[-1]["test_run_id"]])
+        
+        return [dict(row) for row in rows]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -77,6 +131,7 @@ async def get_test_run(
     db: AsyncSession = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_user),
     test_run_id: int,
+    iteration: Optional[int] = None,
 ) -> Any:
     """
     특정 테스트 실행 결과 조회
@@ -85,7 +140,8 @@ async def get_test_run(
         result = await test_handler.get_test_run(
             db=db,
             test_run_id=test_run_id,
-            user_id=current_user.user_id
+            user_id=current_user.user_id,
+            iteration=iteration
         )
         
         if result["status"] == "error":
@@ -93,4 +149,81 @@ async def get_test_run(
         
         return result
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e)) 
+
+@router.get("/runs/{test_run_id}/events")
+async def stream_test_run_events(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_user),
+    test_run_id: int,
+    last_event_id: Optional[int] = Header(None),
+) -> Any:
+    """
+    테스트 실행 진행 상황 스트림 (Server-Sent Events)
+    
+    이벤트 ID 는 실행별 seq 이며, 재연결 시 Last-Event-ID 헤더로 전달하면 놓친 이벤트부터 다시 받는다.
+    실행이 끝나면 end 이벤트를 보내고 스트림을 종료한다.
+    """
+    status = await db.scalar(
+        select(TestRun.status).where(
+            TestRun.test_run_id == test_run_id,
+            TestRun.user_id == current_user.user_id
+        )
+    )
+    if status is None:
+        raise HTTPException(status_code=404, detail="Test run not found")
+    
+    # 구독자별 수신 대기열 (가득 차면 스트림을 끊고 클라이언트가 Last-Event-ID 로 재개)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=settings.MCP_SEND_QUEUE_SIZE)
+    overflow = asyncio.Event()
+    
+    async def send(message):
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            overflow.set()
+    
+    async def stream():
+        sent = last_event_id or 0
+        # 응답 본문을 시작할 때 구독해야 그 전에 연결이 끊겨도 구독이 남지 않음
+        # (재전송보다 먼저 구독해야 그 사이 발행된 이벤트를 놓치지 않음)
+        event_bus.subscribe(queue, [make_topic("test_run", test_run_id)], send)
+        try:
+            replayed, truncated = event_bus.replay(test_run_id, sent)
+            if truncated:
+                # 일부 이벤트가 재전송 버퍼에서 밀려남 (전체 결과는 GET /runs/{test_run_id} 로 조회)
+                yield format_sse({"test_run_id": test_run_id, "last_event_id": sent}, event="truncated")
+            
+            for message in replayed:
+                sent = message["content"]["seq"]
+                yield format_sse(message["content"]["data"], event=message["content"]["event_type"], event_id=sent, cache=True)
+                if message["content"]["event_type"] in TERMINAL_EVENTS:
+                    yield format_sse({"test_run_id": test_run_id}, event="end")
+                    return
+            
+            if status in ("completed", "failed"):
+                # 이미 끝난 실행 (종료 이벤트가 재전송 버퍼에 없음)
+                yield format_sse({"test_run_id": test_run_id, "status": status}, event="end")
+                return
+            
+            while not overflow.is_set():
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield SSE_KEEPALIVE
+                    continue
+                
+                content = message["content"]
+                if content.get("seq", 0) <= sent:
+                    # 재전송으로 이미 보낸 이벤트
+                    continue
+                sent = content["seq"]
+                yield format_sse(content["data"], event=content["event_type"], event_id=sent, cache=True)
+                if content["event_type"] in TERMINAL_EVENTS:
+                    yield format_sse({"test_run_id": test_run_id}, event="end")
+                    return
+        finally:
+            event_bus.unsubscribe(queue)
+    
+    return StreamingResponse(stream(), media_type="text/event-stream", headers=SSE_HEADERS)
@@ -0,0 +1,40 @@
+from typing import Any, List, Optional, Sequence
+import base64
+import json
+from fastapi import HTTPException
+
+# 다음 페이지 커서를 전달하는 응답 헤더
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(values: List[Any]) -> str:
+    """
+    keyset 페이지네이션 커서 생성
+
+    :param values: 마지막 행의 정렬 키 값
+    :return: URL-safe 커서 문자열
+    """
+    raw = json.dumps(values, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, size: int, types: Optional[Sequence[type]] = None) -> List[Any]:
+    """
+    keyset 페이지네이션 커서 해석
+
+    :param cursor: encode_cursor() 로 생성된 커서
+    :param size: 정렬 키 개수
+    :param types: 정렬 키별 값 타입 (선택, 다르면 잘못된 커서로 처리)
+    :return: 정렬 키 값 목록
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError("unexpected cursor shape")
+        if types and any(
+            isinstance(value, bool) or not isinstance(value, value_type)
+            for value, value_type in zip(values, types)
+        ):
+            raise ValueError("unexpected cursor value")
+        return values
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
@@ -14,6 +14,19 @@ class Settings(BaseSettings):
     
     # 데이터베이스 설정
     DATABASE_URL: str = "sqlite+aiosqlite:///./mcp.db"
+    DB_ECHO: bool = False  # SQL 로그 출력 (DEBUG 와 별도)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    
+    # SQLite 저장소 프로파일 (performance: 아래 PRAGMA 적용, default: SQLite 기본값)
+    DB_STORAGE_PROFILE: str = "performance"
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 268435456  # 256MB
+    SQLITE_CACHE_SIZE: int = -65536  # 음수는 KiB 단위 (64MB)
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_TEMP_STORE: str = "MEMORY"
     
     # 보안 설정
     SECRET_KEY: str = "dev_secret_key"
@@ -24,6 +37,48 @@ class Settings(BaseSettings):
     SSL_CERTFILE: str = "./certs/cert.pem"
     SSL_KEYFILE: str = "./certs/key.pem"
     
+    # 테스트 실행 설정
+    TEST_REQUEST_TIMEOUT: float = 30.0
+    TEST_VERIFY_SSL: bool = True
+    TEST_MAX_CONNECTIONS: int = 100
+    TEST_MAX_CONCURRENCY: int = 50
+    TEST_MAX_ITERATION_CONCURRENCY: int = 32
+    TEST_SHARD_WORKERS: int = 0  # 0 이면 CPU 코어 수
+    TEST_SHARD_CHUNK_SIZE: int = 50
+    TEST_PROGRESS_INTERVAL_MS: int = 1000  # 진행 상황 이벤트 주기 (0 이면 사용 안 함)
+    TEST_COLLECTION_CACHE_SIZE: int = 32  # 컴파일된 Collection 캐시 크기 (0 이면 사용 안 함)
+    TEST_COLLECTION_CACHE_MAX_ITEMS: int = 100000  # 캐시된 Collection 들의 item 수 합계 상한 (0 이면 제한 없음)
+    
+    # 테스트 실행 대기열 설정
+    TEST_MAX_CONCURRENT_RUNS: int = 8
+    TEST_MAX_RUNS_PER_USER: int = 2
+    TEST_QUEUE_POLL_INTERVAL: float = 1.0
+    TEST_QUEUE_SCAN_LIMIT: int = 500
+    
+    # 테스트 결과 기록 설정
+    RESULT_WRITER_BATCH_SIZE: int = 200
+    RESULT_WRITER_FLUSH_INTERVAL_MS: int = 250
+    RESULT_WRITER_QUEUE_SIZE: int = 10000
+    
+    # MCP 연결 설정
+    MCP_MAX_INFLIGHT_REQUESTS: int = 32  # 연결별 동시 처리 요청 수
+    MCP_MAX_BATCH_REQUESTS: int = 100  # 배치 프레임 하나에 담을 수 있는 최대 요청 수
+    MCP_SEND_QUEUE_SIZE: int = 1000  # 연결별 전송 대기열 크기
+    MCP_SLOW_CONSUMER_POLICY: str = "drop_oldest"  # drop_oldest, coalesce, disconnect
+    MCP_MAX_BATCH_WINDOW_MS: int = 5000  # 클라이언트가 요청할 수 있는 최대 이벤트 묶음 주기
+    MCP_REPLAY_BUFFER_SIZE: int = 1000  # 테스트 실행별로 보관하는 최근 이벤트 수
+    MCP_REPLAY_MAX_RUNS: int = 100  # 재전송 버퍼를 보관하는 최대 테스트 실행 수
+    MCP_DEFAULT_ENCODING: str = "json"  # json, msgpack (협상하지 않은 연결에 사용)
+    MCP_ENCODE_CACHE_SIZE: int = 256  # 여러 연결로 보내는 메세지의 인코딩 결과 캐시 크기
+    MCP_WS_PER_MESSAGE_DEFLATE: bool = True  # WebSocket permessage-deflate 압축 허용
+    MCP_HTTP_MAX_JOBS: int = 64  # HTTP 로 요청된 작업의 동시 실행 수
+    MCP_JOB_TTL_SECONDS: int = 600  # 완료된 HTTP 작업 결과 보관 시간
+    MCP_JOB_MAX_WAIT_SECONDS: float = 30.0  # long-poll 최대 대기 시간
+    
+    # 파일 업로드 설정
+    UPLOAD_CHUNK_SIZE: int = 65536  # CollectionReader 가 파일을 스트리밍 파싱할 때 한 번에 읽는 크기
+    POSTMAN_IMPORT_BATCH_SIZE: int = 1000  # Postman 가져오기 시 한 번에 INSERT 하는 요청 수
+    
     # Redmine 설정
     REDMINE_URL: str = ""
     REDMINE_API_KEY: str = ""
@@ -0,0 +1,105 @@
+from typing import Dict, Any, List, Sequence, Set
+import json
+import re
+
+# {{variable}} 읽기
+TEMPLATE_READ_PATTERN = re.compile(r"\{\{\s*([^{}\s]+)\s*\}\}")
+# pm.environment.get("key") 형태의 스크립트 읽기
+SCRIPT_READ_PATTERN = re.compile(
+    r"pm\.(?:environment|collectionVariables|globals|variables)\.get\(\s*(['\"])([^'\"]+)\1"
+)
+# pm.environment.set("key", ...) / unset("key") 형태의 스크립트 쓰기
+SCRIPT_WRITE_PATTERN = re.compile(
+    r"pm\.(?:environment|collectionVariables|globals|variables)\.(?:set|unset)\(\s*(['\"])([^'\"]+)\1"
+)
+# 정적으로 분석할 수 없는 구문 (동적 키, 전체 삭제, 실행 순서 제어)
+BARRIER_PATTERN = re.compile(
+    r"pm\.(?:environment|collectionVariables|globals|variables)\.(?:set|unset)\(\s*[^'\"\s]"
+    r"|pm\.(?:environment|collectionVariables|globals)\.clear\("
+    r"|(?:postman|pm\.execution)\.setNextRequest\("
+)
+
+def analyze_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    item 의 변수 읽기/쓰기 집합 분석
+
+    :param item: 폴더 구조를 펼친 item (request, prerequest, test)
+    :return: reads, writes, barrier
+    """
+    scripts = f"{item.get('prerequest', '')}\n{item.get('test', '')}"
+    request = item.get("request")
+    serialized = request if isinstance(request, str) else json.dumps(request, ensure_ascii=False)
+
+    reads = set(TEMPLATE_READ_PATTERN.findall(serialized))
+    reads.update(key for _, key in SCRIPT_READ_PATTERN.findall(scripts))
+    writes = {key for _, key in SCRIPT_WRITE_PATTERN.findall(scripts)}
+
+    return {
+        "reads": reads,
+        "writes": writes,
+        "barrier": bool(BARRIER_PATTERN.search(scripts))
+    }
+
+class DependencyGraph:
+    """
+    Postman item 간 변수 의존성 그래프
+
+    item i 가 읽는 변수를 앞선 item j 가 쓰면 i 는 j 에 의존한다 (read-after-write).
+    같은 변수를 다시 쓰는 item 은 앞선 쓰기/읽기 이후에 실행된다 (write-after-write, write-after-read).
+    분석할 수 없는 스크립트를 가진 item 은 앞뒤 모든 item 과 순서가 고정된다.
+    """
+
+    def __init__(self, items: Sequence[Any]):
+        self.dependencies: List[Set[int]] = []
+        self.waves: List[List[int]] = []
+        self._build(items)
+
+    def _build(self, items: Sequence[Any]):
+        last_writer: Dict[str, int] = {}
+        readers: Dict[str, Set[int]] = {}
+        last_barrier = -1
+        levels: List[int] = []
+
+        for index, item in enumerate(items):
+            # 컴파일 시 분석된 결과 사용
+            info = item.analysis
+            deps: Set[int] = set()
+
+            if info["barrier"]:
+                deps.update(range(index))
+            elif last_barrier >= 0:
+                deps.add(last_barrier)
+
+            for key in info["reads"]:
+                if key in last_writer:
+                    deps.add(last_writer[key])
+            for key in info["writes"]:
+                if key in last_writer:
+                    deps.add(last_writer[key])
+                deps.update(readers.get(key, set()))
+            deps.discard(index)
+
+            # 상태 갱신
+            for key in info["reads"]:
+                readers.setdefault(key, set()).add(index)
+            for key in info["writes"]:
+                last_writer[key] = index
+                readers[key] = set()
+            if info["barrier"]:
+                last_barrier = index
+
+            self.dependencies.append(deps)
+            levels.append(1 + max((levels[d] for d in deps), default=-1))
+
+        # 위상 단계별 묶음
+        for index, level in enumerate(levels):
+            while len(self.waves) <= level:
+                self.waves.append([])
+            self.waves[level].append(index)
+
+    @property
+    def critical_path_length(self) -> int:
+        """
+        의존성 체인의 최대 길이 (단계 수)
+        """
+        return len(self.waves)
@@ -0,0 +1,263 @@
+from typing import Dict, Any, Optional, List, Tuple
+from collections import OrderedDict
+from datetime import datetime
+import json
+import logging
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.postman import PostmanCollection
+from app.core.script_evaluator import script_evaluator
+from app.core.collection_graph import analyze_item
+from app.core.template_engine import Template, compile_template
+from app.core.postman_reader import content_hash
+
+logger = logging.getLogger(__name__)
+
+def load_json(value: Any) -> Any:
+    """
+    JSON 컬럼 값 로드 (문자열로 저장된 JSON 도 처리)
+    """
+    while isinstance(value, (str, bytes)):
+        value = json.loads(value)
+    return value
+
+def build_url(url_data: Any) -> str:
+    """
+    Postman url 정의를 문자열로 변환
+    """
+    if isinstance(url_data, str):
+        return url_data
+    raw_url = url_data.get("raw", "")
+    if raw_url:
+        return raw_url
+
+    # 구성요소로 URL 생성
+    host = ".".join(url_data.get("host", []))
+    path = "/".join(url_data.get("path", []))
+    url = f"{host}/{path}" if host and path else host or path
+    protocol = url_data.get("protocol")
+    if protocol:
+        url = f"{protocol}://{url}"
+    query = [q for q in url_data.get("query", []) or [] if not q.get("disabled")]
+    if query:
+        url += "?" + "&".join(f"{q.get('key', '')}={q.get('value', '')}" for q in query)
+    return url
+
+class CompiledRequest:
+    """
+    변수 치환만 남겨둔 Postman request 정의
+
+    URL 조합, 비활성 헤더/필드 제외, 템플릿 컴파일은 컴파일 시 한 번만 수행한다.
+    """
+    __slots__ = ("method", "url", "headers", "auth_type", "auth_params", "body_mode", "body", "fields")
+
+    def __init__(self, request: Any):
+        if isinstance(request, str):
+            request = {"method": "GET", "url": request}
+
+        self.method: Template = compile_template(request.get("method", "GET"))
+        self.url: Template = compile_template(build_url(request.get("url", "")))
+        self.headers: Tuple[Tuple[Template, Template], ...] = tuple(
+            (compile_template(header.get("key", "")), compile_template(header.get("value", "")))
+            for header in request.get("header", []) or []
+            if not header.get("disabled")
+        )
+
+        auth = request.get("auth") or {}
+        self.auth_type: Optional[str] = auth.get("type")
+        self.auth_params: Tuple[Tuple[Any, Template], ...] = tuple(
+            (param.get("key"), compile_template(param.get("value", "")))
+            for param in auth.get(self.auth_type, []) or []
+        ) if self.auth_type else ()
+
+        body = request.get("body") or {}
+        self.body_mode: str = body.get("mode", "")
+        self.body: Optional[Template] = None
+        self.fields: Tuple[Tuple[Template, Template], ...] = ()
+        if self.body_mode == "raw":
+            self.body = compile_template(body.get("raw", ""))
+        elif self.body_mode in ("urlencoded", "formdata"):
+            self.fields = tuple(
+                (compile_template(field.get("key", "")), compile_template(field.get("value", "")))
+                for field in body.get(self.body_mode, []) or []
+                if not field.get("disabled") and field.get("type", "text") == "text"
+            )
+        elif self.body_mode == "graphql":
+            graphql = body.get("graphql", {})
+            self.body = compile_template(json.dumps({
+                "query": graphql.get("query", ""),
+                "variables": load_json(graphql.get("variables") or "{}")
+            }))
+
+class CompiledItem:
+    """
+    폴더 구조를 펼친 실행 단위 item (상위 폴더 스크립트 포함)
+    """
+    __slots__ = ("name", "path", "request", "prerequest", "test", "analysis", "hash")
+
+    def __init__(self, name: str, path: str, request: Any, prerequest: str, test: str, digest: str):
+        self.name = name
+        self.path = path
+        self.prerequest = prerequest
+        self.test = test
+        # 재업로드 시 재사용 여부 판단용 내용 해시
+        self.hash = digest
+        # 의존성 그래프용 변수 읽기/쓰기 분석
+        self.analysis = analyze_item({"request": request, "prerequest": prerequest, "test": test})
+        self.request = CompiledRequest(request)
+
+class CompiledCollection:
+    """
+    실행용으로 컴파일된 Postman Collection
+    """
+    __slots__ = ("variables", "items")
+
+    def __init__(self, variables: Tuple[Tuple[Any, Any], ...], items: Tuple[CompiledItem, ...]):
+        self.variables = variables
+        self.items = items
+
+def compile_collection(collection_data: Any, previous: Optional[CompiledCollection] = None) -> CompiledCollection:
+    """
+    Postman Collection 컴파일
+
+    이전 버전의 컴파일 결과가 주어지면 경로, request, 스크립트가 같은 item 은 다시 컴파일하지 않고 재사용한다.
+
+    :param collection_data: Collection JSON (문자열로 저장된 JSON 도 처리)
+    :param previous: 이전 버전의 컴파일된 Collection (선택)
+    :return: 컴파일된 Collection
+    """
+    collection = load_json(collection_data) or {}
+    variables = tuple(
+        (var.get("key"), var.get("value"))
+        for var in collection.get("variable", []) or []
+        if not var.get("disabled")
+    )
+
+    reusable: Dict[str, CompiledItem] = {item.hash: item for item in previous.items} if previous else {}
+    items: List[CompiledItem] = []
+    root_events = collection.get("event", []) or []
+    stack = [(collection.get("item", []) or [], "", [root_events], 0)]
+
+    while stack:
+        children, parent_path, events, index = stack.pop()
+        if index >= len(children):
+            continue
+        # 현재 위치를 다시 넣고 다음 item 처리
+        stack.append((children, parent_path, events, index + 1))
+        item = children[index]
+        name = item.get("name", "Unknown Request")
+        path = f"{parent_path}/{name}" if parent_path else name
+
+        # 중첩 폴더인 경우
+        if isinstance(item.get("item"), list):
+            stack.append((item["item"], path, events + [item.get("event", []) or []], 0))
+        # API 요청인 경우
+        elif "request" in item:
+            item_events = events + [item.get("event", []) or []]
+            prerequest = "\n".join(script_evaluator.get_script(e, "prerequest") for e in item_events).strip()
+            test = "\n".join(script_evaluator.get_script(e, "test") for e in item_events).strip()
+            digest = content_hash([path, item["request"], prerequest, test])
+            compiled = reusable.get(digest)
+            items.append(compiled or CompiledItem(name, path, item["request"], prerequest, test, digest))
+
+    return CompiledCollection(variables, tuple(items))
+
+class CompiledCollectionCache:
+    """
+    컴파일된 Collection LRU 캐시
+
+    (collection_id, version, updated_at) 가 같으면 같은 버전으로 보고 재사용한다.
+    Collection 이 재업로드되거나 수정되면 version 또는 updated_at 이 바뀌므로 이전 버전은 다음 조회 시 교체된다.
+    메모리 사용량은 컴파일된 item 수에 비례하므로 Collection 수와 item 수 합계를 함께 제한한다
+    (가장 최근에 저장한 Collection 은 item 수 상한을 넘어도 유지).
+    """
+
+    def __init__(self, max_size: int, max_items: int = 0):
+        self.max_size = max_size
+        self.max_items = max_items
+        self._entries: "OrderedDict[int, Tuple[Tuple[Optional[int], Optional[datetime]], CompiledCollection]]" = OrderedDict()
+        # 캐시된 item 수 합계
+        self._item_count = 0
+
+    def get(self, collection_id: int, version: Optional[int], updated_at: Optional[datetime]) -> Optional[CompiledCollection]:
+        """
+        캐시 조회
+
+        :param collection_id: Collection ID
+        :param version: Collection 버전
+        :param updated_at: Collection 수정 시각
+        :return: 컴파일된 Collection (없거나 버전이 다르면 None)
+        """
+        entry = self._entries.get(collection_id)
+        if entry is None or entry[0] != (version, updated_at):
+            return None
+        self._entries.move_to_end(collection_id)
+        return entry[1]
+
+    def latest(self, collection_id: int) -> Optional[CompiledCollection]:
+        """
+        버전과 관계없이 캐시된 컴파일 결과 조회 (재업로드 시 증분 컴파일용)
+
+        :param collection_id: Collection ID
+        :return: 컴파일된 Collection (없으면 None)
+        """
+        entry = self._entries.get(collection_id)
+        return entry[1] if entry else None
+
+    def put(
+        self,
+        collection_id: int,
+        version: Optional[int],
+        updated_at: Optional[datetime],
+        compiled: CompiledCollection
+    ):
+        """
+        캐시 저장 (같은 Collection 의 이전 버전은 교체)
+
+        :param collection_id: Collection ID
+        :param version: Collection 버전
+        :param updated_at: Collection 수정 시각
+        :param compiled: 컴파일된 Collection
+        """
+        if self.max_size <= 0:
+            return
+        previous = self._entries.pop(collection_id, None)
+        if previous is not None:
+            self._item_count -= len(previous[1].items)
+        self._entries[collection_id] = ((version, updated_at), compiled)
+        self._item_count += len(compiled.items)
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_size
+            or 0 < self.max_items < self._item_count
+        ):
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._item_count -= len(evicted.items)
+
+    async def load(self, db: AsyncSession, collection_id: int) -> Optional[CompiledCollection]:
+        """
+        컴파일된 Collection 조회 (캐시에 없을 때만 collection_data 를 읽어 컴파일)
+
+        :param db: 데이터베이스 세션
+        :param collection_id: Collection ID
+        :return: 컴파일된 Collection (Collection 이 없으면 None)
+        """
+        row = (await db.execute(
+            select(PostmanCollection.version, PostmanCollection.updated_at).where(PostmanCollection.collection_id == collection_id)
+        )).first()
+        if row is None:
+            return None
+
+        compiled = self.get(collection_id, row.version, row.updated_at)
+        if compiled is None:
+            collection_data = await db.scalar(
+                select(PostmanCollection.collection_data).where(PostmanCollection.collection_id == collection_id)
+            )
+            compiled = compile_collection(collection_data, self.latest(collection_id))
+            self.put(collection_id, row.version, row.updated_at, compiled)
+            logger.info(f"Compiled collection {collection_id} ({len(compiled.items)} items)")
+        return compiled
+
+# 싱글톤 인스턴스
+collection_cache = CompiledCollectionCache(settings.TEST_COLLECTION_CACHE_SIZE, settings.TEST_COLLECTION_CACHE_MAX_ITEMS)
@@ -0,0 +1,378 @@
+from typing import Dict, Any, Optional, List, Sequence, Callable, Awaitable
+import asyncio
+import base64
+import json
+import logging
+import time
+import httpx
+
+from app.config import settings
+from app.core.script_evaluator import script_evaluator
+from app.core.collection_graph import DependencyGraph
+from app.core.collection_ir import CompiledCollection, CompiledItem, CompiledRequest, compile_collection, load_json
+from app.core.template_engine import VariableScope
+from app.core.shard_executor import get_shard_pool, run_shard
+
+logger = logging.getLogger(__name__)
+
+# 실행기 간에 공유하는 HTTP 클라이언트
+_http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    공유 HTTP 클라이언트 반환 (최초 호출 시 생성)
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=settings.TEST_REQUEST_TIMEOUT,
+            verify=settings.TEST_VERIFY_SSL,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=settings.TEST_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.TEST_MAX_CONNECTIONS
+            )
+        )
+    return _http_client
+
+async def close_http_client():
+    """
+    공유 HTTP 클라이언트 종료
+    """
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+class CollectionRunner:
+    """
+    Postman Collection 실행기
+
+    컴파일된 Collection 의 item 을 실행하며 공유 httpx.AsyncClient 로 요청을 전송한다.
+    """
+
+    def __init__(
+        self,
+        collection: Any,
+        environment_data: Any = None,
+        test_data: Any = None
+    ):
+        # 컴파일된 Collection 이 아니면 (JSON 데이터) 여기서 컴파일
+        self.collection: CompiledCollection = (
+            collection if isinstance(collection, CompiledCollection) else compile_collection(collection)
+        )
+        self.environment = load_json(environment_data) if environment_data else {}
+        self.iterations = load_json(test_data) if test_data else []
+        if isinstance(self.iterations, dict):
+            self.iterations = [self.iterations]
+        self.callbacks: Dict[str, List[Callable[..., Awaitable[None]]]] = {}
+
+    def on(self, event: str, callback: Callable[..., Awaitable[None]]):
+        """
+        실행 이벤트 콜백 등록
+
+        :param event: 이벤트 이름 (run_start, test_start, test_end, iteration_end)
+        :param callback: 비동기 콜백 함수
+        """
+        self.callbacks.setdefault(event, []).append(callback)
+
+    async def _emit(self, event: str, *args: Any):
+        for callback in self.callbacks.get(event, []):
+            await callback(*args)
+
+    async def run(
+        self,
+        concurrency: int = 1,
+        iteration_concurrency: int = 1,
+        shards: int = 0
+    ) -> Dict[str, Any]:
+        """
+        Collection 실행
+
+        :param concurrency: 반복 회차마다 동시에 실행할 최대 요청 수 (shard 모드에서는 shard 당)
+        :param iteration_concurrency: 동시에 실행할 최대 반복 회차 수 (전체 동시 요청 수는 concurrency * iteration_concurrency)
+        :param shards: 동시에 실행할 최대 shard 수 (0 이면 단일 프로세스 실행)
+        :return: 실행 요약 (total, passed, failed, skipped, failures)
+        """
+        summary = {"total": 0, "passed": 0, "failed": 0, "skipped": 0, "failures": []}
+        items = self.collection.items
+        graph = DependencyGraph(items)
+        summary["waves"] = graph.critical_path_length
+        shard_limiter = asyncio.Semaphore(shards) if shards > 0 else None
+        iterations = self.iterations or [{}]
+        summary["iterations"] = len(iterations)
+        # 실행할 전체 요청 수 알림
+        await self._emit("run_start", len(items) * len(iterations))
+
+        async def run_iteration(iteration: int, data: Dict[str, Any]):
+            iteration_summary = {
+                "iteration": iteration, "total": 0, "passed": 0, "failed": 0, "skipped": 0, "failures": []
+            }
+
+            # 반복 회차마다 별도의 요청 제한 (공유하면 concurrency=1 에서 회차들이 직렬화됨)
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+
+            def record(item: CompiledItem, result: Dict[str, Any]):
+                self._update_summary(summary, item, result)
+                self._update_summary(iteration_summary, item, result)
+
+            async def run_limited(item: CompiledItem, variables: VariableScope, iteration: int):
+                async with semaphore:
+                    result = await self.run_item(item, variables, iteration)
+                record(item, result)
+
+            # 반복 회차마다 독립된 변수 저장소 사용
+            variables = self.base_variables()
+            variables.load("data", data or {})
+            if shard_limiter:
+                await self._run_sharded(items, graph, variables, iteration, shard_limiter, shards, concurrency, record)
+            elif concurrency <= 1:
+                for item in items:
+                    await run_limited(item, variables, iteration)
+            else:
+                await self._run_graph(items, graph, variables, iteration, run_limited)
+
+            await self._emit("iteration_end", iteration_summary)
+
+        # 고정 크기 워커 풀이 반복 회차를 순서대로 가져감
+        pending = iter(enumerate(iterations))
+
+        async def worker():
+            for iteration, data in pending:
+                await run_iteration(iteration, data)
+
+        workers = min(max(1, iteration_concurrency), len(iterations))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+        return summary
+
+    async def _run_graph(
+        self,
+        items: Sequence[CompiledItem],
+        graph: DependencyGraph,
+        variables: VariableScope,
+        iteration: int,
+        run_limited: Callable[..., Awaitable[None]]
+    ):
+        """
+        의존성 그래프 순서대로 item 병렬 실행
+
+        각 item 은 자신이 의존하는 item 이 끝나는 즉시 시작되므로
+        전체 실행 시간은 가장 긴 의존성 체인(critical path)에 의해 결정된다.
+        """
+        done = [asyncio.Event() for _ in items]
+
+        async def run_after_dependencies(index: int):
+            try:
+                for dependency in graph.dependencies[index]:
+                    await done[dependency].wait()
+                await run_limited(items[index], variables, iteration)
+            finally:
+                done[index].set()
+
+        # 위상 단계 순서로 태스크 생성
+        await asyncio.gather(*(
+            run_after_dependencies(index) for wave in graph.waves for index in wave
+        ))
+
+    async def _run_sharded(
+        self,
+        items: Sequence[CompiledItem],
+        graph: DependencyGraph,
+        variables: VariableScope,
+        iteration: int,
+        shard_limiter: asyncio.Semaphore,
+        shards: int,
+        concurrency: int,
+        record: Callable[[CompiledItem, Dict[str, Any]], None]
+    ):
+        """
+        위상 단계별로 item 을 나누어 프로세스 풀에서 실행
+
+        같은 단계의 item 끼리는 의존성이 없으므로 여러 프로세스에 나누어 실행하고,
+        shard 에서 변경된 변수는 다음 단계 시작 전에 병합한다.
+        결과 기록과 이벤트 전송은 부모 프로세스에서 shard 가 끝나는 대로 수행한다.
+        """
+        loop = asyncio.get_running_loop()
+        pool = get_shard_pool()
+
+        async def run_chunk(chunk: List[int], snapshot: VariableScope) -> Dict[str, Dict[str, Any]]:
+            async with shard_limiter:
+                for index in chunk:
+                    await self._emit("test_start", items[index], iteration)
+                shard = await loop.run_in_executor(pool, run_shard, {
+                    "items": [(index, items[index]) for index in chunk],
+                    "variables": snapshot,
+                    "iteration": iteration,
+                    "concurrency": concurrency
+                })
+            for index, result in shard["results"]:
+                await self._emit("test_end", items[index], result)
+                record(items[index], result)
+            return shard["variables"]
+
+        for wave in graph.waves:
+            snapshot = variables.copy()
+            size = max(1, min(settings.TEST_SHARD_CHUNK_SIZE, -(-len(wave) // shards)))
+            chunks = [wave[i:i + size] for i in range(0, len(wave), size)]
+            for changed in await asyncio.gather(*(run_chunk(chunk, snapshot) for chunk in chunks)):
+                for scope, values in changed.items():
+                    variables.load(scope, values)
+
+    def base_variables(self) -> VariableScope:
+        """
+        Collection / Environment 변수로 초기 변수 저장소 생성
+        """
+        variables = VariableScope()
+        variables.load("collection", dict(self.collection.variables))
+        for var in self.environment.get("values", []) or []:
+            if var.get("enabled", True):
+                variables.set(var.get("key"), var.get("value"), "environment")
+        return variables
+
+    async def run_item(self, item: CompiledItem, variables: VariableScope, iteration: int = 0) -> Dict[str, Any]:
+        """
+        단일 요청 item 실행
+
+        :param item: 컴파일된 item
+        :param variables: 변수 저장소 (스크립트에 의해 갱신됨)
+        :param iteration: 반복 회차
+        :return: 실행 결과
+        """
+        await self._emit("test_start", item, iteration)
+        started_at = time.time() * 1000
+
+        request: Optional[Dict[str, Any]] = None
+        response_info: Optional[Dict[str, Any]] = None
+        error: Optional[str] = None
+        try:
+            script_evaluator.run_prerequest(item.prerequest, variables)
+            request = self.build_request(item.request, variables)
+            response = await get_http_client().request(
+                request["method"],
+                request["url"],
+                headers=request["headers"],
+                content=request["content"],
+                data=request["data"]
+            )
+            response_info = {
+                "code": response.status_code,
+                "headers": list(response.headers.items()),
+                "body": response.text,
+                "response_time": int(response.elapsed.total_seconds() * 1000)
+            }
+        except Exception as e:
+            # 잘못된 URL/헤더 등 item 하나의 오류는 실패 결과로 기록하고 나머지 item 은 계속 실행
+            # (httpx.InvalidURL 등은 httpx.HTTPError 하위 클래스가 아님)
+            error = f"{type(e).__name__}: {str(e)}"
+
+        if request is None:
+            # 요청을 만들지 못한 경우 치환 전 정의로 기록
+            request = {
+                "method": item.request.method.source,
+                "url": item.request.url.source,
+                "headers": {},
+                "raw_body": ""
+            }
+
+        assertions = script_evaluator.run_tests(item.test, response_info, variables)
+        ended_at = time.time() * 1000
+
+        if error:
+            status, message = "failed", error
+        elif any(a["status"] == "failed" for a in assertions):
+            status = "failed"
+            message = "; ".join(f"{a['name']}: {a['message']}" for a in assertions if a["status"] == "failed")
+        elif assertions and all(a["status"] == "skipped" for a in assertions):
+            status, message = "skipped", "No supported assertions"
+        else:
+            status, message = "passed", ""
+
+        result = {
+            "iteration": iteration,
+            "request": {
+                "url": {"raw": request["url"]},
+                "method": request["method"],
+                "header": [{"key": k, "value": v} for k, v in request["headers"].items()],
+                "body": {"raw": request["raw_body"]}
+            },
+            "response": {
+                "code": response_info["code"] if response_info else None,
+                "header": [{"key": k, "value": v} for k, v in response_info["headers"]] if response_info else [],
+                "body": response_info["body"] if response_info else ""
+            },
+            "test": {
+                "status": status,
+                "message": message,
+                "script": item.test,
+                "result": json.dumps(assertions, ensure_ascii=False)
+            },
+            "startedAt": started_at,
+            "endedAt": ended_at
+        }
+
+        await self._emit("test_end", item, result)
+        return result
+
+    def build_request(self, request: CompiledRequest, variables: VariableScope) -> Dict[str, Any]:
+        """
+        컴파일된 request 를 변수 치환된 HTTP 요청으로 변환
+        """
+        method = request.method.render(variables).upper()
+        url = request.url.render(variables)
+
+        headers: Dict[str, str] = {}
+        for key, value in request.headers:
+            headers[key.render(variables)] = value.render(variables)
+        self._apply_auth(request, headers, variables)
+
+        content: Optional[str] = None
+        data: Optional[Dict[str, Any]] = None
+        raw_body = ""
+        if request.body_mode == "raw":
+            content = raw_body = request.body.render(variables)
+        elif request.body_mode in ("urlencoded", "formdata"):
+            data = {key.render(variables): value.render(variables) for key, value in request.fields}
+            raw_body = json.dumps(data, ensure_ascii=False)
+        elif request.body_mode == "graphql":
+            content = raw_body = request.body.render(variables)
+            headers.setdefault("Content-Type", "application/json")
+
+        return {
+            "method": method,
+            "url": url,
+            "headers": headers,
+            "content": content,
+            "data": data,
+            "raw_body": raw_body
+        }
+
+    def _apply_auth(self, request: CompiledRequest, headers: Dict[str, str], variables: VariableScope):
+        """
+        bearer / basic / apikey 인증 헤더 설정
+        """
+        auth_type = request.auth_type
+        if not auth_type:
+            return
+        params = {key: value.render(variables) for key, value in request.auth_params}
+        if auth_type == "bearer" and params.get("token"):
+            headers.setdefault("Authorization", f"Bearer {params['token']}")
+        elif auth_type == "basic":
+            credentials = f"{params.get('username', '')}:{params.get('password', '')}"
+            headers.setdefault("Authorization", "Basic " + base64.b64encode(credentials.encode()).decode())
+        elif auth_type == "apikey" and params.get("in", "header") == "header" and params.get("key"):
+            headers.setdefault(params["key"], params.get("value", ""))
+
+    def _update_summary(self, summary: Dict[str, Any], item: CompiledItem, result: Dict[str, Any]):
+        """
+        실행 요약 갱신
+        """
+        status = result["test"]["status"]
+        summary["total"] += 1
+        summary[status] += 1
+        if status == "failed":
+            summary["failures"].append({
+                "item_name": item.name,
+                "iteration": result["iteration"],
+                "message": result["test"]["message"]
+            })
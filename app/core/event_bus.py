@@ -0,0 +1,217 @@
+from typing import Dict, Any, Callable, Awaitable, Deque, Hashable, Iterable, List, Optional, Set, Tuple
+from collections import OrderedDict, deque
+import logging
+import time
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 구독 가능한 토픽 종류 (토픽 이름은 "<종류>:<ID>" 형식)
+TOPIC_KINDS = ("test_run", "collection", "user")
+# 모든 이벤트를 받는 토픽
+ALL_TOPICS = "*"
+# 현재 시각(초) 아래에 두는 seq 비트 수 (2^53 미만이라 JavaScript 정수로 비교 가능)
+SEQ_EPOCH_SHIFT = 21
+
+def make_topic(kind: str, value: Any) -> str:
+    """
+    토픽 이름 생성
+
+    :param kind: 토픽 종류 (test_run, collection, user)
+    :param value: ID
+    :return: 토픽 이름
+    """
+    return f"{kind}:{value}"
+
+def parse_topic(topic: str) -> str:
+    """
+    토픽 이름 검증
+
+    :param topic: 토픽 이름
+    :return: 검증된 토픽 이름
+    """
+    if topic == ALL_TOPICS:
+        return topic
+    kind, _, value = str(topic).partition(":")
+    if kind not in TOPIC_KINDS or not value:
+        raise ValueError(f"Invalid topic: {topic}")
+    return topic
+
+class EventBus:
+    """
+    토픽 기반 이벤트 전달
+
+    구독자는 토픽(test_run:<id>, collection:<id>, user:<id>, *)을 구독하고,
+    발행된 이벤트는 해당 토픽을 구독한 구독자에게만 전달된다.
+    
+    스트림(테스트 실행)을 지정해 발행한 이벤트에는 스트림별로 증가하는 seq 가 붙고,
+    최근 MCP_REPLAY_BUFFER_SIZE 개가 보관되어 재연결한 구독자가 놓친 이벤트만 다시 받을 수 있다.
+    seq 는 발행 시각(초 << SEQ_EPOCH_SHIFT)보다 작아지지 않으므로 서버 재시작 후 다시 실행된 스트림의 seq 도 이전보다 크다.
+    버퍼가 MCP_REPLAY_MAX_RUNS 개를 넘으면 종료된 스트림부터 정리하며,
+    진행 중인 스트림은 버퍼를 비워도 seq 를 유지한다.
+    """
+
+    def __init__(self):
+        # 토픽 -> 구독자 키
+        self.subscriptions: Dict[str, Set[Hashable]] = {}
+        # 구독자 키 -> 구독 토픽
+        self.subscriber_topics: Dict[Hashable, Set[str]] = {}
+        # 구독자 키 -> 전송 함수
+        self.senders: Dict[Hashable, Callable[[Dict[str, Any]], Awaitable[None]]] = {}
+        # 스트림 -> 마지막 seq (종료된 스트림만 재전송 버퍼와 함께 정리)
+        self.sequences: Dict[Hashable, int] = {}
+        # 종료 이벤트가 발행된 스트림
+        self.finished: Set[Hashable] = set()
+        # 스트림 -> 재전송 버퍼에서 밀려난 마지막 seq
+        self.dropped: Dict[Hashable, int] = {}
+        # 스트림 -> 최근 이벤트 (오래된 스트림부터 정리)
+        self.replay_buffers: "OrderedDict[Hashable, Deque[Dict[str, Any]]]" = OrderedDict()
+
+    def subscribe(
+        self,
+        subscriber: Hashable,
+        topics: Iterable[str],
+        sender: Callable[[Dict[str, Any]], Awaitable[None]]
+    ) -> List[str]:
+        """
+        토픽 구독
+
+        :param subscriber: 구독자 키 (예: WebSocket 연결)
+        :param topics: 구독할 토픽 목록
+        :param sender: 이벤트 전송 함수
+        :return: 구독 중인 토픽 목록
+        """
+        topics = [parse_topic(topic) for topic in topics]
+        self.senders[subscriber] = sender
+        subscribed = self.subscriber_topics.setdefault(subscriber, set())
+        for topic in topics:
+            self.subscriptions.setdefault(topic, set()).add(subscriber)
+            subscribed.add(topic)
+        return sorted(subscribed)
+
+    def unsubscribe(self, subscriber: Hashable, topics: Iterable[str] = None) -> List[str]:
+        """
+        토픽 구독 해제
+
+        :param subscriber: 구독자 키
+        :param topics: 해제할 토픽 목록 (None 이면 전체 해제)
+        :return: 남은 구독 토픽 목록
+        """
+        subscribed = self.subscriber_topics.get(subscriber, set())
+        for topic in list(subscribed if topics is None else topics):
+            subscribers = self.subscriptions.get(topic)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self.subscriptions[topic]
+            subscribed.discard(topic)
+
+        if not subscribed:
+            self.subscriber_topics.pop(subscriber, None)
+            self.senders.pop(subscriber, None)
+        return sorted(subscribed)
+
+    async def publish(
+        self,
+        topics: Iterable[str],
+        message: Dict[str, Any],
+        stream: Optional[Hashable] = None,
+        final: bool = False
+    ):
+        """
+        이벤트 발행
+
+        :param topics: 이벤트가 속한 토픽 목록
+        :param message: 전송할 메세지
+        :param stream: 재전송 스트림 키 (예: 테스트 실행 ID, 지정 시 seq 부여 및 버퍼 보관)
+        :param final: 스트림의 마지막 이벤트 여부 (이후 버퍼 정리 시 seq 도 함께 정리)
+        """
+        if stream is not None:
+            self._record(stream, message, final)
+
+        # 여러 토픽을 구독한 구독자에게는 한 번만 전달
+        targets: Set[Hashable] = set(self.subscriptions.get(ALL_TOPICS, ()))
+        for topic in topics:
+            targets.update(self.subscriptions.get(topic, ()))
+
+        for subscriber in targets:
+            sender = self.senders.get(subscriber)
+            if sender is None:
+                continue
+            try:
+                await sender(message)
+            except Exception as e:
+                logger.error(f"Error delivering event: {str(e)}")
+
+    def _record(self, stream: Hashable, message: Dict[str, Any], final: bool = False):
+        """
+        이벤트에 seq 를 부여하고 재전송 버퍼에 보관
+        """
+        # 이전 seq 와 현재 시각 중 큰 값에서 증가 (스트림이 초당 2^SEQ_EPOCH_SHIFT 개 미만을 발행하는 한 재시작 후에도 단조 증가)
+        seq = max(self.sequences.get(stream, 0) + 1, int(time.time()) << SEQ_EPOCH_SHIFT)
+        self.sequences[stream] = seq
+        message.setdefault("content", {})["seq"] = seq
+        if final:
+            self.finished.add(stream)
+
+        buffer = self.replay_buffers.get(stream)
+        if buffer is None:
+            buffer = self.replay_buffers[stream] = deque(maxlen=settings.MCP_REPLAY_BUFFER_SIZE)
+            while len(self.replay_buffers) > settings.MCP_REPLAY_MAX_RUNS:
+                self._evict()
+        else:
+            self.replay_buffers.move_to_end(stream)
+        if buffer.maxlen and len(buffer) == buffer.maxlen:
+            self.dropped[stream] = buffer[0]["content"]["seq"]
+        buffer.append(message)
+
+    def _evict(self):
+        """
+        재전송 버퍼 하나 정리
+
+        가장 오래 이벤트가 없던 종료된 스트림의 버퍼와 seq 를 정리하고,
+        종료된 스트림이 없으면 가장 오래된 진행 중 스트림의 버퍼만 비운다 (seq 는 유지).
+        """
+        evicted = next((stream for stream in self.replay_buffers if stream in self.finished), None)
+        if evicted is not None:
+            del self.replay_buffers[evicted]
+            self.finished.discard(evicted)
+            self.sequences.pop(evicted, None)
+            self.dropped.pop(evicted, None)
+            return
+
+        evicted, _ = self.replay_buffers.popitem(last=False)
+        # 비운 버퍼의 이벤트는 재전송할 수 없음
+        self.dropped[evicted] = self.sequences[evicted]
+
+    def replay(self, stream: Hashable, last_seq: int) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        last_seq 이후에 발행된 이벤트 조회
+
+        :param stream: 재전송 스트림 키
+        :param last_seq: 클라이언트가 마지막으로 받은 seq
+        :return: (놓친 이벤트 목록, 버퍼에서 밀려나 빠진 이벤트가 있는지 여부)
+        """
+        buffer = self.replay_buffers.get(stream)
+        if not buffer:
+            if stream in self.sequences:
+                # 진행 중이지만 버퍼가 비워진 스트림
+                return [], last_seq < self.sequences[stream]
+            # 버퍼가 정리되었거나 이전 프로세스의 스트림이면 last_seq 이후 이벤트를 재전송할 수 없음
+            return [], last_seq > 0
+        events = [message for message in buffer if message["content"]["seq"] > last_seq]
+        truncated = last_seq < self.dropped.get(stream, 0)
+        return events, truncated
+
+    def last_seq(self, stream: Hashable) -> int:
+        """
+        스트림의 마지막 seq 조회
+
+        :param stream: 재전송 스트림 키
+        :return: 마지막 seq (발행된 이벤트가 없으면 0)
+        """
+        return self.sequences.get(stream, 0)
+
+# 싱글톤 인스턴스
+event_bus = EventBus()
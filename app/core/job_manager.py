@@ -0,0 +1,142 @@
+from typing import Dict, Any, Callable, Awaitable, Optional
+import asyncio
+import logging
+import time
+import uuid
+
+from app.config import settings
+from app.core.mcp_protocol import mcp_protocol
+
+logger = logging.getLogger(__name__)
+
+class MCPJob:
+    """
+    HTTP 로 요청된 MCP 작업
+    """
+    def __init__(self, action: str, request_id: str):
+        self.job_id = uuid.uuid4().hex
+        self.action = action
+        self.request_id = request_id
+        # queued, running, succeeded, failed, cancelled
+        self.status = "queued"
+        # 완료 시 MCP 응답 또는 오류 메세지
+        self.response: Optional[Dict[str, Any]] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.done = asyncio.Event()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        작업 상태 조회용 사전 변환
+        """
+        return {
+            "job_id": self.job_id,
+            "action": self.action,
+            "request_id": self.request_id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "response": self.response
+        }
+
+class JobManager:
+    """
+    HTTP MCP 작업 실행/추적
+
+    작업은 별도 태스크로 실행되며 MCP_HTTP_MAX_JOBS 개까지 동시에 실행된다.
+    완료된 작업은 MCP_JOB_TTL_SECONDS 동안 보관된 뒤 정리된다.
+    """
+
+    def __init__(self):
+        self.jobs: Dict[str, MCPJob] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def submit(self, action: str, request_id: str, run: Callable[[], Awaitable[Dict[str, Any]]]) -> MCPJob:
+        """
+        작업 등록 및 실행 시작
+
+        :param action: 작업 이름
+        :param request_id: 요청 ID
+        :param run: 작업 결과를 반환하는 비동기 함수
+        :return: 등록된 작업
+        """
+        self._prune()
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(settings.MCP_HTTP_MAX_JOBS)
+
+        job = MCPJob(action, request_id)
+        self.jobs[job.job_id] = job
+        task = asyncio.create_task(self._run(job, run))
+        self._tasks[job.job_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.job_id, None))
+        return job
+
+    def get(self, job_id: str) -> Optional[MCPJob]:
+        """
+        작업 조회
+
+        :param job_id: 작업 ID
+        :return: 작업 (없으면 None)
+        """
+        return self.jobs.get(job_id)
+
+    async def wait(self, job: MCPJob, timeout: float) -> bool:
+        """
+        작업 완료 대기 (long-poll)
+
+        :param job: 작업
+        :param timeout: 최대 대기 시간(초)
+        :return: 완료 여부
+        """
+        if timeout > 0 and not job.done.is_set():
+            try:
+                await asyncio.wait_for(job.done.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+        return job.done.is_set()
+
+    async def stop(self):
+        """
+        실행 중인 작업 취소
+        """
+        for task in list(self._tasks.values()):
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def _run(self, job: MCPJob, run: Callable[[], Awaitable[Dict[str, Any]]]):
+        """
+        작업 실행
+        """
+        try:
+            async with self._semaphore:
+                job.status = "running"
+                try:
+                    result = await run()
+                    job.response = mcp_protocol.create_response(job.request_id, "success", result)
+                    job.status = "succeeded"
+                except Exception as e:
+                    logger.error(f"Error handling HTTP job {job.job_id}: {str(e)}")
+                    job.response = mcp_protocol.create_error(
+                        "handler_error",
+                        f"Error handling action '{job.action}': {str(e)}",
+                        {"request_id": job.request_id, "traceback": str(e)}
+                    )
+                    job.status = "failed"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+            raise
+        finally:
+            job.finished_at = time.time()
+            job.done.set()
+
+    def _prune(self):
+        """
+        보관 기간이 지난 완료 작업 정리
+        """
+        expires = time.time() - settings.MCP_JOB_TTL_SECONDS
+        for job_id in [job_id for job_id, job in self.jobs.items() if job.finished_at and job.finished_at < expires]:
+            del self.jobs[job_id]
+
+# 싱글톤 인스턴스
+job_manager = JobManager()
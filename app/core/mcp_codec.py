@@ -0,0 +1,168 @@
+from typing import Dict, Any, List, Optional, Union
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import date, time
+import json
+
+from app.config import settings
+
+# 선택 의존성 (pip install "mcp-server[fast]")
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# WebSocket 서브프로토콜 이름 접두사 (예: mcp.json, mcp.msgpack)
+SUBPROTOCOL_PREFIX = "mcp."
+
+def _default(value: Any) -> str:
+    """
+    기본 직렬화가 안 되는 값 변환 (날짜/시각은 orjson 과 같은 ISO 8601 형식)
+
+    :param value: 직렬화할 값
+    :return: 문자열
+    """
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return str(value)
+
+class MCPCodec(ABC):
+    """
+    MCP 메세지 인코더/디코더
+
+    같은 메세지 객체를 여러 연결로 보낼 때 다시 직렬화하지 않도록
+    cache=True 로 인코딩한 최근 결과를 메세지 객체 기준으로 보관한다.
+    한 번만 보내는 응답은 캐시하지 않는다.
+    """
+    name = ""
+    # True 면 바이너리 프레임, False 면 텍스트 프레임으로 전송
+    binary = False
+
+    def __init__(self):
+        # id(message) -> (message, 인코딩 결과)
+        self._cache: "OrderedDict[int, tuple]" = OrderedDict()
+
+    def encode(self, message: Dict[str, Any], cache: bool = False) -> Union[str, bytes]:
+        """
+        메세지 인코딩
+
+        :param message: MCP 메세지
+        :param cache: 여러 연결로 보내는 메세지이면 True (같은 메세지 객체는 캐시된 결과 사용)
+        :return: 프레임 데이터
+        """
+        if not cache:
+            return self._encode(message)
+
+        key = id(message)
+        cached = self._cache.get(key)
+        # 캐시가 메세지를 참조하고 있으므로 id 가 다른 객체에 재사용되지 않음
+        if cached is not None and cached[0] is message:
+            self._cache.move_to_end(key)
+            return cached[1]
+
+        data = self._encode(message)
+        self._cache[key] = (message, data)
+        if len(self._cache) > settings.MCP_ENCODE_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return data
+
+    @abstractmethod
+    def decode(self, data: Union[str, bytes]) -> Dict[str, Any]:
+        """
+        프레임 데이터 디코딩
+
+        :param data: 프레임 데이터
+        :return: MCP 메세지
+        """
+
+    @abstractmethod
+    def _encode(self, message: Dict[str, Any]) -> Union[str, bytes]:
+        """
+        메세지 직렬화 (캐시 없이)
+
+        :param message: MCP 메세지
+        :return: 프레임 데이터
+        """
+
+class JSONCodec(MCPCodec):
+    """
+    JSON 텍스트 프레임 (orjson 이 설치되어 있으면 orjson 사용)
+    """
+    name = "json"
+    binary = False
+
+    def _encode(self, message: Dict[str, Any]) -> str:
+        if orjson is not None:
+            return orjson.dumps(message, default=_default, option=orjson.OPT_NON_STR_KEYS).decode()
+        return json.dumps(message, default=_default, ensure_ascii=False, separators=(",", ":"))
+
+    def decode(self, data: Union[str, bytes]) -> Dict[str, Any]:
+        # orjson.JSONDecodeError 는 json.JSONDecodeError(ValueError) 의 하위 클래스
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+
+class MsgPackCodec(MCPCodec):
+    """
+    MessagePack 바이너리 프레임
+    """
+    name = "msgpack"
+    binary = True
+
+    def _encode(self, message: Dict[str, Any]) -> bytes:
+        return msgpack.packb(message, default=_default, use_bin_type=True)
+
+    def decode(self, data: Union[str, bytes]) -> Dict[str, Any]:
+        if isinstance(data, str):
+            data = data.encode()
+        try:
+            return msgpack.unpackb(data, raw=False)
+        except Exception as e:
+            raise ValueError(f"Invalid MessagePack format: {str(e)}")
+
+# 사용 가능한 코덱
+codecs: Dict[str, MCPCodec] = {"json": JSONCodec()}
+if msgpack is not None:
+    codecs["msgpack"] = MsgPackCodec()
+
+# orjson 은 JSON 코덱의 구현이므로 같은 코덱으로 취급
+CODEC_ALIASES = {"orjson": "json"}
+
+def get_codec(name: Optional[str] = None) -> MCPCodec:
+    """
+    이름으로 코덱 조회
+
+    :param name: 코덱 이름 (None 이면 MCP_DEFAULT_ENCODING)
+    :return: 코덱
+    """
+    name = name or settings.MCP_DEFAULT_ENCODING
+    name = CODEC_ALIASES.get(name, name)
+    if name not in codecs:
+        raise ValueError(f"Unsupported encoding: {name}")
+    return codecs[name]
+
+def negotiate_codec(encoding: Optional[str], subprotocols: List[str]) -> tuple:
+    """
+    연결 시 인코딩 협상
+
+    쿼리 파라미터 encoding 을 우선하고, 없으면 클라이언트가 제시한 서브프로토콜(mcp.<인코딩>) 중
+    지원하는 첫 번째를 사용한다.
+
+    :param encoding: 쿼리 파라미터로 요청한 인코딩
+    :param subprotocols: 클라이언트가 제시한 WebSocket 서브프로토콜 목록
+    :return: (코덱, 수락할 서브프로토콜 또는 None)
+    """
+    if encoding:
+        return get_codec(encoding), None
+    for subprotocol in subprotocols:
+        if not subprotocol.startswith(SUBPROTOCOL_PREFIX):
+            continue
+        name = subprotocol[len(SUBPROTOCOL_PREFIX):]
+        if CODEC_ALIASES.get(name, name) in codecs:
+            return get_codec(name), subprotocol
+    return get_codec(), None
@@ -1,16 +1,223 @@
-from typing import Dict, Any, Callable, Awaitable, List, Optional, Type
+from typing import Dict, Any, Callable, Awaitable, Deque, List, Optional, Set, Tuple, Type, Union
+from collections import deque
 import json
+import asyncio
 import logging
 from fastapi import WebSocket, WebSocketDisconnect
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.core.mcp_protocol import mcp_protocol
+from app.core.mcp_codec import MCPCodec, get_codec, negotiate_codec
+from app.core.event_bus import event_bus, make_topic, TOPIC_KINDS
 from app.core.postman_handler import postman_handler
 from app.core.test_handler import test_handler
+from app.core.test_scheduler import test_scheduler
 from app.api import deps
 
 logger = logging.getLogger(__name__)
 
+class MCPConnection:
+    """
+    WebSocket 연결별 전송 대기열
+    
+    메세지는 크기가 제한된 대기열에 쌓이고 연결별 전송 태스크가 순서대로 보낸다.
+    대기열이 가득 찬 상태에서 이벤트가 들어오면 MCP_SLOW_CONSUMER_POLICY 에 따라 처리한다.
+      - drop_oldest: 대기 중인 가장 오래된 이벤트를 버림
+      - coalesce: 같은 테스트 실행의 같은 종류 이벤트가 대기 중이면 최신 이벤트로 교체 (없으면 drop_oldest)
+      - disconnect: 연결 종료
+    응답/오류 메세지는 버리지 않는다.
+    
+    batch_window_ms 가 설정되면 test_item_completed 이벤트를 실행별로 모아
+    주기마다 하나의 test_items_completed 이벤트로 보낸다.
+    """
+    def __init__(self, websocket: WebSocket, max_size: int, policy: str, codec: MCPCodec):
+        self.websocket = websocket
+        # 연결 시 협상한 인코딩
+        self.codec = codec
+        self.max_size = max_size
+        self.policy = policy
+        # (메세지, 여러 연결이 공유하는 메세지인지 여부)
+        self.queue: Deque[Tuple[Any, bool]] = deque()
+        self.closed = False
+        # 대기열 초과로 연결을 종료하는 경우
+        self.overflowed = False
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        
+        # 이벤트 묶음 전송 (0 이면 사용 안 함)
+        self.batch_window_ms = 0
+        # 테스트 실행 ID -> 모인 항목 완료 데이터
+        self._batches: Dict[Any, List[Dict[str, Any]]] = {}
+        # 테스트 실행 ID -> 묶음에 포함된 마지막 이벤트 seq
+        self._batch_seqs: Dict[Any, int] = {}
+        self._batch_handle: Optional[asyncio.TimerHandle] = None
+        
+        # 지표
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+    
+    def start(self):
+        """
+        전송 태스크 시작
+        """
+        self._task = asyncio.create_task(self._run())
+    
+    def close(self):
+        """
+        전송 태스크 종료
+        """
+        self.closed = True
+        if self._batch_handle:
+            self._batch_handle.cancel()
+            self._batch_handle = None
+        if self._task and not self._task.done():
+            self._task.cancel()
+    
+    def set_batch_window(self, batch_window_ms: int):
+        """
+        이벤트 묶음 주기 설정
+        
+        :param batch_window_ms: 묶음 주기 (0 이면 항목별 전송)
+        """
+        self.batch_window_ms = batch_window_ms
+        if batch_window_ms <= 0:
+            self.flush_batches()
+    
+    def flush_batches(self):
+        """
+        모인 항목 완료 이벤트 전송
+        """
+        if self._batch_handle:
+            self._batch_handle.cancel()
+            self._batch_handle = None
+        batches, self._batches = self._batches, {}
+        for test_run_id, items in batches.items():
+            self._enqueue_batch(test_run_id, items)
+    
+    def _enqueue_batch(self, test_run_id: Any, items: List[Dict[str, Any]]):
+        """
+        항목 완료 묶음 이벤트 등록
+        """
+        event = mcp_protocol.create_event("test_items_completed", {
+            "test_run_id": test_run_id,
+            "items": items
+        })
+        seq = self._batch_seqs.pop(test_run_id, None)
+        if seq is not None:
+            event["content"]["seq"] = seq
+        self.enqueue(event)
+    
+    def enqueue(self, message: Union[Dict[str, Any], List[Dict[str, Any]]], shared: bool = False) -> bool:
+        """
+        메세지 전송 대기열 등록 (대기하지 않음)
+        
+        :param message: 전송할 메세지 (배치 응답이면 메세지 목록)
+        :param shared: 같은 메세지 객체를 여러 연결로 보내는지 여부 (True 면 인코딩 결과 캐시)
+        :return: 대기열 등록 여부
+        """
+        if self.closed:
+            return False
+        
+        is_event = isinstance(message, dict) and message.get("message_type") == "event"
+        
+        if self.batch_window_ms > 0 and is_event:
+            content = message.get("content", {})
+            event_type = content.get("event_type")
+            test_run_id = content.get("data", {}).get("test_run_id")
+            if event_type == "test_item_started":
+                # 묶음 모드에서는 항목 시작 이벤트를 보내지 않음 (완료 묶음과 test_progress 로 대체)
+                return True
+            if event_type == "test_item_completed":
+                self._batches.setdefault(test_run_id, []).append(content.get("data", {}))
+                if "seq" in content:
+                    self._batch_seqs[test_run_id] = content["seq"]
+                if self._batch_handle is None:
+                    self._batch_handle = asyncio.get_running_loop().call_later(
+                        self.batch_window_ms / 1000, self.flush_batches
+                    )
+                return True
+            # 같은 실행의 다른 이벤트보다 모인 항목이 먼저 전달되도록 함
+            if test_run_id in self._batches:
+                self._enqueue_batch(test_run_id, self._batches.pop(test_run_id))
+        
+        if len(self.queue) >= self.max_size and is_event:
+            if self.policy == "disconnect":
+                self.dropped += 1
+                self.closed = True
+                self.overflowed = True
+                self._ready.set()
+                return False
+            if self.policy == "coalesce" and self._coalesce(message, shared):
+                return True
+            self._drop_oldest_event()
+        
+        self.queue.append((message, shared))
+        self.max_depth = max(self.max_depth, len(self.queue))
+        self._ready.set()
+        return True
+    
+    def _coalesce(self, message: Dict[str, Any], shared: bool) -> bool:
+        """
+        대기 중인 같은 종류의 이벤트를 최신 이벤트로 교체
+        """
+        key = self._event_key(message)
+        for index in range(len(self.queue) - 1, -1, -1):
+            if self._event_key(self.queue[index][0]) == key:
+                self.queue[index] = (message, shared)
+                self.coalesced += 1
+                return True
+        return False
+    
+    def _drop_oldest_event(self):
+        """
+        대기 중인 가장 오래된 이벤트 삭제
+        """
+        for index, (queued, _) in enumerate(self.queue):
+            if isinstance(queued, dict) and queued.get("message_type") == "event":
+                del self.queue[index]
+                self.dropped += 1
+                return
+    
+    def _event_key(self, message: Dict[str, Any]) -> Optional[tuple]:
+        """
+        이벤트 병합 기준 (이벤트 타입, 테스트 실행 ID)
+        """
+        if not isinstance(message, dict) or message.get("message_type") != "event":
+            return None
+        content = message.get("content", {})
+        return (content.get("event_type"), content.get("data", {}).get("test_run_id"))
+    
+    async def _run(self):
+        """
+        전송 루프
+        """
+        try:
+            while not self.closed:
+                if not self.queue:
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+                message, shared = self.queue.popleft()
+                data = self.codec.encode(message, cache=shared)
+                if self.codec.binary:
+                    await self.websocket.send_bytes(data)
+                else:
+                    await self.websocket.send_text(data)
+                self.sent += 1
+            
+            if self.overflowed:
+                # 1013: Try Again Later
+                logger.warning(f"Closing slow MCP consumer ({len(self.queue)} queued messages)")
+                await self.websocket.close(code=1013)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.closed = True
+            logger.warning(f"Error sending MCP message: {str(e)}")
+
 class MCPConnectionManager:
     """
     WebSocket 연결 관리
@@ -18,13 +225,31 @@ class MCPConnectionManager:
     def __init__(self):
         # 클라이언트 연결 목록
         self.active_connections: List[WebSocket] = []
+        # 연결별 전송 대기열 (전송은 연결별 태스크가 담당하므로 느린 클라이언트가 다른 연결을 막지 않음)
+        self.connections: Dict[WebSocket, MCPConnection] = {}
+        # 종료된 연결까지 포함한 누적 지표
+        self.total_dropped = 0
+        self.total_coalesced = 0
+        self.slow_consumer_disconnects = 0
     
-    async def connect(self, websocket: WebSocket):
+    async def connect(self, websocket: WebSocket, codec: Optional[MCPCodec] = None, subprotocol: Optional[str] = None):
         """
         새 WebSocket 연결 설정
+        
+        :param websocket: WebSocket 연결
+        :param codec: 협상한 코덱 (None 이면 기본 인코딩)
+        :param subprotocol: 수락할 서브프로토콜
         """
-        await websocket.accept()
+        await websocket.accept(subprotocol=subprotocol)
         self.active_connections.append(websocket)
+        connection = MCPConnection(
+            websocket,
+            settings.MCP_SEND_QUEUE_SIZE,
+            settings.MCP_SLOW_CONSUMER_POLICY,
+            codec or get_codec()
+        )
+        connection.start()
+        self.connections[websocket] = connection
     
     def disconnect(self, websocket: WebSocket):
         """
@@ -32,19 +257,89 @@ class MCPConnectionManager:
         """
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
+        connection = self.connections.pop(websocket, None)
+        if connection:
+            connection.close()
+            self.total_dropped += connection.dropped
+            self.total_coalesced += connection.coalesced
+            if connection.overflowed:
+                self.slow_consumer_disconnects += 1
+        # 구독 해제
+        event_bus.unsubscribe(websocket)
     
-    async def send_message(self, websocket: WebSocket, message: Dict[str, Any]):
+    def get_codec(self, websocket: WebSocket) -> MCPCodec:
         """
-        특정 클라이언트에게 메세지 전송
+        연결에서 협상한 코덱 조회
         """
-        await websocket.send_json(message)
+        connection = self.connections.get(websocket)
+        return connection.codec if connection else get_codec()
+    
+    def set_batch_window(self, websocket: WebSocket, batch_window_ms: int) -> int:
+        """
+        연결의 이벤트 묶음 주기 설정
+        
+        :param websocket: WebSocket 연결
+        :param batch_window_ms: 요청한 묶음 주기 (MCP_MAX_BATCH_WINDOW_MS 로 제한)
+        :return: 적용된 묶음 주기
+        """
+        batch_window_ms = min(max(0, batch_window_ms), settings.MCP_MAX_BATCH_WINDOW_MS)
+        connection = self.connections.get(websocket)
+        if connection:
+            connection.set_batch_window(batch_window_ms)
+        return batch_window_ms
+    
+    async def send_message(
+        self,
+        websocket: WebSocket,
+        message: Union[Dict[str, Any], List[Dict[str, Any]]],
+        shared: bool = False
+    ):
+        """
+        특정 클라이언트에게 메세지 전송 (전송 대기열에 등록)
+        
+        :param shared: 같은 메세지 객체를 여러 연결로 보내는지 여부 (이벤트 발행/재전송)
+        """
+        connection = self.connections.get(websocket)
+        if connection:
+            connection.enqueue(message, shared)
     
     async def broadcast(self, message: Dict[str, Any]):
         """
         모든 클라이언트에게 메세지 브로드캐스트
         """
-        for connection in self.active_connections:
-            await connection.send_json(message)
+        for connection in list(self.connections.values()):
+            connection.enqueue(message, shared=True)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        전송 대기열 지표 조회
+        
+        :return: 연결 수, 대기열 깊이, 버려진/병합된 이벤트 수
+        """
+        connections = list(self.connections.values())
+        return {
+            "connections": len(connections),
+            "policy": settings.MCP_SLOW_CONSUMER_POLICY,
+            "queue_size": settings.MCP_SEND_QUEUE_SIZE,
+            "queue_depth": sum(len(connection.queue) for connection in connections),
+            "max_queue_depth": max((connection.max_depth for connection in connections), default=0),
+            "dropped_events": self.total_dropped + sum(connection.dropped for connection in connections),
+            "coalesced_events": self.total_coalesced + sum(connection.coalesced for connection in connections),
+            "slow_consumer_disconnects": self.slow_consumer_disconnects,
+            "per_connection": [
+                {
+                    "client": f"{connection.websocket.client.host}:{connection.websocket.client.port}"
+                    if connection.websocket.client else None,
+                    "encoding": connection.codec.name,
+                    "queue_depth": len(connection.queue),
+                    "max_queue_depth": connection.max_depth,
+                    "sent": connection.sent,
+                    "dropped": connection.dropped,
+                    "coalesced": connection.coalesced
+                }
+                for connection in connections
+            ]
+        }
 
 class MCPHandler:
     """
@@ -54,24 +349,58 @@ class MCPHandler:
         self.connection_manager = MCPConnectionManager()
         # 작업 핸들러 등록
         self.action_handlers: Dict[str, Callable[[Dict[str, Any], WebSocket], Awaitable[Dict[str, Any]]]] = {}
+        # 배치 안에서 순서대로 실행해야 하는 작업 (연결 상태를 바꾸는 작업)
+        self.serial_actions: Set[str] = set()
         
         # Postman 관련 작업 핸들러 등록
         self.register_handler("upload_collection", self._handle_upload_collection)
         self.register_handler("upload_environment", self._handle_upload_environment)
         self.register_handler("upload_test_data", self._handle_upload_test_data)
         
+        # 연결 확인
+        self.register_handler("ping", self._handle_ping)
+        
         # 테스트 관련 작업 핸들러 등록
         self.register_handler("run_test", self._handle_run_test)
         self.register_handler("get_test_run", self._handle_get_test_run)
+        self.register_handler("get_queue_status", self._handle_get_queue_status)
+        
+        # 이벤트 구독 관련 작업 핸들러 등록
+        self.register_handler("subscribe", self._handle_subscribe, concurrent=False)
+        self.register_handler("unsubscribe", self._handle_unsubscribe, concurrent=False)
     
-    def register_handler(self, action: str, handler: Callable[[Dict[str, Any], WebSocket], Awaitable[Dict[str, Any]]]):
+    def register_handler(
+        self,
+        action: str,
+        handler: Callable[[Dict[str, Any], WebSocket], Awaitable[Dict[str, Any]]],
+        concurrent: bool = True
+    ):
         """
         작업 핸들러 등록
         
         :param action: 작업 이름
         :param handler: 비동기 핸들러 함수
+        :param concurrent: 배치 안에서 다른 요청과 동시에 실행해도 되는지 여부
         """
         self.action_handlers[action] = handler
+        if concurrent:
+            self.serial_actions.discard(action)
+        else:
+            self.serial_actions.add(action)
+    
+    async def dispatch(self, action: str, params: Dict[str, Any], websocket: Optional[WebSocket] = None) -> Dict[str, Any]:
+        """
+        작업 핸들러 실행 (WebSocket/HTTP 공통)
+        
+        :param action: 작업 이름
+        :param params: 요청 파라미터
+        :param websocket: WebSocket 연결 (HTTP 요청이면 None)
+        :return: 처리 결과
+        """
+        handler = self.action_handlers.get(action)
+        if handler is None:
+            raise ValueError(f"Unsupported action: {action}")
+        return await handler(params, websocket)
     
     async def handle_websocket(self, websocket: WebSocket):
         """
@@ -79,12 +408,39 @@ class MCPHandler:
         
         :param websocket: WebSocket 연결
         """
-        await self.connection_manager.connect(websocket)
+        # 인코딩 협상 (쿼리 파라미터 encoding 또는 서브프로토콜 mcp.<인코딩>)
+        try:
+            codec, subprotocol = negotiate_codec(
+                websocket.query_params.get("encoding"),
+                websocket.scope.get("subprotocols", [])
+            )
+        except ValueError as e:
+            logger.warning(f"Rejected WebSocket connection: {str(e)}")
+            await websocket.close(code=1003)
+            return
+        
+        await self.connection_manager.connect(websocket, codec, subprotocol)
+        # 요청마다 별도 태스크로 처리하고, 연결별 동시 처리 수가 한도에 도달하면 수신을 잠시 멈춤
+        inflight = asyncio.Semaphore(settings.MCP_MAX_INFLIGHT_REQUESTS)
+        tasks: Set[asyncio.Task] = set()
+        
+        def _on_done(task: asyncio.Task):
+            tasks.discard(task)
+            inflight.release()
+        
         try:
             while True:
-                # 메세지 수신
-                raw_message = await websocket.receive_text()
-                await self._process_message(raw_message, websocket)
+                # 메세지 수신 (텍스트 또는 바이너리 프레임)
+                received = await websocket.receive()
+                if received["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(received.get("code", 1000))
+                raw_message = received.get("text")
+                if raw_message is None:
+                    raw_message = received.get("bytes")
+                await inflight.acquire()
+                task = asyncio.create_task(self.handle_message(raw_message, websocket))
+                tasks.add(task)
+                task.add_done_callback(_on_done)
         except WebSocketDisconnect:
             self.connection_manager.disconnect(websocket)
         except Exception as e:
@@ -96,8 +452,26 @@ class MCPHandler:
             )
             await self.connection_manager.send_message(websocket, error_message)
             self.connection_manager.disconnect(websocket)
+        finally:
+            # 연결이 끊기면 처리 중인 요청 취소
+            for task in list(tasks):
+                task.cancel()
     
-    async def _process_message(self, raw_message: str, websocket: WebSocket):
+    async def handle_message(self, raw_message: Union[str, bytes], websocket: WebSocket):
+        """
+        수신된 메세지를 처리하는 태스크 본문 (전송 실패 등 예외는 로그만 남김)
+        
+        :param raw_message: 원시 메세지
+        :param websocket: WebSocket 연결
+        """
+        try:
+            await self._process_message(raw_message, websocket)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error processing MCP message: {str(e)}")
+    
+    async def _process_message(self, raw_message: Union[str, bytes], websocket: WebSocket):
         """
         수신된 메세지 처리
         
@@ -106,7 +480,12 @@ class MCPHandler:
         """
         try:
             # 메세지 파싱
-            message = mcp_protocol.parse_message(raw_message)
+            message = mcp_protocol.parse_message(raw_message, self.connection_manager.get_codec(websocket))
+            if isinstance(message, list):
+                # 배치 프레임: 응답 목록을 하나의 프레임으로 전송
+                responses = await self.execute_batch(message, websocket)
+                await self.connection_manager.send_message(websocket, responses)
+                return
             message_type = message.get("message_type")
             content = message.get("content", {})
             
@@ -138,33 +517,100 @@ class MCPHandler:
         :param content: 요청 내용
         :param websocket: WebSocket 연결
         """
+        response = await self.execute_request(content, websocket)
+        await self.connection_manager.send_message(websocket, response)
+    
+    async def execute_request(self, content: Dict[str, Any], websocket: Optional[WebSocket] = None) -> Dict[str, Any]:
+        """
+        요청 실행 후 응답 메세지 생성
+        
+        :param content: 요청 내용
+        :param websocket: WebSocket 연결 (없으면 None)
+        :return: 응답 또는 오류 메세지
+        """
         action = content.get("action")
         params = content.get("params", {})
         request_id = content.get("request_id", "unknown")
         
-        if action in self.action_handlers:
-            try:
-                # 해당 작업에 대한 핸들러 호출
-                result = await self.action_handlers[action](params, websocket)
-                # 성공 응답
-                response = mcp_protocol.create_response(request_id, "success", result)
-                await self.connection_manager.send_message(websocket, response)
-            except Exception as e:
-                # 실패 응답
-                logger.error(f"Error handling request: {str(e)}")
-                error_message = mcp_protocol.create_error(
-                    "handler_error", 
-                    f"Error handling action '{action}': {str(e)}",
-                    {"traceback": str(e)}
-                )
-                await self.connection_manager.send_message(websocket, error_message)
-        else:
+        if action not in self.action_handlers:
             # 지원하지 않는 작업
-            error_message = mcp_protocol.create_error(
+            return mcp_protocol.create_error(
                 "unsupported_action", 
-                f"Unsupported action: {action}"
+                f"Unsupported action: {action}",
+                {"request_id": request_id}
             )
-            await self.connection_manager.send_message(websocket, error_message)
+        
+        try:
+            # 해당 작업에 대한 핸들러 호출
+            result = await self.dispatch(action, params, websocket)
+            # 성공 응답
+            return mcp_protocol.create_response(request_id, "success", result)
+        except Exception as e:
+            # 실패 응답
+            logger.error(f"Error handling request: {str(e)}")
+            return mcp_protocol.create_error(
+                "handler_error", 
+                f"Error handling action '{action}': {str(e)}",
+                {"request_id": request_id, "traceback": str(e)}
+            )
+    
+    async def execute_batch(self, messages: List[Any], websocket: Optional[WebSocket] = None) -> List[Dict[str, Any]]:
+        """
+        배치 요청 실행
+        
+        요청은 동시에 실행하되, 순서가 중요한 작업(serial_actions)은 앞선 요청이 모두 끝난 뒤 단독으로 실행한다.
+        항목별 오류는 해당 항목의 오류 응답으로만 반환된다.
+        
+        :param messages: 요청 메세지 목록
+        :param websocket: WebSocket 연결 (없으면 None)
+        :return: 요청과 같은 순서의 응답 목록
+        """
+        responses: List[Optional[Dict[str, Any]]] = [None] * len(messages)
+        semaphore = asyncio.Semaphore(settings.MCP_MAX_INFLIGHT_REQUESTS)
+        
+        def content_of(message: Any) -> Dict[str, Any]:
+            # 항목이나 content 가 객체가 아니면 빈 내용으로 취급
+            content = message.get("content") if isinstance(message, dict) else None
+            return content if isinstance(content, dict) else {}
+        
+        async def run(index: int, message: Any):
+            if not mcp_protocol.is_valid_message(message) or message.get("message_type") != "request":
+                request_id = content_of(message).get("request_id", "unknown")
+                responses[index] = mcp_protocol.create_error(
+                    "invalid_request",
+                    "Batch items must be MCP request messages",
+                    {"request_id": request_id, "index": index}
+                )
+                return
+            async with semaphore:
+                responses[index] = await self.execute_request(message["content"], websocket)
+        
+        group = []
+        for index, message in enumerate(messages):
+            action = content_of(message).get("action")
+            if action in self.serial_actions:
+                # 앞선 요청이 끝난 뒤 단독 실행
+                await asyncio.gather(*group)
+                group = []
+                await run(index, message)
+            else:
+                group.append(run(index, message))
+        await asyncio.gather(*group)
+        
+        return responses
+    
+    async def _handle_ping(self, params: Dict[str, Any], websocket: WebSocket) -> Dict[str, Any]:
+        """
+        연결 확인 (지연 시간 측정용)
+        
+        :param params: 요청 파라미터 (그대로 반환)
+        :param websocket: WebSocket 연결
+        :return: 처리 결과
+        """
+        return {
+            "status": "success",
+            "pong": params
+        }
     
     async def _handle_upload_collection(self, params: Dict[str, Any], websocket: WebSocket) -> Dict[str, Any]:
         """
@@ -189,7 +635,8 @@ class MCPHandler:
                     collection_data=params["collection_data"],
                     name=params["name"],
                     description=params.get("description"),
-                    user_id=params.get("user_id", 1)  # 기본값 1 (임시)
+                    user_id=params.get("user_id", 1),  # 기본값 1 (임시)
+                    collection_id=params.get("collection_id")  # 지정 시 재업로드
                 )
                 
                 return result
@@ -282,7 +729,11 @@ class MCPHandler:
                     collection_id=params["collection_id"],
                     environment_id=params.get("environment_id"),
                     test_data_id=params.get("test_data_id"),
-                    user_id=params.get("user_id", 1)  # 기본값 1 (임시)
+                    user_id=params.get("user_id", 1),  # 기본값 1 (임시)
+                    concurrency=int(params.get("concurrency", 1)),
+                    iteration_concurrency=int(params.get("iteration_concurrency", 1)),
+                    shards=int(params.get("shards", 0)),
+                    priority=int(params.get("priority", 0))
                 )
                 
                 return result
@@ -311,13 +762,114 @@ class MCPHandler:
                 result = await test_handler.get_test_run(
                     db=db,
                     test_run_id=params["test_run_id"],
-                    user_id=params.get("user_id", 1)  # 기본값 1 (임시)
+                    user_id=params.get("user_id", 1),  # 기본값 1 (임시)
+                    iteration=params.get("iteration")
                 )
                 
                 return result
         except Exception as e:
             logger.error(f"Error handling get_test_run: {str(e)}")
             raise
+    
+    async def _handle_get_queue_status(self, params: Dict[str, Any], websocket: WebSocket) -> Dict[str, Any]:
+        """
+        테스트 실행 대기열 상태 조회 처리
+        
+        :param params: 요청 파라미터
+        :param websocket: WebSocket 연결
+        :return: 처리 결과
+        """
+        try:
+            # 데이터베이스 세션 생성
+            async with deps.get_db() as db:
+                result = await test_scheduler.get_queue_status(
+                    db=db,
+                    user_id=params.get("user_id", 1)  # 기본값 1 (임시)
+                )
+                
+                return result
+        except Exception as e:
+            logger.error(f"Error handling get_queue_status: {str(e)}")
+            raise
+
+    def _get_topics(self, params: Dict[str, Any]) -> List[str]:
+        """
+        구독 요청 파라미터에서 토픽 목록 추출
+        
+        :param params: 요청 파라미터 (topics 또는 test_run_id/collection_id/user_id)
+        :return: 토픽 목록
+        """
+        topics = list(params.get("topics", []))
+        for kind in TOPIC_KINDS:
+            if params.get(f"{kind}_id") is not None:
+                topics.append(make_topic(kind, params[f"{kind}_id"]))
+        return topics
+    
+    async def _handle_subscribe(self, params: Dict[str, Any], websocket: WebSocket) -> Dict[str, Any]:
+        """
+        이벤트 구독 처리
+        
+        :param params: 요청 파라미터
+        :param websocket: WebSocket 연결
+        :return: 처리 결과
+        """
+        try:
+            if websocket is None:
+                raise ValueError("subscribe requires a WebSocket connection")
+            topics = self._get_topics(params)
+            if not topics:
+                raise ValueError("Missing required parameter: topics, test_run_id, collection_id or user_id")
+            
+            # 발행/재전송 이벤트는 모든 구독자가 같은 객체를 받으므로 인코딩 결과 공유
+            async def send(message: Dict[str, Any]):
+                await self.connection_manager.send_message(websocket, message, shared=True)
+            
+            result = {"status": "success"}
+            if "batch_window_ms" in params:
+                # 항목 완료 이벤트 묶음 전송 주기 (0 이면 항목별 전송)
+                result["batch_window_ms"] = self.connection_manager.set_batch_window(
+                    websocket, int(params["batch_window_ms"])
+                )
+            
+            result["topics"] = event_bus.subscribe(websocket, topics, send)
+            
+            if params.get("last_seq") is not None:
+                # 재연결: 마지막으로 받은 seq 이후 놓친 이벤트 재전송
+                if params.get("test_run_id") is None:
+                    raise ValueError("last_seq requires test_run_id")
+                test_run_id = int(params["test_run_id"])
+                events, truncated = event_bus.replay(test_run_id, int(params["last_seq"]))
+                for event in events:
+                    await send(event)
+                result["replayed"] = len(events)
+                # truncated 이면 일부 이벤트가 버퍼에서 밀려났으므로 get_test_run 으로 다시 조회해야 함
+                result["truncated"] = truncated
+                result["last_seq"] = event_bus.last_seq(test_run_id)
+            return result
+        except Exception as e:
+            logger.error(f"Error handling subscribe: {str(e)}")
+            raise
+    
+    async def _handle_unsubscribe(self, params: Dict[str, Any], websocket: WebSocket) -> Dict[str, Any]:
+        """
+        이벤트 구독 해제 처리 (토픽을 지정하지 않으면 전체 해제)
+        
+        :param params: 요청 파라미터
+        :param websocket: WebSocket 연결
+        :return: 처리 결과
+        """
+        try:
+            if websocket is None:
+                raise ValueError("unsubscribe requires a WebSocket connection")
+            topics = self._get_topics(params)
+            remaining = event_bus.unsubscribe(websocket, topics or None)
+            return {
+                "status": "success",
+                "topics": remaining
+            }
+        except Exception as e:
+            logger.error(f"Error handling unsubscribe: {str(e)}")
+            raise
 
 # 싱글톤 인스턴스
 mcp_handler = MCPHandler()
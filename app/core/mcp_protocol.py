@@ -1,6 +1,9 @@
 from typing import Dict, Any, List, Optional, Union
 import json
 
+from app.config import settings
+from app.core.mcp_codec import MCPCodec, get_codec
+
 class MCPProtocol:
     """
     Model Context Protocol (MCP) 구현
@@ -25,22 +28,48 @@ class MCPProtocol:
             "timestamp": self._get_timestamp()
         }
     
-    def parse_message(self, raw_message: str) -> Dict[str, Any]:
+    def parse_message(
+        self,
+        raw_message: Union[str, bytes],
+        codec: Optional[MCPCodec] = None
+    ) -> Union[Dict[str, Any], List[Any]]:
         """
         수신된 MCP 메세지 파싱
         
-        :param raw_message: JSON 문자열 메세지
-        :return: 파싱된 메세지
+        :param raw_message: 메세지 (JSON 문자열 또는 협상된 인코딩의 바이너리)
+        :param codec: 연결에서 협상된 코덱 (None 이면 JSON)
+        :return: 파싱된 메세지 (배치 프레임이면 메세지 목록)
         """
         try:
-            message = json.loads(raw_message)
+            message = (codec or get_codec("json")).decode(raw_message)
+            if isinstance(message, list):
+                # 배치 프레임 (항목별 검증은 실행 시 수행하여 잘못된 항목이 배치 전체를 실패시키지 않도록 함)
+                if not message:
+                    raise ValueError("Empty batch")
+                if len(message) > settings.MCP_MAX_BATCH_REQUESTS:
+                    raise ValueError(f"Batch exceeds {settings.MCP_MAX_BATCH_REQUESTS} requests")
+                return message
             # 기본 검증
-            if "mcp_version" not in message or "message_type" not in message or "content" not in message:
+            if not self.is_valid_message(message):
                 raise ValueError("Invalid MCP message format")
             return message
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON format: {str(e)}")
     
+    def is_valid_message(self, message: Any) -> bool:
+        """
+        MCP 메세지 형식 검증
+        
+        :param message: 파싱된 메세지
+        :return: 필수 필드가 모두 있고 content 가 객체인지 여부
+        """
+        return (
+            isinstance(message, dict)
+            and "mcp_version" in message
+            and "message_type" in message
+            and isinstance(message.get("content"), dict)
+        )
+    
     def create_request(self, action: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         요청 메세지 생성
@@ -0,0 +1,152 @@
+from typing import AsyncIterator, BinaryIO, Optional, Set
+import asyncio
+import logging
+import sys
+
+from app.config import settings
+from app.core.mcp_codec import get_codec
+from app.core.mcp_handler import mcp_handler
+
+logger = logging.getLogger(__name__)
+
+class StdioSocket:
+    """
+    표준 출력을 WebSocket 처럼 다루는 어댑터
+
+    MCPConnectionManager 에 WebSocket 대신 등록되어 전송 대기열, 이벤트 구독/묶음 전송을 그대로 사용한다.
+    메세지는 한 줄에 하나씩 JSON 으로 기록된다 (newline-delimited JSON).
+    출력이 파이프/소켓이면 비동기 StreamWriter 로, 그 외에는 스레드에서 기록해 이벤트 루프를 막지 않는다.
+    """
+    client = None
+
+    def __init__(self, output: BinaryIO):
+        self.output = output
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def open(self):
+        """
+        출력 스트림 연결
+        """
+        loop = asyncio.get_running_loop()
+        if self.output.isatty():
+            # 터미널은 표준 오류와 파일 상태를 공유하므로 non-blocking 으로 바꾸지 않음
+            return
+        try:
+            transport, protocol = await loop.connect_write_pipe(
+                lambda: asyncio.StreamReaderProtocol(asyncio.StreamReader()), self.output
+            )
+        except (ValueError, OSError):
+            # 일반 파일 리다이렉트 등 파이프로 쓸 수 없는 경우 스레드에서 기록
+            return
+        self.writer = asyncio.StreamWriter(transport, protocol, None, loop)
+
+    async def accept(self, subprotocol: Optional[str] = None):
+        pass
+
+    async def send_text(self, data: str):
+        line = data.encode() + b"\n"
+        if self.writer is not None:
+            self.writer.write(line)
+            await self.writer.drain()
+            return
+        await asyncio.get_running_loop().run_in_executor(None, self._write, line)
+
+    def _write(self, line: bytes):
+        self.output.write(line)
+        self.output.flush()
+
+    async def send_bytes(self, data: bytes):
+        raise ValueError("stdio transport supports JSON text only")
+
+    async def close(self, code: int = 1000):
+        pass
+
+    async def aclose(self):
+        """
+        남은 출력을 모두 보낸 뒤 출력 스트림 종료
+        """
+        if self.writer is not None:
+            self.writer.close()
+            await self.writer.wait_closed()
+            self.writer = None
+
+async def _read_lines(stream) -> AsyncIterator[bytes]:
+    """
+    표준 입력에서 한 줄씩 읽기
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=2 ** 26)
+    try:
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), stream)
+    except (ValueError, OSError):
+        # 일반 파일 리다이렉트 등 파이프로 읽을 수 없는 경우 스레드에서 읽음
+        while True:
+            line = await loop.run_in_executor(None, stream.buffer.readline)
+            if not line:
+                return
+            yield line
+
+    while True:
+        line = await reader.readline()
+        if not line:
+            return
+        yield line
+
+async def serve_stdio():
+    """
+    stdio 전송 방식으로 MCP 요청 처리
+
+    표준 입력으로 받은 요청을 MCPHandler 로 처리하고 응답/이벤트를 표준 출력으로 보낸다.
+    표준 출력은 프로토콜 전용이므로 print() 출력은 표준 오류로 돌린다.
+    """
+    # 순환 import 방지 및 HTTP 서버 모듈 로딩 생략
+    from app.db.init_db import init_db, engine
+    import app.models  # noqa: F401 (테이블 등록)
+    from app.core.result_writer import result_writer
+    from app.core.test_scheduler import test_scheduler
+    from app.core.job_manager import job_manager
+    from app.core.collection_runner import close_http_client
+    from app.core.shard_executor import shutdown_shard_pool
+
+    output = sys.stdout.buffer
+    sys.stdout = sys.stderr
+
+    await init_db()
+    await result_writer.start()
+    await test_scheduler.start()
+
+    socket = StdioSocket(output)
+    await socket.open()
+    await mcp_handler.connection_manager.connect(socket, get_codec("json"))
+    inflight = asyncio.Semaphore(settings.MCP_MAX_INFLIGHT_REQUESTS)
+    tasks: Set[asyncio.Task] = set()
+
+    def _on_done(task: asyncio.Task):
+        tasks.discard(task)
+        inflight.release()
+
+    try:
+        async for line in _read_lines(sys.stdin):
+            line = line.strip()
+            if not line:
+                continue
+            # WebSocket 과 같이 요청마다 별도 태스크로 처리
+            await inflight.acquire()
+            task = asyncio.create_task(mcp_handler.handle_message(line, socket))
+            tasks.add(task)
+            task.add_done_callback(_on_done)
+
+        # 입력이 끝나면 처리 중인 요청의 응답까지 보낸 뒤 종료
+        await asyncio.gather(*tasks, return_exceptions=True)
+        connection = mcp_handler.connection_manager.connections.get(socket)
+        while connection and connection.queue:
+            await asyncio.sleep(0.01)
+    finally:
+        mcp_handler.connection_manager.disconnect(socket)
+        await socket.aclose()
+        await test_scheduler.stop()
+        await job_manager.stop()
+        await result_writer.stop()
+        await close_http_client()
+        shutdown_shard_pool()
+        await engine.dispose()
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.postman import PostmanCollection, PostmanEnvironment, PostmanTestData
 from app.core.mcp_protocol import mcp_protocol
+from app.core.collection_ir import collection_cache, compile_collection, load_json
 
 logger = logging.getLogger(__name__)
 
@@ -19,41 +20,67 @@ class PostmanHandler:
     async def process_collection(
         self,
         db: AsyncSession,
-        collection_data: str,
+        collection_data: Any,
         name: str,
         description: Optional[str],
-        user_id: int
+        user_id: int,
+        collection_id: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Postman Collection 처리
         
+        collection_id 를 지정하면 새 Collection 을 만들지 않고 기존 Collection 을 교체하며 버전을 올린다.
+        이전 버전과 내용이 같은 item 은 컴파일 결과를 재사용한다.
+        
         :param db: 데이터베이스 세션
-        :param collection_data: Collection JSON 데이터
+        :param collection_data: Collection JSON 데이터 (문자열 또는 파싱된 객체)
         :param name: Collection 이름
         :param description: Collection 설명
         :param user_id: 사용자 ID
+        :param collection_id: 재업로드할 Collection ID (선택)
         :return: 처리 결과
         """
         try:
-            # JSON 유효성 검사
-            json.loads(collection_data)
+            # JSON 파싱 (문자열이 아닌 파싱된 객체로 저장하여 실행 시 이중 파싱 방지)
+            parsed = load_json(collection_data)
             
-            # Collection 생성
-            collection = PostmanCollection(
-                name=name,
-                description=description,
-                collection_data=collection_data,
-                user_id=user_id
-            )
+            if collection_id is None:
+                compiled = compile_collection(parsed)
+                
+                # Collection 생성
+                collection = PostmanCollection(
+                    name=name,
+                    description=description,
+                    collection_data=parsed,
+                    user_id=user_id
+                )
+                db.add(collection)
+            else:
+                # 기존 Collection 재업로드
+                collection = await db.get(PostmanCollection, collection_id)
+                if not collection or collection.user_id != user_id:
+                    return {
+                        "status": "error",
+                        "message": f"Collection {collection_id} not found"
+                    }
+                compiled = compile_collection(parsed, collection_cache.latest(collection_id))
+                
+                collection.name = name
+                collection.description = description
+                collection.collection_data = parsed
+                collection.version = collection.version + 1
             
-            db.add(collection)
             await db.commit()
             await db.refresh(collection)
             
+            # 실행 시 다시 파싱하지 않도록 컴파일 결과 캐시
+            collection_cache.put(collection.collection_id, collection.version, collection.updated_at, compiled)
+            
             return {
                 "status": "success",
                 "message": "Collection processed successfully",
-                "collection_id": collection.collection_id
+                "collection_id": collection.collection_id,
+                "version": collection.version
             }
         except json.JSONDecodeError:
             return {
@@ -0,0 +1,251 @@
+from typing import Dict, Any, Optional, List, Iterator, Tuple, BinaryIO, Union
+import hashlib
+import json
+import logging
+
+from app.config import settings
+
+try:
+    import ijson
+except ImportError:  # 선택 의존성 (pip install ijson)
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+# 내용 비교에서 제외하는 item 식별 필드
+IDENTITY_FIELDS = ("id", "_postman_id", "uid")
+
+def load_json_file(file: BinaryIO) -> Any:
+    """
+    업로드 파일에서 JSON 로드
+
+    Collection 은 collection_data 컬럼에 문서 전체로 저장되므로 한 번에 읽어 파싱한다.
+    item 단위로 읽어야 하면 CollectionReader 를 사용한다.
+
+    :param file: 바이너리 파일 객체
+    :return: 파싱된 JSON
+    """
+    # 바이트를 그대로 파싱 (디코딩된 문자열 사본을 만들지 않음)
+    return json.loads(file.read())
+
+def join_path(names: List[str]) -> str:
+    """
+    폴더 이름으로 경로 생성 (빈 상위 경로는 생략)
+    """
+    path = ""
+    for name in names:
+        path = f"{path}/{name}" if path else name
+    return path
+
+def content_hash(value: Any) -> str:
+    """
+    정규화한 내용의 해시 (키 순서와 공백에 영향받지 않음)
+
+    :param value: JSON 직렬화 가능한 값
+    :return: 16진수 해시
+    """
+    normalized = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+def item_hash(item: Dict[str, Any]) -> str:
+    """
+    요청 item 의 내용 해시 (request, 스크립트, 예시 응답 등 식별 필드를 제외한 전체)
+
+    :param item: Postman 요청 item
+    :return: 16진수 해시
+    """
+    return content_hash({key: value for key, value in item.items() if key not in IDENTITY_FIELDS})
+
+class ItemKeys:
+    """
+    재업로드 시 item 을 대응시키기 위한 식별자 생성
+
+    item id 가 있으면 id, 없으면 폴더 경로를 사용하고 같은 식별자가 반복되면 순번을 붙인다.
+    """
+
+    def __init__(self):
+        self.seen: Dict[str, int] = {}
+
+    def key(self, path: str, item: Dict[str, Any]) -> str:
+        """
+        item 식별자 반환
+
+        :param path: item 경로
+        :param item: Postman item
+        :return: 식별자
+        """
+        key = str(item.get("id") or path)
+        count = self.seen.get(key, 0) + 1
+        self.seen[key] = count
+        return key if count == 1 else f"{key}#{count}"
+
+class _ItemFrame:
+    """
+    스트리밍 파싱 중인 Collection / 폴더 / 요청 item
+    """
+    __slots__ = ("fields", "has_children", "pending")
+
+    def __init__(self):
+        # item 목록을 제외한 필드
+        self.fields: Dict[str, Any] = {}
+        self.has_children = False
+        # 폴더 이름을 알기 전에 끝난 하위 요청 (폴더 기준 상대 경로, item)
+        self.pending: List[Tuple[List[str], Dict[str, Any]]] = []
+
+    @property
+    def name(self) -> Optional[str]:
+        return self.fields.get("name")
+
+class CollectionReader:
+    """
+    Postman Collection 의 요청 item 을 하나씩 반환하는 읽기 도구
+
+    폴더는 재귀 호출 대신 명시적인 스택으로 순회하므로 중첩 깊이에 제한이 없다.
+    파일 객체가 주어지고 ijson 이 설치되어 있으면 파싱 이벤트를 UPLOAD_CHUNK_SIZE 단위로 처리하며
+    요청 item 하나씩만 객체로 만들기 때문에 파일 크기와 관계없이 메모리 사용량이 일정하다.
+    Collection info 는 반복 중 읽은 시점부터 info 속성으로 조회할 수 있다.
+    """
+
+    def __init__(self, source: Union[Dict[str, Any], BinaryIO]):
+        self.source = source
+        # 지금까지 읽은 Collection 필드 (item 목록 제외)
+        self._fields: Dict[str, Any] = {}
+
+    @property
+    def info(self) -> Dict[str, Any]:
+        """
+        지금까지 읽은 Collection info
+        """
+        return self._fields.get("info") or {}
+
+    def __iter__(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        (상위 폴더 경로, 요청 item) 반환
+        """
+        if isinstance(self.source, dict):
+            return self._walk(self.source)
+        if ijson is None:
+            return self._walk(load_json_file(self.source))
+        return self._stream(self.source)
+
+    def _walk(self, collection: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        파싱된 Collection 순회
+        """
+        self._fields = collection
+        stack = [(collection.get("item", []) or [], "", 0)]
+
+        while stack:
+            items, parent_path, index = stack.pop()
+            if index >= len(items):
+                continue
+            # 현재 위치를 다시 넣고 다음 item 처리
+            stack.append((items, parent_path, index + 1))
+            item = items[index]
+
+            # 중첩 폴더인 경우
+            if isinstance(item.get("item"), list):
+                stack.append((item["item"], join_path([parent_path, item.get("name", "")]), 0))
+            # API 요청인 경우
+            elif "request" in item:
+                yield parent_path, item
+
+    def _stream(self, file: BinaryIO) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        파싱 이벤트를 직접 처리하며 순회
+        """
+        root = _ItemFrame()
+        self._fields = root.fields
+        # 열려 있는 Collection / item
+        frames: List[_ItemFrame] = []
+        # 각 프레임이 하위 item 배열 안에 있는지 여부
+        in_children: List[Optional[bool]] = []
+        key: Optional[str] = None
+        builder = None
+        depth = 0
+
+        try:
+            for _, event, value in ijson.parse(file, buf_size=settings.UPLOAD_CHUNK_SIZE, use_float=True):
+                # 필드 값 구성 중
+                if builder is not None:
+                    builder.event(event, value)
+                    if event in ("start_map", "start_array"):
+                        depth += 1
+                    elif event in ("end_map", "end_array"):
+                        depth -= 1
+                    if depth == 0:
+                        frames[-1].fields[key] = builder.value
+                        builder = None
+                    continue
+
+                if not frames:
+                    if event != "start_map":
+                        raise ValueError("Collection must be a JSON object")
+                    frames.append(root)
+                    in_children.append(False)
+                elif in_children[-1]:
+                    # 하위 item 배열의 원소
+                    if event == "start_map":
+                        frames.append(_ItemFrame())
+                        in_children.append(False)
+                    elif event == "end_array":
+                        in_children[-1] = False
+                    else:
+                        raise ValueError("Collection item must be a JSON object")
+                elif event == "map_key":
+                    key = value
+                    if key == "item":
+                        in_children[-1] = None  # 다음 이벤트로 배열 여부 판단
+                elif in_children[-1] is None:
+                    if event == "start_array":
+                        frames[-1].has_children = True
+                        in_children[-1] = True
+                    else:
+                        # 배열이 아닌 item 필드는 일반 필드로 저장
+                        in_children[-1] = False
+                        builder, depth = self._start_value(event, value)
+                        if depth == 0:
+                            frames[-1].fields[key] = builder.value
+                            builder = None
+                elif event == "end_map":
+                    frame = frames.pop()
+                    in_children.pop()
+                    if frame is not root:
+                        yield from self._close(frames, frame)
+                else:
+                    builder, depth = self._start_value(event, value)
+                    if depth == 0:
+                        frames[-1].fields[key] = builder.value
+                        builder = None
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON format: {str(e)}")
+
+    def _start_value(self, event: str, value: Any):
+        """
+        필드 값 구성 시작
+        """
+        builder = ijson.ObjectBuilder()
+        builder.event(event, value)
+        return builder, 1 if event in ("start_map", "start_array") else 0
+
+    def _close(self, frames: List[_ItemFrame], frame: _ItemFrame) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        끝난 item 처리 (요청이면 반환, 폴더면 보류된 하위 요청 반환)
+        """
+        if frame.has_children:
+            folder_name = frame.name or ""
+            entries = [([folder_name] + relative, item) for relative, item in frame.pending]
+        elif "request" in frame.fields:
+            entries = [([], frame.fields)]
+        else:
+            return
+
+        for relative, item in entries:
+            # 이름을 아직 모르는 상위 폴더가 있으면 그 폴더가 끝날 때까지 보류
+            for index in range(len(frames) - 1, 0, -1):
+                if frames[index].name is None:
+                    names = [frame.name or "" for frame in frames[index + 1:]]
+                    frames[index].pending.append((names + relative, item))
+                    break
+            else:
+                yield join_path([frame.name for frame in frames[1:]] + relative), item
@@ -0,0 +1,173 @@
+from typing import Dict, Any, List, Optional
+import asyncio
+import logging
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.db.init_db import async_session
+from app.models.test_run import TestResult
+
+logger = logging.getLogger(__name__)
+
+class ResultWriter:
+    """
+    TestResult 일괄 기록기
+
+    테스트 결과를 메모리에 모았다가 전용 세션으로 일괄 INSERT 한다.
+    버퍼가 RESULT_WRITER_BATCH_SIZE 에 도달하거나 RESULT_WRITER_FLUSH_INTERVAL_MS 가 지나면 기록한다.
+    일괄 INSERT 가 실패하면 한 행씩 다시 기록하고, 그래도 실패한 행 수는 테스트 실행별로 보관한다.
+    """
+
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # 기록하지 못한 결과 수 (test_run_id -> 행 수)
+        self._failures: Dict[int, int] = {}
+
+    async def start(self):
+        """
+        기록 태스크 시작 (종료된 태스크는 다시 시작)
+        """
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue(maxsize=settings.RESULT_WRITER_QUEUE_SIZE)
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        남은 결과를 기록한 뒤 기록 태스크 종료
+        """
+        if self._task is None:
+            return
+        try:
+            await self.flush()
+        except RuntimeError as e:
+            # 이미 종료된 기록 태스크 (남은 결과는 기록 실패로 집계됨)
+            logger.error(f"Error flushing test results on stop: {str(e)}")
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self._queue = None
+
+    async def write(self, row: Dict[str, Any]):
+        """
+        TestResult 행 기록 요청 (버퍼가 가득 차면 대기)
+
+        :param row: TestResult 컬럼 값
+        """
+        if self._task is None or self._task.done():
+            await self.start()
+        await self._queue.put(row)
+
+    async def flush(self):
+        """
+        지금까지 요청된 결과가 모두 기록될 때까지 대기
+
+        기록 태스크가 종료되어 있거나 대기 중 종료되면 RuntimeError 를 발생시킨다.
+        """
+        if self._task is None:
+            return
+        task = self._task
+        if task.done():
+            raise RuntimeError("Result writer is not running")
+        waiter = asyncio.get_running_loop().create_future()
+        await self._queue.put(waiter)
+        # 기록 태스크가 도중에 종료되어도 대기가 끝나도록 함께 대기
+        await asyncio.wait({waiter, task}, return_when=asyncio.FIRST_COMPLETED)
+        if not waiter.done():
+            raise RuntimeError("Result writer stopped before flushing")
+        waiter.result()
+
+    def pop_failures(self, test_run_id: int) -> int:
+        """
+        기록하지 못한 결과 수 조회 후 초기화 (flush 이후 호출)
+
+        :param test_run_id: 테스트 실행 ID
+        :return: 기록하지 못한 행 수
+        """
+        return self._failures.pop(test_run_id, 0)
+
+    async def _write_rows(self, db: AsyncSession, rows: List[Dict[str, Any]]):
+        """
+        행 일괄 기록 (실패 시 한 행씩 재시도)
+        """
+        try:
+            await db.execute(insert(TestResult), rows)
+            await db.commit()
+            return
+        except Exception as e:
+            await db.rollback()
+            logger.warning(f"Error writing {len(rows)} test results, retrying row by row: {str(e)}")
+
+        for row in rows:
+            try:
+                await db.execute(insert(TestResult), [row])
+                await db.commit()
+            except Exception as e:
+                await db.rollback()
+                test_run_id = row.get("test_run_id")
+                self._failures[test_run_id] = self._failures.get(test_run_id, 0) + 1
+                logger.error(f"Error writing test result for test run {test_run_id}: {str(e)}")
+
+    async def _run(self):
+        """
+        기록 루프
+        """
+        loop = asyncio.get_running_loop()
+        interval = settings.RESULT_WRITER_FLUSH_INTERVAL_MS / 1000
+
+        try:
+            await self._write_loop(loop, interval)
+        finally:
+            self._fail_pending()
+
+    def _fail_pending(self):
+        """
+        기록 태스크 종료 시 대기 중인 결과는 기록 실패로 집계하고 flush 대기를 해제
+        """
+        queue = self._queue
+        while queue is not None and not queue.empty():
+            entry = queue.get_nowait()
+            if isinstance(entry, asyncio.Future):
+                if not entry.done():
+                    entry.set_exception(RuntimeError("Result writer stopped"))
+            else:
+                test_run_id = entry.get("test_run_id")
+                self._failures[test_run_id] = self._failures.get(test_run_id, 0) + 1
+
+    async def _write_loop(self, loop: asyncio.AbstractEventLoop, interval: float):
+        """
+        기록 루프 본문
+        """
+        async with async_session() as db:
+            while True:
+                rows: List[Dict[str, Any]] = []
+                waiters: List[asyncio.Future] = []
+
+                # 첫 항목이 들어오면 배치 크기 또는 시간 제한까지 수집
+                entry = await self._queue.get()
+                deadline = loop.time() + interval
+                while True:
+                    if isinstance(entry, asyncio.Future):
+                        waiters.append(entry)
+                        break
+                    rows.append(entry)
+                    if len(rows) >= settings.RESULT_WRITER_BATCH_SIZE:
+                        break
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        entry = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        break
+
+                if rows:
+                    await self._write_rows(db, rows)
+
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(None)
+
+# 싱글톤 인스턴스
+result_writer = ResultWriter()
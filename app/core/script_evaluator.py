@@ -0,0 +1,244 @@
+from typing import Dict, Any, Optional, List, Tuple
+import json
+import logging
+import re
+
+from app.core.template_engine import SCRIPT_SCOPES, VariableScope
+
+logger = logging.getLogger(__name__)
+
+# pm.environment.set("key", value) 형태의 변수 설정 구문
+# (닫는 괄호 뒤에 세미콜론, 주석 또는 줄 끝이 와야 하며 같은 줄의 다음 구문과 주석은 허용)
+SET_PATTERN = re.compile(
+    r"pm\.(environment|collectionVariables|globals|variables)\.set\(\s*"
+    r"(['\"])(?P<key>[^'\"]+)\2\s*,\s*(?P<expr>[^;\n]+?)\s*\)\s*(?=;|//|/\*|$)",
+    re.MULTILINE
+)
+# var jsonData = pm.response.json(); 형태의 응답 JSON 별칭
+JSON_ALIAS_PATTERN = re.compile(
+    r"(?:var|let|const)\s+(\w+)\s*=\s*(?:pm\.response\.json\(\)|JSON\.parse\(responseBody\))"
+)
+# pm.test("name", ...) 블록 시작
+TEST_BLOCK_PATTERN = re.compile(r"pm\.test\(\s*(['\"])(?P<name>.*?)\1")
+# tests["name"] = expression; 형태의 레거시 테스트
+LEGACY_TEST_PATTERN = re.compile(
+    r"tests\[\s*(['\"])(?P<name>.*?)\1\s*\]\s*=\s*(?P<expr>[^;\n]+)"
+)
+
+# 지원하는 assertion 구문
+STATUS_PATTERNS = [
+    re.compile(r"pm\.response\.to\.have\.status\(\s*(\d{3})\s*\)"),
+    re.compile(r"pm\.expect\(\s*pm\.response\.code\s*\)\.to\.(?:eql|equal)\(\s*(\d{3})\s*\)"),
+    re.compile(r"responseCode\.code\s*===?\s*(\d{3})"),
+]
+OK_PATTERN = re.compile(r"pm\.response\.to\.be\.ok")
+HEADER_PATTERN = re.compile(r"pm\.response\.to\.have\.header\(\s*(['\"])(.+?)\1")
+RESPONSE_TIME_PATTERN = re.compile(
+    r"pm\.expect\(\s*pm\.response\.responseTime\s*\)\.to\.be\.below\(\s*(\d+)\s*\)"
+)
+BODY_INCLUDE_PATTERN = re.compile(
+    r"pm\.expect\(\s*pm\.response\.text\(\)\s*\)\.to\.include\(\s*(['\"])(.*?)\1\s*\)"
+)
+
+class ScriptEvaluator:
+    """
+    Postman 스크립트 평가기
+
+    JavaScript 엔진 없이 자주 쓰이는 pm.* 구문(변수 설정, 상태코드/헤더/본문 검증)만 해석한다.
+    해석할 수 없는 테스트는 skipped 로 기록된다.
+    """
+
+    def __init__(self):
+        pass
+
+    def get_script(self, events: List[Dict[str, Any]], listen: str) -> str:
+        """
+        item 의 event 목록에서 스크립트 추출
+
+        :param events: Postman event 목록
+        :param listen: 이벤트 종류 (prerequest, test)
+        :return: 스크립트 문자열
+        """
+        lines: List[str] = []
+        for event in events or []:
+            if event.get("listen") != listen or event.get("disabled"):
+                continue
+            exec_lines = event.get("script", {}).get("exec", [])
+            if isinstance(exec_lines, str):
+                lines.append(exec_lines)
+            else:
+                lines.extend(exec_lines)
+        return "\n".join(lines)
+
+    def run_prerequest(self, script: str, variables: Dict[str, Any]) -> None:
+        """
+        Pre-request 스크립트 실행 (리터럴 변수 설정만 지원)
+
+        :param script: 스크립트 문자열
+        :param variables: 변수 저장소 (직접 갱신됨)
+        """
+        if not script:
+            return
+        for match in SET_PATTERN.finditer(script):
+            found, value = self._evaluate_literal(match.group("expr"))
+            if found:
+                self._set_variable(variables, match.group(1), match.group("key"), value)
+
+    def run_tests(
+        self,
+        script: str,
+        response: Optional[Dict[str, Any]],
+        variables: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        테스트 스크립트 실행
+
+        :param script: 스크립트 문자열
+        :param response: 응답 정보 (code, headers, body, response_time)
+        :param variables: 변수 저장소 (직접 갱신됨)
+        :return: assertion 결과 목록
+        """
+        if not script:
+            return []
+
+        # 변수 설정
+        aliases = set(JSON_ALIAS_PATTERN.findall(script))
+        json_body = self._parse_json_body(response)
+        for match in SET_PATTERN.finditer(script):
+            found, value = self._evaluate_expression(match.group("expr"), response, json_body, aliases)
+            if found:
+                self._set_variable(variables, match.group(1), match.group("key"), value)
+
+        results: List[Dict[str, Any]] = []
+
+        # pm.test 블록
+        blocks = list(TEST_BLOCK_PATTERN.finditer(script))
+        legacy_tests = list(LEGACY_TEST_PATTERN.finditer(script))
+        boundaries = sorted([m.start() for m in blocks + legacy_tests] + [len(script)])
+        for block in blocks:
+            end = next(b for b in boundaries if b > block.start())
+            results.append(self._run_test_block(block.group("name"), script[block.end():end], response))
+
+        # 레거시 tests[] 구문
+        for match in legacy_tests:
+            results.append(self._run_test_block(match.group("name"), match.group("expr"), response))
+
+        return results
+
+    def _set_variable(self, variables: Dict[str, Any], api: str, key: str, value: Any):
+        """
+        스크립트 API(pm.environment 등)에 해당하는 범위에 변수 설정
+        """
+        if isinstance(variables, VariableScope):
+            variables.set(key, value, SCRIPT_SCOPES[api])
+        else:
+            variables[key] = value
+
+    def _run_test_block(self, name: str, body: str, response: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        단일 테스트 블록 평가
+        """
+        checks: List[Tuple[bool, str]] = []
+
+        if response is None:
+            return {"name": name, "status": "failed", "message": "No response received"}
+
+        code = response.get("code")
+        for pattern in STATUS_PATTERNS:
+            for expected in pattern.findall(body):
+                checks.append((code == int(expected), f"expected status {expected} but got {code}"))
+        if OK_PATTERN.search(body):
+            checks.append((code is not None and 200 <= code < 300, f"expected 2xx status but got {code}"))
+        for _, header in HEADER_PATTERN.findall(body):
+            headers = {key.lower() for key, _ in response.get("headers", [])}
+            checks.append((header.lower() in headers, f"expected header '{header}'"))
+        for limit in RESPONSE_TIME_PATTERN.findall(body):
+            elapsed = response.get("response_time", 0)
+            checks.append((elapsed < int(limit), f"expected response time below {limit}ms but got {elapsed}ms"))
+        for _, text in BODY_INCLUDE_PATTERN.findall(body):
+            checks.append((text in (response.get("body") or ""), f"expected body to include '{text}'"))
+
+        if not checks:
+            return {"name": name, "status": "skipped", "message": "Unsupported assertion"}
+
+        failures = [message for passed, message in checks if not passed]
+        if failures:
+            return {"name": name, "status": "failed", "message": "; ".join(failures)}
+        return {"name": name, "status": "passed", "message": ""}
+
+    def _parse_json_body(self, response: Optional[Dict[str, Any]]) -> Any:
+        """
+        응답 본문을 JSON 으로 파싱 (실패 시 None)
+        """
+        if not response or not response.get("body"):
+            return None
+        try:
+            return json.loads(response["body"])
+        except (TypeError, ValueError):
+            return None
+
+    def _evaluate_literal(self, expr: str) -> Tuple[bool, Any]:
+        """
+        문자열/숫자/불리언 리터럴 평가
+        """
+        expr = expr.strip()
+        if len(expr) >= 2 and expr[0] == expr[-1] and expr[0] in "'\"`":
+            return True, expr[1:-1]
+        if expr in ("true", "false"):
+            return True, expr == "true"
+        try:
+            return True, json.loads(expr)
+        except ValueError:
+            return False, None
+
+    def _evaluate_expression(
+        self,
+        expr: str,
+        response: Optional[Dict[str, Any]],
+        json_body: Any,
+        aliases: set
+    ) -> Tuple[bool, Any]:
+        """
+        변수 설정 값 평가 (리터럴, 응답 JSON 경로, 응답 헤더)
+        """
+        found, value = self._evaluate_literal(expr)
+        if found:
+            return found, value
+
+        expr = expr.strip()
+        header_match = re.fullmatch(r"pm\.response\.headers\.get\(\s*(['\"])(.+?)\1\s*\)", expr)
+        if header_match and response:
+            name = header_match.group(2).lower()
+            for key, header_value in response.get("headers", []):
+                if key.lower() == name:
+                    return True, header_value
+            return False, None
+
+        path = None
+        if expr.startswith("pm.response.json()"):
+            path = expr[len("pm.response.json()"):]
+        else:
+            head = re.match(r"(\w+)", expr)
+            if head and head.group(1) in aliases:
+                path = expr[len(head.group(1)):]
+        if path is None or json_body is None:
+            return False, None
+        return self._resolve_path(json_body, path)
+
+    def _resolve_path(self, data: Any, path: str) -> Tuple[bool, Any]:
+        """
+        .a.b[0]["c"] 형태의 경로로 값 조회
+        """
+        for key, index in re.findall(r"\.(\w+)|\[\s*['\"]?([^\]'\"]+)['\"]?\s*\]", path):
+            token = key or index
+            try:
+                if isinstance(data, list):
+                    data = data[int(token)]
+                else:
+                    data = data[token]
+            except (KeyError, IndexError, ValueError, TypeError):
+                return False, None
+        return True, data
+
+# 싱글톤 인스턴스
+script_evaluator = ScriptEvaluator()
@@ -0,0 +1,73 @@
+from typing import Dict, Any, Optional
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 부모 프로세스의 공유 프로세스 풀
+_pool: Optional[ProcessPoolExecutor] = None
+
+# 워커 프로세스마다 유지되는 이벤트 루프 (HTTP 연결 재사용)
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _init_worker():
+    """
+    워커 프로세스 초기화
+    """
+    global _worker_loop
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+
+def run_shard(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    워커 프로세스에서 shard 실행
+
+    :param payload: items [(index, item)], variables, iteration, concurrency
+    :return: results [(index, result)], 범위별로 변경된 variables
+    """
+    return _worker_loop.run_until_complete(_run_shard(payload))
+
+async def _run_shard(payload: Dict[str, Any]) -> Dict[str, Any]:
+    # 순환 import 방지
+    from app.core.collection_runner import CollectionRunner
+
+    runner = CollectionRunner(None)
+    base = payload["variables"]
+    variables = base.copy()
+    semaphore = asyncio.Semaphore(max(1, payload["concurrency"]))
+
+    async def run_one(index: int, item: Dict[str, Any]):
+        async with semaphore:
+            return index, await runner.run_item(item, variables, payload["iteration"])
+
+    results = await asyncio.gather(*(run_one(index, item) for index, item in payload["items"]))
+    return {"results": results, "variables": variables.changes(base)}
+
+def get_shard_pool() -> ProcessPoolExecutor:
+    """
+    공유 프로세스 풀 반환 (최초 호출 시 생성)
+    """
+    global _pool
+    if _pool is None:
+        workers = settings.TEST_SHARD_WORKERS or os.cpu_count() or 1
+        _pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker
+        )
+        logger.info(f"Started shard process pool with {workers} workers")
+    return _pool
+
+def shutdown_shard_pool():
+    """
+    공유 프로세스 풀 종료
+    """
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
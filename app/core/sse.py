@@ -0,0 +1,38 @@
+from typing import Any, Optional
+
+from app.core.mcp_codec import get_codec
+
+# SSE 응답 헤더 (프록시 버퍼링 방지)
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no"
+}
+
+# 연결 유지용 주석 라인과 전송 주기(초)
+SSE_KEEPALIVE = ": keep-alive\n\n"
+SSE_KEEPALIVE_SECONDS = 15.0
+
+def format_sse(
+    data: Any,
+    event: Optional[str] = None,
+    event_id: Optional[Any] = None,
+    cache: bool = False
+) -> str:
+    """
+    Server-Sent Events 메세지 형식화
+
+    :param data: 전송할 데이터 (문자열이 아니면 JSON 으로 직렬화)
+    :param event: 이벤트 이름
+    :param event_id: 이벤트 ID (클라이언트가 재연결 시 Last-Event-ID 로 전달)
+    :param cache: 여러 구독자에게 보내는 이벤트 데이터이면 True (인코딩 결과 공유)
+    :return: SSE 메세지
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event:
+        lines.append(f"event: {event}")
+    payload = data if isinstance(data, str) else get_codec("json").encode(data, cache=cache)
+    for line in payload.splitlines() or [""]:
+        lines.append(f"data: {line}")
+    return "\n".join(lines) + "\n\n"
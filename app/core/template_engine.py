@@ -0,0 +1,189 @@
+from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+import re
+
+# {{variable}} 치환 패턴
+VARIABLE_PATTERN = re.compile(r"\{\{\s*([^{}\s]+)\s*\}\}")
+
+# 값이 없는 변수 표시
+_MISSING = object()
+
+# 변수 범위 (우선순위가 낮은 순서, Postman 과 동일)
+SCOPES = ("global", "collection", "environment", "data", "local")
+
+# 스크립트 API(pm.<name>) 와 변수 범위 매핑
+SCRIPT_SCOPES = {
+    "globals": "global",
+    "collectionVariables": "collection",
+    "environment": "environment",
+    "variables": "local"
+}
+
+class VariableScope(dict):
+    """
+    범위별 변수 저장소
+
+    global < collection < environment < data < local 순으로 덮어쓰며,
+    범위별 값은 layers 에 따로 보관하고 자신(dict)에는 우선순위가 적용된 최종 값만 유지한다.
+    따라서 템플릿 렌더링 시 변수 조회는 범위 수와 관계없이 dict 조회 한 번이다.
+    """
+    __slots__ = ("layers",)
+
+    def __init__(self, layers: Optional[Dict[str, Dict[str, Any]]] = None):
+        super().__init__()
+        self.layers: Dict[str, Dict[str, Any]] = {scope: {} for scope in SCOPES}
+        for scope, values in (layers or {}).items():
+            self.load(scope, values)
+
+    def load(self, scope: str, values: Dict[str, Any]):
+        """
+        범위에 변수 일괄 설정
+
+        :param scope: 변수 범위
+        :param values: 변수 목록
+        """
+        for key, value in (values or {}).items():
+            self.set(key, value, scope)
+
+    def set(self, key: str, value: Any, scope: str = "local"):
+        """
+        변수 설정
+
+        :param key: 변수 이름
+        :param value: 변수 값
+        :param scope: 변수 범위
+        """
+        self.layers[scope][key] = value
+        self._resolve(key)
+
+    def unset(self, key: str, scope: str = "local"):
+        """
+        변수 삭제 (하위 범위의 값이 있으면 그 값이 보이게 됨)
+
+        :param key: 변수 이름
+        :param scope: 변수 범위
+        """
+        self.layers[scope].pop(key, None)
+        self._resolve(key)
+
+    def __setitem__(self, key: str, value: Any):
+        # 범위를 지정하지 않은 설정은 local 범위
+        self.set(key, value)
+
+    def update(self, *args: Any, **kwargs: Any):
+        # 범위를 지정하지 않은 일괄 설정은 local 범위
+        self.load("local", dict(*args, **kwargs))
+
+    def __delitem__(self, key: str):
+        for values in self.layers.values():
+            values.pop(key, None)
+        dict.pop(self, key, None)
+
+    def copy(self) -> "VariableScope":
+        """
+        범위별 값을 포함한 복사본
+        """
+        return VariableScope(self.layers)
+
+    def changes(self, base: "VariableScope") -> Dict[str, Dict[str, Any]]:
+        """
+        기준 저장소 이후 범위별로 변경된 변수
+
+        :param base: 기준 저장소
+        :return: 범위별 변경 변수
+        """
+        changed: Dict[str, Dict[str, Any]] = {}
+        for scope, values in self.layers.items():
+            original = base.layers[scope]
+            diff = {key: value for key, value in values.items() if key not in original or original[key] != value}
+            if diff:
+                changed[scope] = diff
+        return changed
+
+    def _resolve(self, key: str):
+        """
+        가장 높은 우선순위 범위의 값으로 최종 값 갱신
+        """
+        for scope in reversed(SCOPES):
+            values = self.layers[scope]
+            if key in values:
+                dict.__setitem__(self, key, values[key])
+                return
+        dict.pop(self, key, None)
+
+    def __reduce__(self):
+        # 프로세스 풀 전달용 (범위별 값으로 복원)
+        return (VariableScope, (self.layers,))
+
+class Template:
+    """
+    미리 컴파일된 {{variable}} 템플릿
+
+    문자열을 고정 문자열과 변수 자리로 한 번만 나누어 두므로 렌더링 시 정규식 검색을 하지 않는다.
+    같은 변수가 여러 번 나오면 변수 조회는 한 번만 한다.
+    """
+    __slots__ = ("source", "parts", "slots")
+
+    def __init__(self, source: str):
+        self.source = source
+        # 고정 문자열과 변수 자리 (값이 없는 변수는 원래 문자열을 그대로 남김)
+        parts = []
+        positions: Dict[str, List[int]] = {}
+        position = 0
+        for match in VARIABLE_PATTERN.finditer(source):
+            if match.start() > position:
+                parts.append(source[position:match.start()])
+            positions.setdefault(match.group(1), []).append(len(parts))
+            parts.append(match.group(0))
+            position = match.end()
+        if position < len(source):
+            parts.append(source[position:])
+        self.parts: Tuple[str, ...] = tuple(parts)
+        # 변수 이름별 자리 목록
+        self.slots: Tuple[Tuple[str, Tuple[int, ...]], ...] = tuple(
+            (key, tuple(indexes)) for key, indexes in positions.items()
+        )
+
+    @property
+    def keys(self) -> Tuple[str, ...]:
+        """
+        템플릿이 참조하는 변수 이름 목록
+        """
+        return tuple(key for key, _ in self.slots)
+
+    def render(self, variables: Dict[str, Any]) -> str:
+        """
+        변수 치환
+
+        :param variables: 변수 저장소
+        :return: 치환된 문자열
+        """
+        if not self.slots:
+            return self.source
+        parts = list(self.parts)
+        get = variables.get
+        for key, indexes in self.slots:
+            value = get(key, _MISSING)
+            if value is _MISSING:
+                continue
+            value = str(value)
+            for index in indexes:
+                parts[index] = value
+        return "".join(parts)
+
+@lru_cache(maxsize=4096)
+def _compile(source: str) -> Template:
+    return Template(source)
+
+def compile_template(value: Any) -> Template:
+    """
+    문자열을 템플릿으로 컴파일 (같은 문자열은 컴파일된 템플릿을 공유)
+
+    :param value: 원본 값 (None 은 빈 문자열, 문자열이 아니면 str() 변환)
+    :return: 컴파일된 템플릿
+    """
+    if value is None:
+        value = ""
+    elif not isinstance(value, str):
+        value = str(value)
+    return _compile(value)
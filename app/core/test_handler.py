@@ -2,20 +2,27 @@ from typing import Dict, Any, Optional, List
 import json
 import logging
 import asyncio
-import tempfile
 import os
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-import newman
+from sqlalchemy import select, func
 
+from app.config import settings
+from app.db.init_db import async_session
 from app.models.postman import PostmanCollection, PostmanEnvironment, PostmanTestData
 from app.models.test_run import TestRun, TestResult
+from app.core.test_scheduler import test_scheduler
+from app.core.result_writer import result_writer
 from app.core.mcp_protocol import mcp_protocol
-from app.core.mcp_handler import mcp_handler
+from app.core.collection_runner import CollectionRunner
+from app.core.collection_ir import CompiledCollection, collection_cache
+from app.core.event_bus import event_bus, make_topic
 
 logger = logging.getLogger(__name__)
 
+# 실행을 끝내는 테스트 이벤트 (이벤트 스트림 종료)
+TERMINAL_EVENTS = ("test_completed", "test_failed")
+
 class TestHandler:
     """
     테스트 실행 처리 핸들러
@@ -30,7 +37,11 @@ class TestHandler:
         collection_id: int,
         environment_id: Optional[int],
         test_data_id: Optional[int],
-        user_id: int
+        user_id: int,
+        concurrency: int = 1,
+        iteration_concurrency: int = 1,
+        shards: int = 0,
+        priority: int = 0
     ) -> Dict[str, Any]:
         """
         테스트 실행
@@ -40,12 +51,35 @@ class TestHandler:
         :param environment_id: Environment ID (선택)
         :param test_data_id: Test Data ID (선택)
         :param user_id: 사용자 ID
+        :param concurrency: 반복 회차마다 동시에 실행할 최대 요청 수
+        :param iteration_concurrency: 동시에 실행할 최대 반복 회차 수
+        :param shards: 프로세스 풀에서 동시에 실행할 최대 shard 수 (0 이면 사용 안 함)
+        :param priority: 대기열 우선순위 (값이 클수록 먼저 실행)
         :return: 테스트 실행 결과
         """
         try:
-            # Collection 조회
-            collection = await db.get(PostmanCollection, collection_id)
-            if not collection:
+            if concurrency < 1 or iteration_concurrency < 1:
+                return {
+                    "status": "error",
+                    "message": "concurrency and iteration_concurrency must be at least 1"
+                }
+            if shards < 0:
+                return {
+                    "status": "error",
+                    "message": "shards must not be negative"
+                }
+            shards = min(shards, settings.TEST_SHARD_WORKERS or os.cpu_count() or 1)
+            concurrency = min(concurrency, settings.TEST_MAX_CONCURRENCY)
+            iteration_concurrency = min(iteration_concurrency, settings.TEST_MAX_ITERATION_CONCURRENCY)
+            
+            # 사용자 소유 Collection 확인 (collection_data 는 실행 시 캐시에 없을 때만 로드)
+            collection = await db.scalar(
+                select(PostmanCollection.collection_id).where(
+                    PostmanCollection.collection_id == collection_id,
+                    PostmanCollection.user_id == user_id
+                )
+            )
+            if collection is None:
                 return {
                     "status": "error",
                     "message": "Collection not found"
@@ -55,7 +89,7 @@ class TestHandler:
             environment = None
             if environment_id:
                 environment = await db.get(PostmanEnvironment, environment_id)
-                if not environment:
+                if not environment or environment.collection_id != collection_id:
                     return {
                         "status": "error",
                         "message": "Environment not found"
@@ -65,196 +99,312 @@ class TestHandler:
             test_data = None
             if test_data_id:
                 test_data = await db.get(PostmanTestData, test_data_id)
-                if not test_data:
+                if not test_data or test_data.collection_id != collection_id:
                     return {
                         "status": "error",
                         "message": "Test data not found"
                     }
             
-            # 테스트 실행 생성
+            # 테스트 실행 생성 (대기 상태)
             test_run = TestRun(
                 collection_id=collection_id,
                 environment_id=environment_id,
                 test_data_id=test_data_id,
                 user_id=user_id,
-                status="running"
+                status="queued"
             )
             
             db.add(test_run)
+            await db.flush()
+            
+            # 실행 대기열 등록 (스케줄러가 실행 한도 안에서 실행)
+            # 테스트 실행과 대기 항목은 한 번에 커밋하여 대기 항목 없는 queued 실행이 남지 않도록 함
+            queue_position = await test_scheduler.enqueue(db, test_run, priority, {
+                "concurrency": concurrency,
+                "iteration_concurrency": iteration_concurrency,
+                "shards": shards
+            })
             await db.commit()
             await db.refresh(test_run)
+            test_scheduler.notify()
             
-            # 테스트 시작 이벤트 전송
-            await self._send_test_event("test_started", {
+            # 테스트 대기 이벤트 전송
+            await self._send_test_event("test_queued", test_run, {
                 "test_run_id": test_run.test_run_id,
                 "collection_id": collection_id,
-                "environment_id": environment_id,
-                "test_data_id": test_data_id,
                 "user_id": user_id,
-                "start_time": test_run.start_time.isoformat()
+                "priority": priority,
+                "queue_position": queue_position
             })
             
-            # 비동기로 테스트 실행
-            asyncio.create_task(self._execute_test(db, test_run, collection, environment, test_data))
-            
             return {
                 "status": "success",
-                "message": "Test started",
-                "test_run_id": test_run.test_run_id
+                "message": "Test queued",
+                "test_run_id": test_run.test_run_id,
+                "queue_position": queue_position
             }
         except Exception as e:
             logger.error(f"Error running test: {str(e)}")
+            await db.rollback()
             return {
                 "status": "error",
                 "message": f"Error running test: {str(e)}"
             }
     
+    async def execute_queued_run(self, test_run_id: int, options: Dict[str, Any]):
+        """
+        대기열에서 꺼낸 테스트 실행 (스케줄러에서 호출)
+        
+        :param test_run_id: 테스트 실행 ID
+        :param options: 실행 옵션 (concurrency, iteration_concurrency, shards)
+        """
+        async with async_session() as db:
+            test_run = await db.get(TestRun, test_run_id)
+            if not test_run:
+                logger.warning(f"Queued test run {test_run_id} no longer exists")
+                return
+            
+            collection = await collection_cache.load(db, test_run.collection_id)
+            environment = None
+            if test_run.environment_id:
+                environment = await db.get(PostmanEnvironment, test_run.environment_id)
+            test_data = None
+            if test_run.test_data_id:
+                test_data = await db.get(PostmanTestData, test_run.test_data_id)
+            
+            test_run.status = "running"
+            test_run.start_time = datetime.now()
+            await db.commit()
+            
+            # 테스트 시작 이벤트 전송
+            await self._send_test_event("test_started", test_run, {
+                "test_run_id": test_run.test_run_id,
+                "collection_id": test_run.collection_id,
+                "environment_id": test_run.environment_id,
+                "test_data_id": test_run.test_data_id,
+                "user_id": test_run.user_id,
+                "start_time": test_run.start_time.isoformat()
+            })
+            
+            await self._execute_test(
+                db, test_run, collection, environment, test_data,
+                concurrency=options.get("concurrency", 1),
+                iteration_concurrency=options.get("iteration_concurrency", 1),
+                shards=options.get("shards", 0)
+            )
+    
     async def _execute_test(
         self,
         db: AsyncSession,
         test_run: TestRun,
-        collection: PostmanCollection,
+        collection: Optional[CompiledCollection],
         environment: Optional[PostmanEnvironment],
-        test_data: Optional[PostmanTestData]
+        test_data: Optional[PostmanTestData],
+        concurrency: int = 1,
+        iteration_concurrency: int = 1,
+        shards: int = 0
     ):
         """
         테스트 실행 (비동기)
         
         :param db: 데이터베이스 세션
         :param test_run: 테스트 실행 객체
-        :param collection: Collection 객체
+        :param collection: 컴파일된 Collection
         :param environment: Environment 객체 (선택)
         :param test_data: Test Data 객체 (선택)
+        :param concurrency: 반복 회차마다 동시에 실행할 최대 요청 수
+        :param iteration_concurrency: 동시에 실행할 최대 반복 회차 수
+        :param shards: 프로세스 풀에서 동시에 실행할 최대 shard 수 (0 이면 사용 안 함)
         """
         try:
-            # 임시 파일 생성
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Collection 파일 저장
-                collection_path = os.path.join(temp_dir, "collection.json")
-                with open(collection_path, "w") as f:
-                    json.dump(collection.collection_data, f)
-                
-                # Environment 파일 저장 (선택)
-                environment_path = None
-                if environment:
-                    environment_path = os.path.join(temp_dir, "environment.json")
-                    with open(environment_path, "w") as f:
-                        json.dump(environment.environment_data, f)
-                
-                # Test Data 파일 저장 (선택)
-                test_data_path = None
-                if test_data:
-                    test_data_path = os.path.join(temp_dir, "test_data.json")
-                    with open(test_data_path, "w") as f:
-                        json.dump(test_data.test_data, f)
-                
-                # Newman 실행 옵션 설정
-                options = {
-                    "collection": collection_path,
-                    "environment": environment_path,
-                    "data": test_data_path,
-                    "reporters": ["cli", "json"],
-                    "reporter": {
-                        "json": {
-                            "export": os.path.join(temp_dir, "report.json")
-                        }
-                    }
+            if collection is None:
+                raise ValueError("Collection not found")
+            
+            # Collection 실행기 생성
+            runner = CollectionRunner(
+                collection,
+                environment.environment_data if environment else None,
+                test_data.test_data if test_data else None
+            )
+            
+            # 진행 상황 집계 (주기적인 test_progress 이벤트용)
+            progress = {"expected": 0, "completed": 0, "passed": 0, "failed": 0, "skipped": 0}
+            started = asyncio.get_running_loop().time()
+            
+            # 테스트 진행 상황 모니터링
+            async def on_run_start(expected):
+                progress["expected"] = expected
+            
+            async def on_test_start(item, iteration):
+                await self._send_test_event("test_item_started", test_run, {
+                    "test_run_id": test_run.test_run_id,
+                    "item_name": item.name,
+                    "iteration": iteration,
+                    "start_time": datetime.now().isoformat()
+                })
+            
+            async def on_test_end(item, result):
+                test_result = {
+                    "test_run_id": test_run.test_run_id,
+                    "iteration": result.get("iteration", 0),
+                    "request_name": item.name,
+                    "request_url": result.get("request", {}).get("url", {}).get("raw", ""),
+                    "request_method": result.get("request", {}).get("method", ""),
+                    "request_headers": result.get("request", {}).get("header", []),
+                    "request_body": result.get("request", {}).get("body", {}).get("raw", ""),
+                    "response_status": result.get("response", {}).get("code"),
+                    "response_headers": result.get("response", {}).get("header", []),
+                    "response_body": result.get("response", {}).get("body", ""),
+                    "test_status": result.get("test", {}).get("status", "failed"),
+                    "test_message": result.get("test", {}).get("message", ""),
+                    "test_script": result.get("test", {}).get("script", ""),
+                    "test_script_result": result.get("test", {}).get("result", ""),
+                    "start_time": datetime.fromtimestamp(result.get("startedAt", 0) / 1000),
+                    "end_time": datetime.fromtimestamp(result.get("endedAt", 0) / 1000),
+                    "duration": int(result.get("endedAt", 0) - result.get("startedAt", 0))
                 }
+                # 일괄 기록기로 전달 (전용 세션에서 묶어서 INSERT)
+                await result_writer.write(test_result)
                 
-                # Newman 실행
-                runner = newman.Newman(options)
-                
-                # 테스트 진행 상황 모니터링
-                async def on_test_start(item):
-                    await self._send_test_event("test_item_started", {
-                        "test_run_id": test_run.test_run_id,
-                        "item_name": item.get("name", "Unknown Request"),
-                        "start_time": datetime.now().isoformat()
-                    })
-                
-                async def on_test_end(item, result):
-                    test_result = TestResult(
-                        test_run_id=test_run.test_run_id,
-                        request_name=item.get("name", "Unknown Request"),
-                        request_url=result.get("request", {}).get("url", {}).get("raw", ""),
-                        request_method=result.get("request", {}).get("method", ""),
-                        request_headers=result.get("request", {}).get("header", []),
-                        request_body=result.get("request", {}).get("body", {}).get("raw", ""),
-                        response_status=result.get("response", {}).get("code"),
-                        response_headers=result.get("response", {}).get("header", []),
-                        response_body=result.get("response", {}).get("body", ""),
-                        test_status="passed" if result.get("test", {}).get("status") == "passed" else "failed",
-                        test_message=result.get("test", {}).get("message", ""),
-                        test_script=result.get("test", {}).get("script", ""),
-                        test_script_result=result.get("test", {}).get("result", ""),
-                        start_time=datetime.fromtimestamp(result.get("startedAt", 0) / 1000),
-                        end_time=datetime.fromtimestamp(result.get("endedAt", 0) / 1000),
-                        duration=result.get("endedAt", 0) - result.get("startedAt", 0)
-                    )
-                    db.add(test_result)
-                    await db.commit()
-                    
-                    await self._send_test_event("test_item_completed", {
-                        "test_run_id": test_run.test_run_id,
-                        "item_name": item.get("name", "Unknown Request"),
-                        "test_status": test_result.test_status,
-                        "test_message": test_result.test_message,
-                        "duration": test_result.duration,
-                        "end_time": test_result.end_time.isoformat()
-                    })
-                
-                runner.on("test_start", on_test_start)
-                runner.on("test_end", on_test_end)
-                
-                summary = await runner.run()
-                
-                # 결과 처리
-                test_run.status = "completed" if summary.get("run", {}).get("failures", []) == [] else "failed"
-                test_run.end_time = datetime.now()
-                
-                # 테스트 결과 통계 업데이트
-                run_summary = summary.get("run", {})
-                test_run.total_tests = run_summary.get("stats", {}).get("total", 0)
-                test_run.passed_tests = run_summary.get("stats", {}).get("assertions", {}).get("total", 0)
-                test_run.failed_tests = run_summary.get("stats", {}).get("assertions", {}).get("failed", 0)
-                test_run.skipped_tests = run_summary.get("stats", {}).get("assertions", {}).get("skipped", 0)
-                
-                await db.commit()
+                progress["completed"] += 1
+                if test_result["test_status"] in progress:
+                    progress[test_result["test_status"]] += 1
                 
-                # 테스트 완료 이벤트 전송
-                await self._send_test_event("test_completed", {
+                await self._send_test_event("test_item_completed", test_run, {
                     "test_run_id": test_run.test_run_id,
-                    "status": test_run.status,
-                    "total_tests": test_run.total_tests,
-                    "passed_tests": test_run.passed_tests,
-                    "failed_tests": test_run.failed_tests,
-                    "skipped_tests": test_run.skipped_tests,
-                    "end_time": test_run.end_time.isoformat()
+                    "item_name": test_result["request_name"],
+                    "iteration": test_result["iteration"],
+                    "test_status": test_result["test_status"],
+                    "test_message": test_result["test_message"],
+                    "duration": test_result["duration"],
+                    "end_time": test_result["end_time"].isoformat()
                 })
-                
+            
+            async def on_iteration_end(iteration_summary):
+                await self._send_test_event("test_iteration_completed", test_run, {
+                    "test_run_id": test_run.test_run_id,
+                    "iteration": iteration_summary["iteration"],
+                    "status": "failed" if iteration_summary["failures"] else "completed",
+                    "total_tests": iteration_summary["total"],
+                    "passed_tests": iteration_summary["passed"],
+                    "failed_tests": iteration_summary["failed"],
+                    "skipped_tests": iteration_summary["skipped"]
+                })
+            
+            async def report_progress():
+                interval = settings.TEST_PROGRESS_INTERVAL_MS / 1000
+                while True:
+                    await asyncio.sleep(interval)
+                    await self._send_test_event(
+                        "test_progress", test_run, self._progress_snapshot(test_run, progress, started)
+                    )
+            
+            runner.on("run_start", on_run_start)
+            runner.on("test_start", on_test_start)
+            runner.on("test_end", on_test_end)
+            runner.on("iteration_end", on_iteration_end)
+            
+            progress_task = None
+            if settings.TEST_PROGRESS_INTERVAL_MS > 0:
+                progress_task = asyncio.create_task(report_progress())
+            try:
+                summary = await runner.run(
+                    concurrency=concurrency,
+                    iteration_concurrency=iteration_concurrency,
+                    shards=shards
+                )
+            finally:
+                if progress_task:
+                    progress_task.cancel()
+            
+            # 남은 결과 기록 완료 대기
+            await result_writer.flush()
+            
+            # 결과 처리
+            test_run.status = "completed" if not summary["failures"] else "failed"
+            test_run.end_time = datetime.now()
+            
+            # 테스트 결과 통계 업데이트
+            test_run.total_tests = summary["total"]
+            test_run.passed_tests = summary["passed"]
+            test_run.failed_tests = summary["failed"]
+            test_run.skipped_tests = summary["skipped"]
+            
+            # 기록하지 못한 결과가 있으면 통계와 저장된 결과가 다르므로 실패 처리
+            unsaved = result_writer.pop_failures(test_run.test_run_id)
+            if unsaved:
+                raise RuntimeError(f"Failed to store {unsaved} of {summary['total']} test results")
+            
+            await db.commit()
+            
+            # 테스트 완료 이벤트 전송
+            await self._send_test_event("test_completed", test_run, {
+                "test_run_id": test_run.test_run_id,
+                "status": test_run.status,
+                "total_tests": test_run.total_tests,
+                "passed_tests": test_run.passed_tests,
+                "failed_tests": test_run.failed_tests,
+                "skipped_tests": test_run.skipped_tests,
+                "end_time": test_run.end_time.isoformat()
+            })
+            
         except Exception as e:
             logger.error(f"Error executing test: {str(e)}")
+            try:
+                await result_writer.flush()
+            except RuntimeError as flush_error:
+                logger.error(f"Error flushing test results: {str(flush_error)}")
+            result_writer.pop_failures(test_run.test_run_id)
             test_run.status = "failed"
             test_run.end_time = datetime.now()
             await db.commit()
             
             # 테스트 실패 이벤트 전송
-            await self._send_test_event("test_failed", {
+            await self._send_test_event("test_failed", test_run, {
                 "test_run_id": test_run.test_run_id,
                 "error": str(e),
                 "end_time": test_run.end_time.isoformat()
             })
     
-    async def _send_test_event(self, event_type: str, data: Dict[str, Any]):
+    def _progress_snapshot(self, test_run: TestRun, progress: Dict[str, int], started: float) -> Dict[str, Any]:
+        """
+        테스트 진행 상황 스냅샷 생성
+        
+        :param test_run: 테스트 실행 객체
+        :param progress: 진행 상황 집계
+        :param started: 실행 시작 시각 (이벤트 루프 시간)
+        :return: 완료 수, 처리량(초당 요청 수), 예상 남은 시간(초)
+        """
+        elapsed = asyncio.get_running_loop().time() - started
+        throughput = progress["completed"] / elapsed if elapsed > 0 else 0
+        remaining = max(progress["expected"] - progress["completed"], 0)
+        return {
+            "test_run_id": test_run.test_run_id,
+            "total_tests": progress["expected"],
+            "completed_tests": progress["completed"],
+            "passed_tests": progress["passed"],
+            "failed_tests": progress["failed"],
+            "skipped_tests": progress["skipped"],
+            "elapsed_seconds": round(elapsed, 3),
+            "throughput": round(throughput, 2),
+            "eta_seconds": round(remaining / throughput, 1) if throughput > 0 else None
+        }
+    
+    async def _send_test_event(self, event_type: str, test_run: TestRun, data: Dict[str, Any]):
         """
-        테스트 이벤트 전송
+        테스트 이벤트 전송 (해당 실행/Collection/사용자 토픽 구독자에게만 전달, 실행별 seq 부여)
         
         :param event_type: 이벤트 타입
+        :param test_run: 이벤트가 속한 테스트 실행
         :param data: 이벤트 데이터
         """
         try:
             event = mcp_protocol.create_event(event_type, data)
-            await mcp_handler.connection_manager.broadcast(event)
+            await event_bus.publish([
+                make_topic("test_run", test_run.test_run_id),
+                make_topic("collection", test_run.collection_id),
+                make_topic("user", test_run.user_id)
+            ], event, stream=test_run.test_run_id, final=event_type in TERMINAL_EVENTS)
         except Exception as e:
             logger.error(f"Error sending test event: {str(e)}")
     
@@ -262,7 +412,8 @@ class TestHandler:
         self,
         db: AsyncSession,
         test_run_id: int,
-        user_id: int
+        user_id: int,
+        iteration: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         테스트 실행 결과 조회
@@ -270,6 +421,7 @@ class TestHandler:
         :param db: 데이터베이스 세션
         :param test_run_id: 테스트 실행 ID
         :param user_id: 사용자 ID
+        :param iteration: 반복 회차 (선택, 지정 시 해당 회차 결과만 조회)
         :return: 테스트 실행 결과
         """
         try:
@@ -290,9 +442,25 @@ class TestHandler:
             
             # 테스트 결과 조회
             query = select(TestResult).where(TestResult.test_run_id == test_run_id)
+            if iteration is not None:
+                query = query.where(TestResult.iteration == iteration)
             result = await db.execute(query)
             test_results = result.scalars().all()
             
+            # 반복 회차별 통과/실패 집계
+            iteration_query = (
+                select(TestResult.iteration, TestResult.test_status, func.count())
+                .where(TestResult.test_run_id == test_run_id)
+                .group_by(TestResult.iteration, TestResult.test_status)
+            )
+            iterations: Dict[int, Dict[str, Any]] = {}
+            for iteration_no, test_status, count in (await db.execute(iteration_query)).all():
+                summary = iterations.setdefault(iteration_no, {
+                    "iteration": iteration_no, "total": 0, "passed": 0, "failed": 0, "skipped": 0
+                })
+                summary["total"] += count
+                summary[test_status] = summary.get(test_status, 0) + count
+            
             return {
                 "status": "success",
                 "test_run": {
@@ -308,9 +476,11 @@ class TestHandler:
                     "failed_tests": test_run.failed_tests,
                     "skipped_tests": test_run.skipped_tests
                 },
+                "iterations": [iterations[key] for key in sorted(iterations)],
                 "test_results": [
                     {
                         "test_result_id": tr.test_result_id,
+                        "iteration": tr.iteration,
                         "request_name": tr.request_name,
                         "request_url": tr.request_url,
                         "request_method": tr.request_method,
@@ -0,0 +1,260 @@
+from typing import Dict, Any, Optional
+import asyncio
+import logging
+from datetime import datetime
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.db.init_db import async_session
+from app.models.test_run import TestRun, TestResult, TestRunQueue
+
+logger = logging.getLogger(__name__)
+
+class TestScheduler:
+    """
+    테스트 실행 대기열 스케줄러
+
+    실행 요청은 test_run_queue 테이블에 저장되고, 스케줄러가 전체/사용자별 동시 실행 한도 안에서
+    우선순위(높은 값 먼저)와 대기 순서대로 꺼내 실행한다.
+    서버 재시작 시 실행 중이던 항목은 다시 대기열로 돌아간다.
+    """
+
+    def __init__(self):
+        # 실행 중인 태스크 (test_run_id -> Task)
+        self.running: Dict[int, asyncio.Task] = {}
+        # 사용자별 실행 중인 테스트 수
+        self.running_per_user: Dict[int, int] = {}
+        self._wakeup = asyncio.Event()
+        self._loop_task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """
+        스케줄러 시작 (중단된 실행 복구 포함)
+        """
+        async with async_session() as db:
+            interrupted = (await db.execute(
+                select(TestRunQueue.test_run_id).where(TestRunQueue.status == "running")
+            )).scalars().all()
+            if interrupted:
+                # 부분적으로 기록된 결과를 지우고 다시 대기열에 넣음
+                await db.execute(delete(TestResult).where(TestResult.test_run_id.in_(interrupted)))
+                await db.execute(
+                    update(TestRunQueue)
+                    .where(TestRunQueue.test_run_id.in_(interrupted))
+                    .values(status="queued", started_at=None)
+                )
+                await db.execute(
+                    update(TestRun).where(TestRun.test_run_id.in_(interrupted)).values(status="queued")
+                )
+                await db.commit()
+                logger.info(f"Re-queued {len(interrupted)} interrupted test runs")
+
+        self._loop_task = asyncio.create_task(self._run_loop())
+
+    async def stop(self):
+        """
+        스케줄러 종료 (실행 중인 항목은 다음 시작 시 복구됨)
+        """
+        if self._loop_task:
+            self._loop_task.cancel()
+            self._loop_task = None
+        for task in list(self.running.values()):
+            task.cancel()
+        await asyncio.gather(*self.running.values(), return_exceptions=True)
+
+    async def enqueue(
+        self,
+        db: AsyncSession,
+        test_run: TestRun,
+        priority: int,
+        options: Dict[str, Any]
+    ) -> int:
+        """
+        테스트 실행 대기열 등록 (커밋은 호출한 쪽에서 테스트 실행과 함께 수행)
+
+        커밋 후 notify() 를 호출하면 다음 폴링 주기를 기다리지 않고 바로 실행된다.
+
+        :param db: 데이터베이스 세션
+        :param test_run: 대기 상태로 생성되어 flush 된 테스트 실행 객체
+        :param priority: 우선순위 (값이 클수록 먼저 실행)
+        :param options: 실행 옵션
+        :return: 대기열 위치 (1부터)
+        """
+        entry = TestRunQueue(
+            test_run_id=test_run.test_run_id,
+            user_id=test_run.user_id,
+            priority=priority,
+            status="queued",
+            options=options,
+            enqueued_at=datetime.now()
+        )
+        db.add(entry)
+        await db.flush()
+
+        # 앞선 대기 항목 수
+        ahead = await db.scalar(
+            select(func.count()).select_from(TestRunQueue).where(
+                TestRunQueue.status == "queued",
+                (TestRunQueue.priority > priority)
+                | ((TestRunQueue.priority == priority) & (TestRunQueue.queue_id < entry.queue_id))
+            )
+        )
+        return ahead + 1
+
+    def notify(self):
+        """
+        대기열 처리 루프 깨우기 (새 대기 항목 커밋 후 호출)
+        """
+        self._wakeup.set()
+
+    async def _run_loop(self):
+        """
+        대기열 처리 루프
+        """
+        while True:
+            try:
+                await self._dispatch()
+            except Exception as e:
+                logger.error(f"Error dispatching queued test runs: {str(e)}")
+
+            # 새 요청/실행 종료 알림 또는 주기적 폴링
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=settings.TEST_QUEUE_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def _dispatch(self):
+        """
+        실행 한도 안에서 대기 항목 실행
+
+        사용자별 한도에 도달한 사용자의 항목은 SQL 에서 제외하고,
+        빈 실행 슬롯이 남아 있으면 TEST_QUEUE_SCAN_LIMIT 단위로 다음 항목을 계속 조회한다.
+        """
+        free = settings.TEST_MAX_CONCURRENT_RUNS - len(self.running)
+        if free <= 0:
+            return
+
+        async with async_session() as db:
+            started = []
+            # 마지막으로 조회한 항목 (priority, queue_id)
+            last = None
+
+            while free > 0:
+                saturated = [
+                    user_id for user_id, count in self.running_per_user.items()
+                    if count >= settings.TEST_MAX_RUNS_PER_USER
+                ]
+                query = select(TestRunQueue).where(TestRunQueue.status == "queued")
+                if saturated:
+                    query = query.where(TestRunQueue.user_id.not_in(saturated))
+                if last:
+                    query = query.where(
+                        (TestRunQueue.priority < last[0])
+                        | ((TestRunQueue.priority == last[0]) & (TestRunQueue.queue_id > last[1]))
+                    )
+                query = (
+                    query
+                    .order_by(TestRunQueue.priority.desc(), TestRunQueue.queue_id)
+                    .limit(settings.TEST_QUEUE_SCAN_LIMIT)
+                )
+                entries = (await db.execute(query)).scalars().all()
+                if not entries:
+                    break
+
+                for entry in entries:
+                    if free <= 0:
+                        break
+                    if self.running_per_user.get(entry.user_id, 0) >= settings.TEST_MAX_RUNS_PER_USER:
+                        continue
+                    entry.status = "running"
+                    entry.started_at = datetime.now()
+                    self.running_per_user[entry.user_id] = self.running_per_user.get(entry.user_id, 0) + 1
+                    started.append((entry.queue_id, entry.test_run_id, entry.user_id, entry.options or {}))
+                    free -= 1
+                last = (entries[-1].priority, entries[-1].queue_id)
+
+            if not started:
+                return
+            await db.commit()
+
+        for queue_id, test_run_id, user_id, options in started:
+            self.running[test_run_id] = asyncio.create_task(
+                self._execute(queue_id, test_run_id, user_id, options)
+            )
+
+    async def _execute(self, queue_id: int, test_run_id: int, user_id: int, options: Dict[str, Any]):
+        """
+        대기 항목 실행 후 완료 처리
+        """
+        # 순환 import 방지
+        from app.core.test_handler import test_handler
+
+        # 서버 종료로 취소된 경우(CancelledError) 대기열 상태를 유지하여 재시작 시 복구
+        try:
+            try:
+                await test_handler.execute_queued_run(test_run_id, options)
+            except Exception as e:
+                logger.error(f"Error executing queued test run {test_run_id}: {str(e)}")
+
+            async with async_session() as db:
+                await db.execute(
+                    update(TestRunQueue)
+                    .where(TestRunQueue.queue_id == queue_id)
+                    .values(status="done", finished_at=datetime.now())
+                )
+                await db.commit()
+        finally:
+            self.running.pop(test_run_id, None)
+            self.running_per_user[user_id] -= 1
+            if self.running_per_user[user_id] <= 0:
+                del self.running_per_user[user_id]
+            self._wakeup.set()
+
+    async def get_queue_status(self, db: AsyncSession, user_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        대기열 상태 조회
+
+        :param db: 데이터베이스 세션
+        :param user_id: 사용자 ID (선택, 지정 시 사용자별 현황 포함)
+        :return: 대기열 깊이, 실행 수, 대기 시간 통계
+        """
+        now = datetime.now()
+        queued, oldest = (await db.execute(
+            select(func.count(), func.min(TestRunQueue.enqueued_at)).where(TestRunQueue.status == "queued")
+        )).one()
+
+        # 최근 시작된 실행의 평균 대기 시간
+        recent = (await db.execute(
+            select(TestRunQueue.enqueued_at, TestRunQueue.started_at)
+            .where(TestRunQueue.started_at.is_not(None))
+            .order_by(TestRunQueue.started_at.desc())
+            .limit(100)
+        )).all()
+        waits = [(started - enqueued).total_seconds() for enqueued, started in recent if enqueued]
+
+        status = {
+            "queued": queued,
+            "running": len(self.running),
+            "max_concurrent_runs": settings.TEST_MAX_CONCURRENT_RUNS,
+            "max_runs_per_user": settings.TEST_MAX_RUNS_PER_USER,
+            "oldest_wait_seconds": (now - oldest).total_seconds() if oldest else 0,
+            "average_wait_seconds": sum(waits) / len(waits) if waits else 0
+        }
+
+        if user_id is not None:
+            user_queued = await db.scalar(
+                select(func.count()).select_from(TestRunQueue).where(
+                    TestRunQueue.status == "queued", TestRunQueue.user_id == user_id
+                )
+            )
+            status["user"] = {
+                "queued": user_queued,
+                "running": self.running_per_user.get(user_id, 0)
+            }
+
+        return status
+
+# 싱글톤 인스턴스
+test_scheduler = TestScheduler()
@@ -1,16 +1,86 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from typing import List
+from sqlalchemy import event, inspect, text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
 from app.db.base import Base
 
+def sqlite_pragmas(profile: str) -> List[str]:
+    """저장소 프로파일에 해당하는 SQLite PRAGMA 목록"""
+    if profile != "performance":
+        # SQLite 기본 설정 사용
+        return []
+    return [
+        f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}",
+        f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}",
+        f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}",
+        f"PRAGMA cache_size={settings.SQLITE_CACHE_SIZE}",
+        f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA temp_store={settings.SQLITE_TEMP_STORE}",
+    ]
+
+def create_db_engine(database_url: str, profile: str) -> AsyncEngine:
+    """저장소 프로파일을 적용한 비동기 엔진 생성"""
+    options = {"echo": settings.DB_ECHO}
+    # 메모리 DB 는 단일 연결(StaticPool)을 사용하므로 풀 설정 제외
+    if ":memory:" not in database_url:
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+    new_engine = create_async_engine(database_url, **options)
+
+    if database_url.startswith("sqlite"):
+        pragmas = sqlite_pragmas(profile)
+
+        # 연결마다 PRAGMA 적용
+        @event.listens_for(new_engine.sync_engine, "connect")
+        def _apply_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
+
+    return new_engine
+
 # 비동기 엔진 생성
-engine = create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG)
+engine = create_db_engine(settings.DATABASE_URL, settings.DB_STORAGE_PROFILE)
 
 # 비동기 세션 팩토리 생성
 async_session = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
+def _add_missing_columns(connection):
+    """기존 테이블에 새로 추가된 컬럼 반영 (SQLite ALTER TABLE ADD COLUMN)"""
+    inspector = inspect(connection)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            ddl = f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column.type.compile(connection.dialect)}'
+            if column.server_default is not None:
+                ddl += f" DEFAULT {column.server_default.arg}"
+            connection.execute(text(ddl))
+            print(f"Added column {table.name}.{column.name}")
+
+def _create_missing_indexes(connection):
+    """기존 데이터베이스에 누락된 인덱스 생성"""
+    inspector = inspect(connection)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            index.create(connection)
+            print(f"Created index {index.name}")
+
 async def init_db():
     """데이터베이스 초기화 함수"""
     try:
@@ -18,6 +88,10 @@ async def init_db():
         async with engine.begin() as conn:
             # 테이블 생성
             await conn.run_sync(Base.metadata.create_all)
+            # 기존 데이터베이스에 누락된 컬럼 추가
+            await conn.run_sync(_add_missing_columns)
+            # 기존 데이터베이스에 누락된 인덱스 추가
+            await conn.run_sync(_create_missing_indexes)
         print("Database initialized successfully")
     except Exception as e:
         print(f"Error initializing database: {e}")
@@ -7,6 +7,11 @@ from pathlib import Path
 
 from app.config import settings
 from app.db.init_db import init_db
+from app.core.collection_runner import close_http_client
+from app.core.shard_executor import shutdown_shard_pool
+from app.core.test_scheduler import test_scheduler
+from app.core.result_writer import result_writer
+from app.core.job_manager import job_manager
 from app.api.api_v1.api import api_router
 from app.api.api_v1.endpoints.ui import router as ui_router
 
@@ -35,11 +40,22 @@ app.include_router(ui_router)  # UI 라우터
 @app.on_event("startup")
 async def startup_event():
     await init_db()
+    await result_writer.start()
+    await test_scheduler.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await test_scheduler.stop()
+    await job_manager.stop()
+    await result_writer.stop()
+    await close_http_client()
+    shutdown_shard_pool()
 
 if __name__ == "__main__":
     uvicorn.run(
         "app.main:app",
         host=settings.SERVER_HOST,
         port=settings.SERVER_PORT,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        ws_per_message_deflate=settings.MCP_WS_PER_MESSAGE_DEFLATE
     )
@@ -1 +1,3 @@
-# Database model modules
\ No newline at end of file
+# Database model modules
+# 문자열로 참조되는 관계가 매퍼 구성 시 해석되도록 모든 모델을 등록
+from app.models import user, api, collection, test, postman, test_run  # noqa: F401
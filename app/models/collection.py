@@ -9,6 +9,7 @@ class ApiTestCollection(Base):
     name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     user_id = Column(Integer, ForeignKey("user.user_id"), nullable=True)
+    version = Column(Integer, nullable=False, default=1, server_default="1")  # 재업로드 시 증가
     
     # 관계 정의
     user = relationship("User", back_populates="collections")
@@ -19,6 +20,8 @@ class CollectionTestCase(Base):
     
     collection_id = Column(Integer, ForeignKey("api_test_collection.collection_id"), primary_key=True)
     test_case_id = Column(Integer, ForeignKey("api_test_case.test_case_id"), primary_key=True)
+    item_key = Column(String, nullable=True)  # Postman item 식별자 (item id 또는 경로)
+    content_hash = Column(String, nullable=True)  # 정규화한 request/script 해시
     
     # 관계 정의
     collection = relationship("ApiTestCollection", back_populates="test_cases")
@@ -10,9 +10,10 @@ class PostmanCollection(Base):
     name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     collection_data = Column(JSON, nullable=False)  # Postman Collection JSON
+    version = Column(Integer, nullable=False, default=1, server_default="1")  # 재업로드 시 증가
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
-    user_id = Column(Integer, ForeignKey("user.user_id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("user.user_id"), nullable=False, index=True)
     
     # 관계 정의
     user = relationship("User", back_populates="postman_collections")
@@ -29,7 +30,7 @@ class PostmanEnvironment(Base):
     environment_data = Column(JSON, nullable=False)  # Postman Environment JSON
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
-    collection_id = Column(Integer, ForeignKey("postman_collection.collection_id"), nullable=False)
+    collection_id = Column(Integer, ForeignKey("postman_collection.collection_id"), nullable=False, index=True)
     
     # 관계 정의
     collection = relationship("PostmanCollection", back_populates="environments")
@@ -44,7 +45,7 @@ class PostmanTestData(Base):
     test_data = Column(JSON, nullable=False)  # Postman Test Data JSON
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
-    collection_id = Column(Integer, ForeignKey("postman_collection.collection_id"), nullable=False)
+    collection_id = Column(Integer, ForeignKey("postman_collection.collection_id"), nullable=False, index=True)
     
     # 관계 정의
     collection = relationship("PostmanCollection", back_populates="test_data")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON, Boolean
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON, Boolean, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.base import Base
@@ -8,6 +8,12 @@ class TestRun(Base):
     테스트 실행 결과 모델
     """
     __tablename__ = "test_run"
+    __table_args__ = (
+        # 사용자별 실행 목록 (최신순 keyset)
+        Index("ix_test_run_user_id_test_run_id", "user_id", "test_run_id"),
+        # 사용자별 시작 시각 필터
+        Index("ix_test_run_user_id_start_time", "user_id", "start_time"),
+    )
     
     test_run_id = Column(Integer, primary_key=True, autoincrement=True)
     collection_id = Column(Integer, ForeignKey("postman_collection.collection_id"), nullable=False)
@@ -15,7 +21,7 @@ class TestRun(Base):
     test_data_id = Column(Integer, ForeignKey("postman_test_data.test_data_id"), nullable=True)
     user_id = Column(Integer, ForeignKey("user.user_id"), nullable=False)
     
-    status = Column(String, nullable=False)  # running, completed, failed
+    status = Column(String, nullable=False)  # queued, running, completed, failed
     start_time = Column(DateTime, default=func.now())
     end_time = Column(DateTime, nullable=True)
     total_tests = Column(Integer, default=0)
@@ -27,17 +33,23 @@ class TestRun(Base):
     collection = relationship("PostmanCollection", back_populates="test_runs")
     environment = relationship("PostmanEnvironment", back_populates="test_runs")
     test_data = relationship("PostmanTestData", back_populates="test_runs")
-    user = relationship("User", back_populates="test_runs")
+    user = relationship("User", back_populates="postman_test_runs")
     test_results = relationship("TestResult", back_populates="test_run", cascade="all, delete-orphan")
+    queue_entry = relationship("TestRunQueue", back_populates="test_run", uselist=False, cascade="all, delete-orphan")
 
 class TestResult(Base):
     """
     개별 테스트 결과 모델
     """
     __tablename__ = "test_result"
+    __table_args__ = (
+        # 실행별 결과 조회 및 상태별 집계
+        Index("ix_test_result_test_run_id_test_status", "test_run_id", "test_status"),
+    )
     
     test_result_id = Column(Integer, primary_key=True, autoincrement=True)
     test_run_id = Column(Integer, ForeignKey("test_run.test_run_id"), nullable=False)
+    iteration = Column(Integer, nullable=False, default=0, server_default="0")  # 데이터 반복 회차 (0부터)
     
     request_name = Column(String, nullable=False)
     request_url = Column(String, nullable=False)
@@ -59,4 +71,29 @@ class TestResult(Base):
     duration = Column(Integer, nullable=True)  # 밀리초 단위
     
     # 관계 정의
-    test_run = relationship("TestRun", back_populates="test_results") 
\ No newline at end of file
+    test_run = relationship("TestRun", back_populates="test_results") 
+
+class TestRunQueue(Base):
+    """
+    테스트 실행 대기열 모델
+    """
+    __tablename__ = "test_run_queue"
+    __table_args__ = (
+        # 스케줄러의 대기 항목 조회
+        Index("ix_test_run_queue_status_priority", "status", "priority", "queue_id"),
+    )
+    
+    queue_id = Column(Integer, primary_key=True, autoincrement=True)
+    test_run_id = Column(Integer, ForeignKey("test_run.test_run_id"), nullable=False, unique=True)
+    user_id = Column(Integer, ForeignKey("user.user_id"), nullable=False)
+    
+    priority = Column(Integer, nullable=False, default=0)  # 값이 클수록 먼저 실행
+    status = Column(String, nullable=False, default="queued")  # queued, running, done
+    options = Column(JSON, nullable=True)  # concurrency, iteration_concurrency, shards
+    
+    enqueued_at = Column(DateTime, default=func.now())
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    
+    # 관계 정의
+    test_run = relationship("TestRun", back_populates="queue_entry")
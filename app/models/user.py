@@ -14,3 +14,4 @@ class User(Base):
     collections = relationship("ApiTestCollection", back_populates="user")
     test_runs = relationship("ApiTestRun", back_populates="user")
     postman_collections = relationship("PostmanCollection", back_populates="user")
+    postman_test_runs = relationship("TestRun", back_populates="user")
@@ -1,11 +1,13 @@
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, BinaryIO, Tuple, Union
+from sqlalchemy import bindparam, delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.crud.crud_api import api_info, api_test_case, api_test_data
-from app.crud.crud_collection import api_test_collection, collection_test_case
-from app.schemas.api import ApiInfoCreate, ApiTestCaseCreate, ApiTestDataCreate
-from app.schemas.collection import ApiTestCollectionCreate, CollectionTestCaseCreate
+from app.config import settings
+from app.core.postman_reader import CollectionReader, ItemKeys, item_hash, join_path
+from app.models.api import ApiInfo, ApiTestCase, ApiTestData
+from app.models.collection import ApiTestCollection, CollectionTestCase
+from app.models.test import ApiTestRun, ApiTestResult
 
 class PostmanParser:
     """
@@ -15,80 +17,304 @@ class PostmanParser:
     async def parse_and_save(
         self, 
         db: AsyncSession, 
-        collection_json: Dict[str, Any],
+        collection_json: Union[Dict[str, Any], BinaryIO],
         environment_json: Optional[Dict[str, Any]] = None,
-        data_json: Optional[Dict[str, Any]] = None
+        data_json: Optional[Dict[str, Any]] = None,
+        collection_id: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Postman 파일을 파싱하고 DB에 저장
+        
+        요청 item 을 POSTMAN_IMPORT_BATCH_SIZE 개씩 메모리에서 행으로 만든 뒤 테이블별 일괄 INSERT/UPDATE 하며,
+        전체는 하나의 트랜잭션에서 저장한다.
+        생성된 ID 는 INSERT ... RETURNING 으로 입력 순서대로 받아 다음 테이블의 외래키로 사용한다.
+        업로드 파일 객체를 넘기면 Collection 전체를 메모리에 올리지 않고 스트리밍으로 처리한다.
+        
+        collection_id 를 지정하면 기존 Collection 의 재업로드로 처리한다.
+        item 식별자(item id 또는 경로)와 내용 해시를 비교하여 바뀐 item 만 추가/수정/삭제하고 버전을 올린다.
+        
+        :param db: 데이터베이스 세션
+        :param collection_json: Collection JSON 또는 업로드 파일 객체
+        :param environment_json: Environment JSON (선택)
+        :param data_json: Data JSON (선택)
+        :param collection_id: 재업로드할 Collection ID (선택)
+        :return: 저장 결과
         """
         # 결과 저장용 객체
         result = {
             "collection_info": {},
             "api_count": 0,
-            "test_case_count": 0
+            "test_case_count": 0,
+            "version": 1,
+            "inserted": 0,
+            "updated": 0,
+            "deleted": 0,
+            "unchanged": 0
         }
         
-        # Collection 정보 확인
-        collection_info = collection_json.get("info", {})
-        collection_name = collection_info.get("name", "Unnamed Collection")
-        collection_description = collection_info.get("description", "")
+        reader = CollectionReader(collection_json)
+        keys = ItemKeys()
+        # 기존 item (item 식별자 -> 테스트 케이스 ID, API ID, 내용 해시)
+        existing: Dict[str, Tuple[int, int, Optional[str]]] = {}
+        inserts: List[Dict[str, Any]] = []
+        updates: List[Dict[str, Any]] = []
         
-        # Collection 객체 생성
-        collection_data = ApiTestCollectionCreate(
-            name=collection_name,
-            description=collection_description,
-            user_id=None  # 임시적으로 null, 추후 인증 구현 시 변경
-        )
-        db_collection = await api_test_collection.create(db, obj_in=collection_data)
+        # 재업로드 여부 (새 Collection 은 버전 1)
+        reupload = collection_id is not None
         
+        try:
+            if reupload:
+                if await db.get(ApiTestCollection, collection_id) is None:
+                    raise ValueError(f"Collection {collection_id} not found")
+                existing, stale = await self._load_items(db, collection_id)
+            else:
+                stale = []
+            
+            # Collection에서 Item 추출
+            for parent_path, item in reader:
+                result["api_count"] += 1
+                path_name = join_path([parent_path, item.get("name", "Unnamed Request")])
+                key = keys.key(path_name, item)
+                digest = item_hash(item)
+                current = existing.pop(key, None)
+                
+                # 내용이 같은 item 은 건너뜀
+                if current and current[2] == digest:
+                    result["unchanged"] += 1
+                    continue
+                
+                request = self._process_request(item, parent_path)
+                request["link"] = {"item_key": key, "content_hash": digest}
+                if current:
+                    request["test_case_id"], request["api_id"] = current[0], current[1]
+                    updates.append(request)
+                else:
+                    inserts.append(request)
+                
+                if len(inserts) >= settings.POSTMAN_IMPORT_BATCH_SIZE:
+                    collection_id = await self._ensure_collection(db, collection_id, reader.info)
+                    await self._save_requests(db, collection_id, inserts)
+                    result["inserted"] += len(inserts)
+                    inserts = []
+                if len(updates) >= settings.POSTMAN_IMPORT_BATCH_SIZE:
+                    await self._update_requests(db, collection_id, updates)
+                    result["updated"] += len(updates)
+                    updates = []
+            
+            collection_id = await self._ensure_collection(db, collection_id, reader.info)
+            if inserts:
+                await self._save_requests(db, collection_id, inserts)
+                result["inserted"] += len(inserts)
+            if updates:
+                await self._update_requests(db, collection_id, updates)
+                result["updated"] += len(updates)
+            
+            # 업로드에 없는 item 삭제 (식별자가 없는 이전 형식의 item 포함)
+            removed = [test_case_id for test_case_id, _, _ in existing.values()] + stale
+            if removed:
+                await self._delete_requests(db, collection_id, removed)
+                result["deleted"] = len(removed)
+            
+            # Collection 정보 및 버전 갱신 (새 Collection 도 item 뒤에 나온 info 반영)
+            values = self._collection_values(reader.info)
+            if reupload:
+                values["version"] = ApiTestCollection.version + 1
+            result["version"] = await db.scalar(
+                update(ApiTestCollection)
+                .where(ApiTestCollection.collection_id == collection_id)
+                .values(**values)
+                .returning(ApiTestCollection.version)
+            )
+            
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        
+        collection_values = self._collection_values(reader.info)
         result["collection_info"] = {
-            "id": db_collection.collection_id,
-            "name": db_collection.name,
-            "description": db_collection.description
+            "id": collection_id,
+            "name": collection_values["name"],
+            "description": collection_values["description"]
         }
-        
-        # Collection에서 Item 추출
-        items = collection_json.get("item", [])
-        await self._process_items(db, items, db_collection.collection_id, result, environment_json, data_json)
+        result["test_case_count"] = result["api_count"]
         
         return result
     
-    async def _process_items(
-        self, 
-        db: AsyncSession, 
-        items: List[Dict[str, Any]], 
-        collection_id: int, 
-        result: Dict[str, Any],
-        environment_json: Optional[Dict[str, Any]] = None,
-        data_json: Optional[Dict[str, Any]] = None,
-        parent_path: str = ""
-    ) -> None:
-        """
-        Collection의 각 Item 처리
-        """
-        for item in items:
-            # 중첩 폴더인 경우
-            if "item" in item and isinstance(item["item"], list):
-                folder_name = item.get("name", "")
-                new_path = f"{parent_path}/{folder_name}" if parent_path else folder_name
-                await self._process_items(db, item["item"], collection_id, result, environment_json, data_json, new_path)
-            # API 요청인 경우
-            elif "request" in item:
-                await self._process_request(db, item, collection_id, result, environment_json, data_json, parent_path)
+    def _collection_values(self, info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Collection 정보 확인
+        """
+        return {
+            "name": info.get("name", "Unnamed Collection"),
+            "description": info.get("description", "")
+        }
     
-    async def _process_request(
-        self, 
-        db: AsyncSession, 
-        item: Dict[str, Any], 
-        collection_id: int, 
-        result: Dict[str, Any],
-        environment_json: Optional[Dict[str, Any]] = None,
-        data_json: Optional[Dict[str, Any]] = None,
+    async def _ensure_collection(self, db: AsyncSession, collection_id: Optional[int], info: Dict[str, Any]) -> int:
+        """
+        Collection 생성 (이미 있으면 그대로 반환)
+        """
+        if collection_id is not None:
+            return collection_id
+        return await db.scalar(
+            insert(ApiTestCollection).values(
+                **self._collection_values(info),
+                user_id=None  # 임시적으로 null, 추후 인증 구현 시 변경
+            ).returning(ApiTestCollection.collection_id)
+        )
+    
+    async def _load_items(
+        self,
+        db: AsyncSession,
+        collection_id: int
+    ) -> Tuple[Dict[str, Tuple[int, int, Optional[str]]], List[int]]:
+        """
+        Collection 의 기존 item 조회
+        
+        :return: item 식별자별 (테스트 케이스 ID, API ID, 내용 해시), 식별자가 없는 테스트 케이스 ID 목록
+        """
+        rows = await db.execute(
+            select(
+                CollectionTestCase.item_key,
+                CollectionTestCase.test_case_id,
+                ApiTestCase.api_id,
+                CollectionTestCase.content_hash
+            )
+            .join(ApiTestCase, ApiTestCase.test_case_id == CollectionTestCase.test_case_id)
+            .where(CollectionTestCase.collection_id == collection_id)
+        )
+        existing: Dict[str, Tuple[int, int, Optional[str]]] = {}
+        stale: List[int] = []
+        for item_key, test_case_id, api_id, digest in rows:
+            if item_key is None or item_key in existing:
+                stale.append(test_case_id)
+            else:
+                existing[item_key] = (test_case_id, api_id, digest)
+        return existing, stale
+    
+    async def _save_requests(self, db: AsyncSession, collection_id: int, requests: List[Dict[str, Any]]) -> None:
+        """
+        요청 item 행 일괄 저장
+        """
+        # API 정보 생성
+        api_ids = (await db.scalars(
+            insert(ApiInfo).returning(ApiInfo.api_id, sort_by_parameter_order=True),
+            [request["api"] for request in requests]
+        )).all()
+        
+        # 테스트 케이스 생성
+        test_case_ids = (await db.scalars(
+            insert(ApiTestCase).returning(ApiTestCase.test_case_id, sort_by_parameter_order=True),
+            [dict(request["test_case"], api_id=api_id) for request, api_id in zip(requests, api_ids)]
+        )).all()
+        
+        # Collection에 테스트 케이스 추가
+        await db.execute(
+            insert(CollectionTestCase),
+            [
+                dict(request["link"], collection_id=collection_id, test_case_id=test_case_id)
+                for request, test_case_id in zip(requests, test_case_ids)
+            ]
+        )
+        
+        # 테스트 데이터 생성
+        await db.execute(
+            insert(ApiTestData),
+            [dict(request["test_data"], test_case_id=test_case_id) for request, test_case_id in zip(requests, test_case_ids)]
+        )
+    
+    async def _update_requests(self, db: AsyncSession, collection_id: int, requests: List[Dict[str, Any]]) -> None:
+        """
+        내용이 바뀐 요청 item 행 일괄 수정 (기존 ID 유지)
+        """
+        # API 정보 / 테스트 케이스 수정 (기본키 기준 일괄 UPDATE)
+        await db.execute(
+            update(ApiInfo),
+            [dict(request["api"], api_id=request["api_id"]) for request in requests]
+        )
+        await db.execute(
+            update(ApiTestCase),
+            [dict(request["test_case"], test_case_id=request["test_case_id"]) for request in requests]
+        )
+        
+        # 테스트 데이터 / 내용 해시 수정
+        await db.execute(
+            update(ApiTestData.__table__)
+            .where(ApiTestData.__table__.c.test_case_id == bindparam("b_test_case_id"))
+            .values(request_data=bindparam("b_request_data"), expected_response=bindparam("b_expected_response")),
+            [
+                {
+                    "b_test_case_id": request["test_case_id"],
+                    "b_request_data": request["test_data"]["request_data"],
+                    "b_expected_response": request["test_data"]["expected_response"]
+                }
+                for request in requests
+            ]
+        )
+        await db.execute(
+            update(CollectionTestCase.__table__)
+            .where(
+                CollectionTestCase.__table__.c.collection_id == collection_id,
+                CollectionTestCase.__table__.c.test_case_id == bindparam("b_test_case_id")
+            )
+            .values(item_key=bindparam("b_item_key"), content_hash=bindparam("b_content_hash")),
+            [
+                {
+                    "b_test_case_id": request["test_case_id"],
+                    "b_item_key": request["link"]["item_key"],
+                    "b_content_hash": request["link"]["content_hash"]
+                }
+                for request in requests
+            ]
+        )
+    
+    async def _delete_requests(self, db: AsyncSession, collection_id: int, test_case_ids: List[int]) -> None:
+        """
+        업로드에서 빠진 요청 item 삭제
+        
+        다른 Collection 에도 포함된 테스트 케이스는 이 Collection 과의 연결만 삭제한다.
+        """
+        batch_size = settings.POSTMAN_IMPORT_BATCH_SIZE
+        for start in range(0, len(test_case_ids), batch_size):
+            chunk = test_case_ids[start:start + batch_size]
+            await db.execute(
+                delete(CollectionTestCase).where(
+                    CollectionTestCase.collection_id == collection_id,
+                    CollectionTestCase.test_case_id.in_(chunk)
+                )
+            )
+            shared = set((await db.scalars(
+                select(CollectionTestCase.test_case_id).where(CollectionTestCase.test_case_id.in_(chunk))
+            )).all())
+            orphans = [test_case_id for test_case_id in chunk if test_case_id not in shared]
+            if not orphans:
+                continue
+            
+            # 테스트 케이스에 딸린 행 삭제 (모델의 cascade 와 같은 범위)
+            api_ids = (await db.scalars(
+                select(ApiTestCase.api_id).where(ApiTestCase.test_case_id.in_(orphans))
+            )).all()
+            run_ids = select(ApiTestRun.test_run_id).where(ApiTestRun.test_case_id.in_(orphans))
+            await db.execute(delete(ApiTestResult).where(ApiTestResult.test_run_id.in_(run_ids)))
+            await db.execute(delete(ApiTestRun).where(ApiTestRun.test_case_id.in_(orphans)))
+            await db.execute(delete(ApiTestData).where(ApiTestData.test_case_id.in_(orphans)))
+            await db.execute(delete(ApiTestCase).where(ApiTestCase.test_case_id.in_(orphans)))
+            await db.execute(
+                delete(ApiInfo).where(
+                    ApiInfo.api_id.in_(api_ids),
+                    ~select(ApiTestCase.test_case_id).where(ApiTestCase.api_id == ApiInfo.api_id).exists()
+                )
+            )
+    
+    def _process_request(
+        self,
+        item: Dict[str, Any],
         parent_path: str = ""
-    ) -> None:
+    ) -> Dict[str, Dict[str, Any]]:
         """
         각 API 요청 처리
+        
+        :return: api, test_case, test_data 행 (외래키 제외)
         """
         request = item["request"]
         name = item.get("name", "Unnamed Request")
@@ -114,32 +340,6 @@ class PostmanParser:
                 path = "/". join(url_data.get("path", []))
                 url = f"{host}/{path}" if host and path else host or path
         
-        # API 정보 생성
-        api_data = ApiInfoCreate(
-            name=path_name,
-            method=method,
-            endpoint=url,
-            description=item.get("description", "")
-        )
-        db_api = await api_info.create(db, obj_in=api_data)
-        result["api_count"] += 1
-        
-        # 테스트 케이스 생성
-        test_case_data = ApiTestCaseCreate(
-            api_id=db_api.api_id,
-            title=f"Test {name}",
-            description=f"Automatically generated test case for {path_name}"
-        )
-        db_test_case = await api_test_case.create(db, obj_in=test_case_data)
-        result["test_case_count"] += 1
-        
-        # Collection에 테스트 케이스 추가
-        await collection_test_case.add_test_case_to_collection(
-            db, 
-            collection_id=collection_id, 
-            test_case_id=db_test_case.test_case_id
-        )
-        
         # 요청 및 응답 데이터 처리
         request_body = ""
         if "body" in request:
@@ -165,10 +365,22 @@ class PostmanParser:
             # 기본 응답
             expected_response = '{"status": "success"}'
         
-        # 테스트 데이터 생성
-        test_data = ApiTestDataCreate(
-            test_case_id=db_test_case.test_case_id,
-            request_data=request_body,
-            expected_response=expected_response
-        )
-        await api_test_data.create(db, obj_in=test_data)
+        return {
+            # API 정보
+            "api": {
+                "name": path_name,
+                "method": method,
+                "endpoint": url,
+                "description": item.get("description", "")
+            },
+            # 테스트 케이스
+            "test_case": {
+                "title": f"Test {name}",
+                "description": f"Automatically generated test case for {path_name}"
+            },
+            # 테스트 데이터
+            "test_data": {
+                "request_data": request_body,
+                "expected_response": expected_response
+            }
+        }
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
-import uvicorn
-import ssl
+import argparse
+import asyncio
 import os
 import sys
 from pathlib import Path
@@ -10,9 +10,25 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).resolve().parent))
 
 from app.config import settings
-from scripts.generate_ssl import generate_self_signed_cert
 
 def main():
+    parser = argparse.ArgumentParser(description="MCP 서버")
+    parser.add_argument("--stdio", action="store_true", help="HTTPS/WebSocket 대신 표준 입출력으로 MCP 요청 처리")
+    args = parser.parse_args()
+    
+    if args.stdio:
+        # 로컬 AI Host 가 하위 프로세스로 실행하는 경우 (uvicorn/SSL 설정 생략)
+        from app.core.mcp_stdio import serve_stdio
+        asyncio.run(serve_stdio())
+        return
+    
+    serve_https()
+
+def serve_https():
+    import ssl
+    import uvicorn
+    from scripts.generate_ssl import generate_self_signed_cert
+    
     # SSL 인증서 파일 존재 확인 및 생성
     if not os.path.exists(settings.SSL_CERTFILE) or not os.path.exists(settings.SSL_KEYFILE):
         print("SSL 인증서가 없습니다. 새로 생성합니다...")
@@ -39,7 +55,8 @@ def main():
         host=settings.SERVER_HOST,
         port=settings.SERVER_PORT,
         ssl=ssl_context,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        ws_per_message_deflate=settings.MCP_WS_PER_MESSAGE_DEFLATE
     )
 
 if __name__ == "__main__":
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+from app.db.base import Base
+from app.db.init_db import create_db_engine
+import app.models  # noqa: F401 (테이블 등록)
+from app.models.api import ApiInfo, ApiTestCase, ApiTestData
+from app.models.collection import ApiTestCollection, CollectionTestCase
+from app.core.postman_reader import CollectionReader
+from app.services.postman_parser import PostmanParser
+
+def make_collection(requests: int, folder_size: int = 50) -> dict:
+    """폴더마다 folder_size 개의 요청이 있는 Postman Collection 생성"""
+    folders = []
+    for start in range(0, requests, folder_size):
+        folders.append({
+            "name": f"Folder {start // folder_size}",
+            "item": [
+                {
+                    "name": f"Request {index}",
+                    "request": {
+                        "method": "POST",
+                        "url": {"raw": f"{{{{base_url}}}}/api/items/{index}"},
+                        "body": {"mode": "raw", "raw": '{"id": %d, "name": "item"}' % index}
+                    },
+                    "response": [{"body": '{"status": "success"}'}]
+                }
+                for index in range(start, min(start + folder_size, requests))
+            ]
+        })
+    return {"info": {"name": "Benchmark"}, "item": folders}
+
+async def import_row_by_row(db: AsyncSession, parser: PostmanParser, collection: dict):
+    """요청마다 4개 테이블에 한 행씩 INSERT 후 커밋하는 기존 방식"""
+    collection_id = await db.scalar(
+        insert(ApiTestCollection).values(name="Benchmark").returning(ApiTestCollection.collection_id)
+    )
+    await db.commit()
+    requests = [parser._process_request(item, parent_path) for parent_path, item in CollectionReader(collection)]
+    for request in requests:
+        api_id = await db.scalar(insert(ApiInfo).values(**request["api"]).returning(ApiInfo.api_id))
+        await db.commit()
+        test_case_id = await db.scalar(
+            insert(ApiTestCase).values(api_id=api_id, **request["test_case"]).returning(ApiTestCase.test_case_id)
+        )
+        await db.commit()
+        await db.execute(insert(CollectionTestCase).values(collection_id=collection_id, test_case_id=test_case_id))
+        await db.commit()
+        await db.execute(insert(ApiTestData).values(test_case_id=test_case_id, **request["test_data"]))
+        await db.commit()
+
+async def run_benchmark(profile: str, requests: int, bulk: bool) -> float:
+    """지정한 프로파일/방식으로 Collection 을 저장하고 걸린 시간(초) 반환"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        engine = create_db_engine(f"sqlite+aiosqlite:///{os.path.join(temp_dir, 'bench.db')}", profile)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        parser = PostmanParser()
+        collection = make_collection(requests)
+
+        async with session_factory() as db:
+            started = time.perf_counter()
+            if bulk:
+                result = await parser.parse_and_save(db, collection)
+                assert result["api_count"] == requests
+            else:
+                await import_row_by_row(db, parser, collection)
+            elapsed = time.perf_counter() - started
+
+        await engine.dispose()
+        return elapsed
+
+async def main():
+    parser = argparse.ArgumentParser(description="Postman Collection 가져오기 성능 측정")
+    parser.add_argument("--requests", type=int, default=5000, help="Collection 의 요청 수")
+    parser.add_argument("--row-by-row-requests", type=int, default=500, help="기존 방식으로 측정할 요청 수 (전체 시간은 추정)")
+    args = parser.parse_args()
+
+    print(f"\033[94m요청 {args.requests}개 Collection 가져오기 (초, 기존 방식은 {args.row_by_row_requests}개 측정 후 추정)\033[0m")
+    print("+" + "-" * 14 + "+" + "-" * 16 + "+" + "-" * 16 + "+")
+    print("| " + "profile".ljust(12) + " | " + "row by row".ljust(14) + " | " + "bulk".ljust(14) + " |")
+    print("+" + "-" * 14 + "+" + "-" * 16 + "+" + "-" * 16 + "+")
+    for profile in ("default", "performance"):
+        sample = await run_benchmark(profile, args.row_by_row_requests, bulk=False)
+        row_by_row = sample * args.requests / args.row_by_row_requests
+        bulk = await run_benchmark(profile, args.requests, bulk=True)
+        print(f"| {profile.ljust(12)} | {f'~{row_by_row:,.2f}'.rjust(14)} | {f'{bulk:,.2f}'.rjust(14)} |")
+    print("+" + "-" * 14 + "+" + "-" * 16 + "+" + "-" * 16 + "+")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+from app.db.base import Base
+from app.db.init_db import create_db_engine
+from app.models import user, api, collection, postman  # noqa: F401 (테이블 등록)
+from app.models.test_run import TestResult
+
+def make_row(index: int) -> dict:
+    """TestResult 벤치마크용 행 생성"""
+    now = datetime.now()
+    return {
+        "test_run_id": 1,
+        "iteration": 0,
+        "request_name": f"Request {index}",
+        "request_url": f"https://example.com/api/items/{index}",
+        "request_method": "GET",
+        "request_headers": [{"key": "Accept", "value": "application/json"}],
+        "request_body": "",
+        "response_status": 200,
+        "response_headers": [{"key": "Content-Type", "value": "application/json"}],
+        "response_body": '{"id": %d, "name": "item"}' % index,
+        "test_status": "passed",
+        "test_message": "",
+        "test_script": "pm.test(\"ok\", function () { pm.response.to.have.status(200); });",
+        "test_script_result": "[]",
+        "start_time": now,
+        "end_time": now,
+        "duration": 12
+    }
+
+async def run_benchmark(profile: str, batch_size: int, rows: int) -> float:
+    """지정한 프로파일/배치 크기로 TestResult 를 기록하고 초당 기록 수 반환"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        engine = create_db_engine(f"sqlite+aiosqlite:///{os.path.join(temp_dir, 'bench.db')}", profile)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        data = [make_row(i) for i in range(rows)]
+
+        async with session_factory() as db:
+            started = time.perf_counter()
+            for start in range(0, rows, batch_size):
+                await db.execute(insert(TestResult), data[start:start + batch_size])
+                await db.commit()
+            elapsed = time.perf_counter() - started
+
+        await engine.dispose()
+        return rows / elapsed
+
+async def main():
+    parser = argparse.ArgumentParser(description="TestResult 기록 성능 측정")
+    parser.add_argument("--rows", type=int, default=5000, help="기록할 행 수")
+    parser.add_argument("--batch-size", type=int, default=200, help="일괄 기록 크기")
+    args = parser.parse_args()
+
+    print(f"\033[94mTestResult {args.rows}건 기록 (초당 기록 수)\033[0m")
+    print("+" + "-" * 14 + "+" + "-" * 16 + "+" + "-" * 16 + "+")
+    print("| " + "profile".ljust(12) + " | " + "commit per row".ljust(14) + " | " + f"batch {args.batch_size}".ljust(14) + " |")
+    print("+" + "-" * 14 + "+" + "-" * 16 + "+" + "-" * 16 + "+")
+    for profile in ("default", "performance"):
+        per_row = await run_benchmark(profile, 1, args.rows)
+        batched = await run_benchmark(profile, args.batch_size, args.rows)
+        print(f"| {profile.ljust(12)} | {f'{per_row:,.0f}'.rjust(14)} | {f'{batched:,.0f}'.rjust(14)} |")
+    print("+" + "-" * 14 + "+" + "-" * 16 + "+" + "-" * 16 + "+")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+import sys
+import ssl
+import json
+import time
+import asyncio
+import argparse
+import statistics
+from pathlib import Path
+from typing import List
+
+# 프로젝트 루트 경로
+ROOT = Path(__file__).parent.parent
+
+def ping_request(index: int) -> str:
+    """ping 요청 메세지 생성"""
+    return json.dumps({
+        "mcp_version": "1.0",
+        "message_type": "request",
+        "content": {"action": "ping", "request_id": str(index), "params": {}}
+    })
+
+def summarize(name: str, latencies: List[float]):
+    """지연 시간 통계 출력 (ms)"""
+    latencies = sorted(latencies)
+    percentile = lambda p: latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+    print(
+        f"| {name.ljust(10)} | {statistics.mean(latencies):9.3f} | {percentile(0.5):9.3f} "
+        f"| {percentile(0.95):9.3f} | {percentile(0.99):9.3f} |"
+    )
+
+async def benchmark_stdio(requests: int) -> List[float]:
+    """python main.py --stdio 를 실행하여 ping 왕복 지연 시간 측정"""
+    started = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, str(ROOT / "main.py"), "--stdio",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        cwd=str(ROOT)
+    )
+
+    # 첫 응답까지의 시간 (프로세스 시작 포함)
+    process.stdin.write(ping_request(0).encode() + b"\n")
+    await process.stdin.drain()
+    await process.stdout.readline()
+    print(f"stdio 시작 후 첫 응답: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    latencies = []
+    for index in range(1, requests + 1):
+        sent = time.perf_counter()
+        process.stdin.write(ping_request(index).encode() + b"\n")
+        await process.stdin.drain()
+        await process.stdout.readline()
+        latencies.append((time.perf_counter() - sent) * 1000)
+
+    process.stdin.close()
+    await process.wait()
+    return latencies
+
+async def benchmark_websocket(url: str, requests: int) -> List[float]:
+    """실행 중인 서버의 WebSocket 으로 ping 왕복 지연 시간 측정"""
+    import websockets
+
+    context = None
+    if url.startswith("wss://"):
+        # 자체 서명 인증서 허용
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+
+    latencies = []
+    async with websockets.connect(url, ssl=context) as websocket:
+        for index in range(requests):
+            sent = time.perf_counter()
+            await websocket.send(ping_request(index))
+            await websocket.recv()
+            latencies.append((time.perf_counter() - sent) * 1000)
+    return latencies
+
+async def main():
+    parser = argparse.ArgumentParser(description="MCP ping 왕복 지연 시간 측정")
+    parser.add_argument("--requests", type=int, default=1000, help="측정할 요청 수")
+    parser.add_argument("--ws-url", help="비교할 WebSocket 주소 (예: wss://localhost:610/api/v1/mcp/ws)")
+    args = parser.parse_args()
+
+    results = {"stdio": await benchmark_stdio(args.requests)}
+    if args.ws_url:
+        results["websocket"] = await benchmark_websocket(args.ws_url, args.requests)
+
+    print(f"\033[94mping {args.requests}회 왕복 지연 시간 (ms)\033[0m")
+    print("+" + "-" * 12 + ("+" + "-" * 11) * 4 + "+")
+    print("| " + "transport".ljust(10) + " | " + " | ".join(name.rjust(9) for name in ("mean", "p50", "p95", "p99")) + " |")
+    print("+" + "-" * 12 + ("+" + "-" * 11) * 4 + "+")
+    for name, latencies in results.items():
+        summarize(name, latencies)
+    print("+" + "-" * 12 + ("+" + "-" * 11) * 4 + "+")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.collection_ir import CompiledRequest
+from app.core.collection_runner import CollectionRunner
+from app.core.template_engine import VARIABLE_PATTERN, SCOPES, VariableScope
+
+def make_request(headers: int, body_size: int) -> dict:
+    """헤더 / 본문 크기를 지정한 Postman request 생성 (절반은 변수 참조)"""
+    chunk = '{"id": "{{item_id}}", "name": "item", "tags": ["a", "b", "c"], "owner": "{{user}}"},'
+    body = "[" + (chunk * (body_size // len(chunk) + 1))[:body_size].rstrip(",") + "]"
+    return {
+        "method": "POST",
+        "url": "{{base_url}}/api/v1/items?page={{page}}",
+        "header": [
+            {"key": f"X-Header-{i}", "value": f"{{{{header_{i}}}}}" if i % 2 else f"static-{i}"}
+            for i in range(headers)
+        ],
+        "auth": {"type": "bearer", "bearer": [{"key": "token", "value": "{{token}}"}]},
+        "body": {"mode": "raw", "raw": body}
+    }
+
+def make_variables(headers: int) -> VariableScope:
+    """모든 범위에 변수가 있는 변수 저장소 생성"""
+    variables = VariableScope()
+    for scope in SCOPES:
+        variables.load(scope, {f"{scope}_{i}": i for i in range(50)})
+    variables.load("environment", {"base_url": "https://example.com", "token": "secret"})
+    variables.load("data", {"page": 3, "item_id": 42, "user": "tester"})
+    variables.load("local", {f"header_{i}": f"value-{i}" for i in range(headers)})
+    return variables
+
+def render_regex(request: dict, variables: dict) -> dict:
+    """요청마다 정규식으로 치환하는 기존 방식"""
+    def resolve(value: str) -> str:
+        return VARIABLE_PATTERN.sub(
+            lambda match: str(variables[match.group(1)]) if match.group(1) in variables else match.group(0),
+            value
+        )
+
+    return {
+        "method": resolve(request["method"]).upper(),
+        "url": resolve(request["url"]),
+        "headers": {resolve(h["key"]): resolve(h["value"]) for h in request["header"] if not h.get("disabled")},
+        "token": resolve(request["auth"]["bearer"][0]["value"]),
+        "content": resolve(request["body"]["raw"])
+    }
+
+def measure(render, repeat: int) -> float:
+    """요청당 평균 렌더링 시간 (μs)"""
+    render()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        render()
+    return (time.perf_counter() - started) / repeat * 1_000_000
+
+def main():
+    parser = argparse.ArgumentParser(description="{{variable}} 템플릿 렌더링 성능 측정")
+    parser.add_argument("--headers", type=int, default=200, help="요청 헤더 수")
+    parser.add_argument("--body-size", type=int, default=50 * 1024, help="요청 본문 크기 (bytes)")
+    parser.add_argument("--repeat", type=int, default=2000, help="반복 횟수")
+    args = parser.parse_args()
+
+    request = make_request(args.headers, args.body_size)
+    variables = make_variables(args.headers)
+    runner = CollectionRunner(None)
+
+    # 결과가 같은지 확인
+    compiled = CompiledRequest(request)
+    expected = render_regex(request, variables)
+    rendered = runner.build_request(compiled, variables)
+    assert rendered["url"] == expected["url"] and rendered["content"] == expected["content"]
+    assert rendered["headers"]["Authorization"] == f"Bearer {expected['token']}"
+    assert all(rendered["headers"][key] == value for key, value in expected["headers"].items())
+
+    compile_cost = measure(lambda: CompiledRequest(request), 20)
+    regex_cost = measure(lambda: render_regex(request, variables), args.repeat)
+    compiled_cost = measure(lambda: runner.build_request(compiled, variables), args.repeat)
+
+    print(f"\033[94m헤더 {args.headers}개, 본문 {args.body_size:,} bytes 요청 렌더링 (요청당 μs)\033[0m")
+    print("+" + "-" * 22 + "+" + "-" * 14 + "+")
+    print(f"| {'regex (기존)'.ljust(20)} | {regex_cost:12.1f} |")
+    print(f"| {'compiled'.ljust(20)} | {compiled_cost:12.1f} |")
+    print(f"| {'compile (1회)'.ljust(20)} | {compile_cost:12.1f} |")
+    print("+" + "-" * 22 + "+" + "-" * 14 + "+")
+    print(f"speedup: {regex_cost / compiled_cost:.1f}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+import os
+import tempfile
+
+# app.config 를 불러오기 전에 테스트용 데이터베이스 지정
+os.environ.setdefault(
+    "DATABASE_URL",
+    f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(prefix='mcp-test-'), 'test.db')}"
+)
+
+import pytest  # noqa: E402
+
+@pytest.fixture
+async def db_engine():
+    """
+    테이블을 만든 애플리케이션 엔진 (테스트가 끝나면 테이블 삭제)
+    """
+    import app.models  # noqa: F401 (테이블 등록)
+    from app.db.base import Base
+    from app.db.init_db import engine
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    yield engine
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+    # 이벤트 루프마다 연결을 새로 만들도록 풀 정리
+    await engine.dispose()
+
+@pytest.fixture
+async def db(db_engine):
+    """
+    애플리케이션 세션 팩토리로 만든 세션
+    """
+    from app.db.init_db import async_session
+
+    async with async_session() as session:
+        yield session
@@ -0,0 +1,72 @@
+from app.core.collection_graph import DependencyGraph, analyze_item
+from app.core.collection_ir import compile_collection
+
+def request(name, url="http://api/{{host}}", prerequest=None, test=None):
+    item = {"name": name, "request": {"method": "GET", "url": url}, "event": []}
+    if prerequest:
+        item["event"].append({"listen": "prerequest", "script": {"exec": [prerequest]}})
+    if test:
+        item["event"].append({"listen": "test", "script": {"exec": [test]}})
+    return item
+
+def graph_of(*items):
+    return DependencyGraph(compile_collection({"item": list(items)}).items)
+
+def test_analyze_item_reads_and_writes():
+    info = analyze_item({
+        "request": {"url": "{{base}}/users/{{ userId }}", "header": [{"key": "A", "value": "{{token}}"}]},
+        "prerequest": 'const t = pm.environment.get("secret");',
+        "test": 'pm.environment.set("userId", 1); pm.collectionVariables.unset(\'old\');'
+    })
+    assert info["reads"] == {"base", "userId", "token", "secret"}
+    assert info["writes"] == {"userId", "old"}
+    assert info["barrier"] is False
+
+def test_independent_items_share_one_wave():
+    graph = graph_of(request("a", "http://x/1"), request("b", "http://x/2"), request("c", "http://x/3"))
+    assert graph.dependencies == [set(), set(), set()]
+    assert graph.waves == [[0, 1, 2]]
+
+def test_read_after_write_edge():
+    graph = graph_of(
+        request("login", "http://x/login", test='pm.environment.set("token", "t");'),
+        request("other", "http://x/other"),
+        request("me", "http://x/me?t={{token}}")
+    )
+    assert graph.dependencies[2] == {0}
+    assert graph.waves == [[0, 1], [2]]
+    assert graph.critical_path_length == 2
+
+def test_write_after_write_and_write_after_read_edges():
+    graph = graph_of(
+        request("w1", "http://x/1", test='pm.environment.set("k", 1);'),
+        request("r", "http://x/{{k}}"),
+        request("w2", "http://x/2", test='pm.environment.set("k", 2);'),
+        request("r2", "http://x/{{k}}")
+    )
+    assert graph.dependencies[1] == {0}
+    # 앞선 쓰기와 그 값을 읽은 item 이 끝난 뒤에 다시 씀
+    assert graph.dependencies[2] == {0, 1}
+    # 마지막 쓰기만 읽음
+    assert graph.dependencies[3] == {2}
+
+def test_barrier_orders_against_everything():
+    graph = graph_of(
+        request("a", "http://x/a"),
+        request("b", "http://x/b"),
+        request("dynamic", "http://x/d", test="pm.environment.set(name, value);"),
+        request("c", "http://x/c"),
+        request("next", "http://x/n", test='postman.setNextRequest("a");')
+    )
+    assert graph.dependencies[2] == {0, 1}
+    assert graph.dependencies[3] == {2}
+    assert graph.dependencies[4] == {0, 1, 2, 3}
+    assert graph.waves == [[0, 1], [2], [3], [4]]
+
+def test_folder_scripts_are_inherited():
+    graph = graph_of(
+        {"name": "auth", "event": [{"listen": "test", "script": {"exec": ['pm.environment.set("token", "x");']}}],
+         "item": [request("login", "http://x/login")]},
+        request("me", "http://x/{{token}}")
+    )
+    assert graph.dependencies[1] == {0}
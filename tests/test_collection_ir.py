@@ -0,0 +1,114 @@
+from datetime import datetime
+
+from app.core.collection_ir import CompiledCollection, CompiledCollectionCache, build_url, compile_collection
+
+def script(listen, line):
+    return {"listen": listen, "script": {"exec": [line]}}
+
+COLLECTION = {
+    "variable": [{"key": "host", "value": "h"}, {"key": "off", "value": "x", "disabled": True}],
+    "event": [script("prerequest", "// root")],
+    "item": [
+        {"name": "folder", "event": [script("test", "// folder")], "item": [
+            {"name": "get", "event": [script("test", "// item")], "request": {
+                "method": "GET",
+                "url": {"raw": "{{host}}/a"},
+                "header": [{"key": "A", "value": "{{a}}"}, {"key": "B", "value": "b", "disabled": True}],
+                "auth": {"type": "bearer", "bearer": [{"key": "token", "value": "{{token}}"}]}
+            }}
+        ]},
+        {"name": "post", "request": {"method": "POST", "url": "http://x", "body": {
+            "mode": "urlencoded",
+            "urlencoded": [{"key": "k", "value": "{{v}}"}, {"key": "d", "value": "1", "disabled": True}]
+        }}}
+    ]
+}
+
+def test_compile_flattens_folders_and_inherits_scripts():
+    compiled = compile_collection(COLLECTION)
+    assert compiled.variables == (("host", "h"),)
+    assert [(item.name, item.path) for item in compiled.items] == [("get", "folder/get"), ("post", "post")]
+
+    get = compiled.items[0]
+    assert get.prerequest == "// root"
+    assert get.test == "// folder\n// item"
+    assert get.request.url.source == "{{host}}/a"
+    assert [(k.source, v.source) for k, v in get.request.headers] == [("A", "{{a}}")]
+    assert get.request.auth_type == "bearer"
+
+    post = compiled.items[1]
+    assert post.request.body_mode == "urlencoded"
+    assert [(k.source, v.source) for k, v in post.request.fields] == [("k", "{{v}}")]
+
+def test_compile_accepts_json_strings():
+    import json
+    assert len(compile_collection(json.dumps(COLLECTION)).items) == 2
+
+def test_recompile_reuses_unchanged_items():
+    first = compile_collection(COLLECTION)
+    changed = {**COLLECTION, "item": [COLLECTION["item"][0], {
+        "name": "post", "request": {"method": "PUT", "url": "http://x"}
+    }]}
+    second = compile_collection(changed, first)
+    assert second.items[0] is first.items[0]
+    assert second.items[1] is not first.items[1]
+    assert second.items[1].request.method.source == "PUT"
+
+def test_compile_handles_deep_nesting():
+    items = [{"name": "deep", "request": "http://x"}]
+    for _ in range(1500):
+        items = [{"name": "f", "item": items}]
+    compiled = compile_collection({"item": items})
+    assert len(compiled.items) == 1
+    assert compiled.items[0].path.count("/") == 1500
+
+def test_build_url_from_components():
+    assert build_url({
+        "protocol": "https", "host": ["api", "example", "com"], "path": ["v1", "users"],
+        "query": [{"key": "a", "value": "1"}, {"key": "b", "value": "2", "disabled": True}]
+    }) == "https://api.example.com/v1/users?a=1"
+
+def collection(size):
+    return CompiledCollection((), tuple(range(size)))
+
+def test_cache_matches_version_and_updated_at():
+    cache = CompiledCollectionCache(2)
+    updated_at = datetime(2026, 1, 1)
+    compiled = collection(1)
+    cache.put(1, 1, updated_at, compiled)
+
+    assert cache.get(1, 1, updated_at) is compiled
+    assert cache.get(1, 2, updated_at) is None
+    assert cache.get(1, 1, datetime(2026, 1, 2)) is None
+    assert cache.latest(1) is compiled
+
+def test_cache_evicts_least_recently_used():
+    cache = CompiledCollectionCache(2)
+    for collection_id in (1, 2):
+        cache.put(collection_id, 1, None, collection(1))
+    cache.get(1, 1, None)
+    cache.put(3, 1, None, collection(1))
+    assert cache.latest(2) is None
+    assert cache.latest(1) is not None and cache.latest(3) is not None
+
+def test_cache_bounds_total_items_but_keeps_newest():
+    cache = CompiledCollectionCache(10, max_items=10)
+    cache.put(1, 1, None, collection(6))
+    cache.put(2, 1, None, collection(4))
+    cache.put(3, 1, None, collection(1))
+    assert cache.latest(1) is None
+    assert cache._item_count == 5
+
+    # 상한보다 큰 Collection 도 가장 최근 것이면 유지
+    cache.put(4, 1, None, collection(20))
+    assert [cache.latest(i) is not None for i in (2, 3, 4)] == [False, False, True]
+    assert cache._item_count == 20
+
+    # 같은 Collection 의 새 버전은 교체
+    cache.put(4, 2, None, collection(2))
+    assert cache._item_count == 2
+
+def test_disabled_cache_stores_nothing():
+    cache = CompiledCollectionCache(0)
+    cache.put(1, 1, None, collection(1))
+    assert cache.latest(1) is None
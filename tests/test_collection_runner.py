@@ -0,0 +1,145 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.core import collection_runner
+from app.core.collection_runner import CollectionRunner
+from app.core.shard_executor import _run_shard
+from app.core.template_engine import VariableScope
+
+def item(name, url, test=None, **request):
+    value = {"name": name, "request": {"method": "GET", "url": url, **request}}
+    if test:
+        value["event"] = [{"listen": "test", "script": {"exec": [test]}}]
+    return value
+
+class Server:
+    """
+    요청을 기록하고 동시 처리 수를 재는 가짜 HTTP 서버
+    """
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.requests = []
+        self.inflight = 0
+        self.max_inflight = 0
+
+    async def __call__(self, request):
+        self.requests.append(request)
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.inflight -= 1
+        if request.url.path == "/login":
+            return respond(200, json.dumps({"token": "secret"}))
+        if request.url.path == "/missing":
+            return respond(404, "not found")
+        return respond(200, "ok")
+
+def respond(status_code, body):
+    # 스트림으로 돌려줘야 클라이언트가 본문을 읽으며 elapsed 를 기록함
+    return httpx.Response(status_code, stream=httpx.ByteStream(body.encode()))
+
+@pytest.fixture
+def server(monkeypatch):
+    server = Server()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+    monkeypatch.setattr(collection_runner, "_http_client", client)
+    yield server
+
+LOGIN_FLOW = {
+    "variable": [{"key": "base", "value": "http://api"}],
+    "item": [
+        item("login", "{{base}}/login", 'pm.environment.set("token", pm.response.json().token);'),
+        item("me", "{{base}}/me", 'pm.test("ok", function () { pm.response.to.have.status(200); });',
+             header=[{"key": "Authorization", "value": "Bearer {{token}}"}]),
+        item("missing", "{{base}}/missing", 'pm.test("found", function () { pm.response.to.have.status(200); });'),
+    ]
+}
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+async def test_run_respects_variable_dependencies(server, concurrency):
+    summary = await CollectionRunner(LOGIN_FLOW).run(concurrency=concurrency)
+
+    assert (summary["total"], summary["passed"], summary["failed"]) == (3, 2, 1)
+    assert summary["failures"] == [{"item_name": "missing", "iteration": 0, "message": "found: expected status 200 but got 404"}]
+    me = next(request for request in server.requests if request.url.path == "/me")
+    assert me.headers["Authorization"] == "Bearer secret"
+    assert summary["waves"] == 2
+
+async def test_independent_items_run_concurrently(server):
+    server.delay = 0.05
+    collection = {"item": [item(f"r{i}", f"http://api/{i}") for i in range(6)]}
+    await CollectionRunner(collection).run(concurrency=3)
+    assert server.max_inflight == 3
+
+async def test_iterations_use_their_own_data_and_run_concurrently(server):
+    server.delay = 0.05
+    collection = {"item": [item("get", "http://api/items/{{id}}")]}
+    runner = CollectionRunner(collection, test_data=json.dumps([{"id": 1}, {"id": 2}, {"id": 3}]))
+    ended = []
+
+    async def on_iteration_end(iteration_summary):
+        ended.append((iteration_summary["iteration"], iteration_summary["total"]))
+
+    runner.on("iteration_end", on_iteration_end)
+    summary = await runner.run(concurrency=1, iteration_concurrency=3)
+
+    assert summary["iterations"] == 3
+    assert sorted(request.url.path for request in server.requests) == ["/items/1", "/items/2", "/items/3"]
+    assert sorted(ended) == [(0, 1), (1, 1), (2, 1)]
+    assert server.max_inflight == 3
+
+async def test_invalid_request_is_recorded_as_failure(server):
+    collection = {"item": [item("bad", "::::"), item("good", "http://api/ok")]}
+    results = []
+
+    async def on_test_end(compiled, result):
+        results.append((compiled.name, result))
+
+    runner = CollectionRunner(collection)
+    runner.on("test_end", on_test_end)
+    summary = await runner.run()
+
+    assert (summary["total"], summary["failed"], summary["passed"]) == (2, 1, 1)
+    name, result = results[0]
+    assert name == "bad"
+    assert result["test"]["status"] == "failed"
+    assert result["request"]["url"]["raw"] == "::::"
+
+def test_build_request_renders_body_and_auth():
+    runner = CollectionRunner({"item": [
+        item("raw", "http://api/{{path}}", method="POST",
+             body={"mode": "raw", "raw": '{"id": "{{id}}"}'},
+             auth={"type": "basic", "basic": [{"key": "username", "value": "u"}, {"key": "password", "value": "{{pw}}"}]}),
+        item("key", "http://api", auth={"type": "apikey", "apikey": [
+            {"key": "key", "value": "X-Key"}, {"key": "value", "value": "{{key}}"}
+        ]})
+    ]})
+    variables = VariableScope({"environment": {"path": "p", "id": 7, "pw": "s", "key": "k"}})
+
+    raw = runner.build_request(runner.collection.items[0].request, variables)
+    assert (raw["method"], raw["url"], raw["content"]) == ("POST", "http://api/p", '{"id": "7"}')
+    assert raw["headers"]["Authorization"] == "Basic dTpz"
+
+    key = runner.build_request(runner.collection.items[1].request, variables)
+    assert key["headers"] == {"X-Key": "k"}
+
+async def test_shard_returns_results_and_changed_variables(server):
+    runner = CollectionRunner(LOGIN_FLOW)
+    variables = runner.base_variables()
+    shard = await _run_shard({
+        "items": [(0, runner.collection.items[0]), (2, runner.collection.items[2])],
+        "variables": variables,
+        "iteration": 0,
+        "concurrency": 2
+    })
+
+    assert sorted(index for index, _ in shard["results"]) == [0, 2]
+    assert shard["variables"] == {"environment": {"token": "secret"}}
+    # 부모의 변수 저장소는 바뀌지 않음
+    assert "token" not in variables
@@ -0,0 +1,101 @@
+import time
+
+import pytest
+
+from app.config import settings
+from app.core import event_bus as event_bus_module
+from app.core.event_bus import ALL_TOPICS, EventBus, make_topic, parse_topic
+
+def event():
+    return {"message_type": "event", "content": {"event_type": "test_item_completed", "data": {}}}
+
+@pytest.fixture
+def bus(monkeypatch):
+    monkeypatch.setattr(settings, "MCP_REPLAY_BUFFER_SIZE", 3)
+    monkeypatch.setattr(settings, "MCP_REPLAY_MAX_RUNS", 2)
+    return EventBus()
+
+def test_parse_topic():
+    assert parse_topic(make_topic("test_run", 1)) == "test_run:1"
+    assert parse_topic(ALL_TOPICS) == ALL_TOPICS
+    for topic in ("test_run:", "unknown:1", "test_run"):
+        with pytest.raises(ValueError):
+            parse_topic(topic)
+
+async def test_publish_delivers_once_per_subscriber(bus):
+    received = []
+
+    async def send(message):
+        received.append(message)
+
+    bus.subscribe("a", ["test_run:1", "user:1"], send)
+    bus.subscribe("b", [ALL_TOPICS], send)
+    bus.subscribe("c", ["test_run:2"], send)
+    await bus.publish(["test_run:1", "user:1"], event())
+    assert len(received) == 2
+
+    assert bus.unsubscribe("a", ["user:1"]) == ["test_run:1"]
+    assert bus.unsubscribe("a") == []
+    assert "a" not in bus.senders
+
+async def test_seq_is_monotonic_and_replayed_after_last_seq(bus):
+    for _ in range(3):
+        await bus.publish([], event(), stream=1)
+    seqs = [message["content"]["seq"] for message in bus.replay_buffers[1]]
+    assert seqs == sorted(seqs) and len(set(seqs)) == 3
+    assert bus.last_seq(1) == seqs[-1]
+
+    events, truncated = bus.replay(1, seqs[0])
+    assert [message["content"]["seq"] for message in events] == seqs[1:]
+    assert truncated is False
+
+async def test_seq_continues_after_restart(bus, monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(event_bus_module.time, "time", lambda: now)
+    for _ in range(100):
+        await bus.publish([], event(), stream=1)
+
+    # 1초 뒤 재시작한 프로세스의 같은 스트림 seq 는 이전보다 커야 함
+    monkeypatch.setattr(event_bus_module.time, "time", lambda: now + 1)
+    restarted = EventBus()
+    await restarted.publish([], event(), stream=1)
+    assert restarted.last_seq(1) > bus.last_seq(1)
+
+async def test_replay_reports_events_dropped_from_buffer(bus):
+    for _ in range(5):
+        await bus.publish([], event(), stream=1)
+    oldest = bus.replay_buffers[1][0]["content"]["seq"]
+
+    events, truncated = bus.replay(1, oldest - 2)
+    assert len(events) == 3
+    assert truncated is True
+    assert bus.replay(1, oldest - 1)[1] is False
+
+async def test_eviction_prefers_finished_streams(bus):
+    await bus.publish([], event(), stream=1)
+    await bus.publish([], event(), stream=2, final=True)
+    await bus.publish([], event(), stream=3)
+
+    # 종료된 스트림은 seq 까지 정리
+    assert 2 not in bus.replay_buffers and bus.last_seq(2) == 0
+    assert 1 in bus.replay_buffers
+
+async def test_evicted_active_stream_keeps_its_seq(bus):
+    await bus.publish([], event(), stream=1)
+    active_seq = bus.last_seq(1)
+    await bus.publish([], event(), stream=2)
+    await bus.publish([], event(), stream=3)
+
+    assert 1 not in bus.replay_buffers
+    assert bus.last_seq(1) == active_seq
+    assert bus.replay(1, active_seq) == ([], False)
+    assert bus.replay(1, active_seq - 1) == ([], True)
+
+    await bus.publish([], event(), stream=1)
+    assert bus.last_seq(1) > active_seq
+    assert bus.replay(1, active_seq - 1)[1] is True
+
+def test_unknown_stream_replay():
+    bus = EventBus()
+    assert bus.replay(99, 0) == ([], False)
+    assert bus.replay(99, 5) == ([], True)
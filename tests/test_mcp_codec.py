@@ -0,0 +1,74 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core import mcp_codec
+from app.core.mcp_codec import JSONCodec, MCPCodec, MsgPackCodec, get_codec, negotiate_codec
+
+MESSAGE = {
+    "mcp_version": "1.0",
+    "message_type": "event",
+    "content": {"event_type": "test_completed", "data": {"name": "한글", "count": 3, "ok": True, "none": None}}
+}
+
+def codec_params():
+    params = [pytest.param("orjson", id="json-orjson"), pytest.param(None, id="json-stdlib")]
+    if mcp_codec.msgpack is not None:
+        params.append(pytest.param("msgpack", id="msgpack"))
+    return params
+
+@pytest.fixture(params=codec_params())
+def codec(request, monkeypatch):
+    if request.param == "msgpack":
+        return MsgPackCodec()
+    if request.param == "orjson":
+        if mcp_codec.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(mcp_codec, "orjson", None)
+    return JSONCodec()
+
+def test_round_trip(codec):
+    data = codec.encode(MESSAGE)
+    assert isinstance(data, bytes if codec.binary else str)
+    assert codec.decode(data) == MESSAGE
+
+def test_datetimes_are_iso_8601_in_every_codec(codec):
+    message = {
+        "naive": datetime(2026, 1, 2, 3, 4, 5, 6),
+        "aware": datetime(2026, 1, 2, tzinfo=timezone.utc)
+    }
+    assert codec.decode(codec.encode(message)) == {
+        "naive": "2026-01-02T03:04:05.000006",
+        "aware": "2026-01-02T00:00:00+00:00"
+    }
+
+def test_invalid_frames_raise_value_error(codec):
+    with pytest.raises(ValueError):
+        codec.decode(b"\xc1" if codec.binary else "{not json")
+
+def test_encode_cache_is_used_only_for_shared_messages():
+    codec = JSONCodec()
+    message = {"content": {"a": 1}}
+
+    first = codec.encode(message, cache=True)
+    message["content"]["a"] = 2
+    # 같은 객체는 캐시된 결과 사용
+    assert codec.encode(message, cache=True) is first
+    # 한 번만 보내는 메세지는 매번 인코딩
+    assert codec.decode(codec.encode(message)) == {"content": {"a": 2}}
+    assert len(codec._cache) == 1
+
+def test_codec_base_is_abstract():
+    with pytest.raises(TypeError):
+        MCPCodec()
+
+def test_negotiation():
+    assert get_codec("orjson") is get_codec("json")
+    with pytest.raises(ValueError):
+        get_codec("xml")
+
+    assert negotiate_codec("json", ["mcp.msgpack"]) == (get_codec("json"), None)
+    codec, subprotocol = negotiate_codec(None, ["other", "mcp.xml", "mcp.json"])
+    assert (codec.name, subprotocol) == ("json", "mcp.json")
+    assert negotiate_codec(None, []) == (get_codec(), None)
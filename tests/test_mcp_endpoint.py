@@ -0,0 +1,33 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# 엔드포인트는 인증 의존성(app.api.deps)이 있어야 불러올 수 있음
+pytest.importorskip("app.api.deps")
+
+from app.api.api_v1.endpoints import mcp  # noqa: E402
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(mcp.router)
+    return TestClient(app)
+
+@pytest.mark.parametrize("content", [[], "run_test", None, 1])
+def test_process_message_rejects_non_object_content(client, content):
+    response = client.post("/message", json={"message_type": "request", "content": content})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Message content must be an object"
+
+@pytest.mark.parametrize("params", [[], "x", None])
+def test_process_message_rejects_non_object_params(client, params):
+    response = client.post("/message", json={
+        "message_type": "request",
+        "content": {"action": "ping", "params": params}
+    })
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Request params must be an object"
+
+def test_process_message_rejects_unknown_action(client):
+    response = client.post("/message", json={"message_type": "request", "content": {"action": "nope"}})
+    assert response.status_code == 400
@@ -0,0 +1,150 @@
+import asyncio
+
+import pytest
+
+# MCPHandler 는 인증 의존성(app.api.deps)이 있어야 불러올 수 있음
+pytest.importorskip("app.api.deps")
+
+from app.core.mcp_codec import get_codec  # noqa: E402
+from app.core.mcp_handler import MCPConnection, MCPHandler  # noqa: E402
+from app.core.mcp_protocol import mcp_protocol  # noqa: E402
+
+class FakeSocket:
+    client = None
+
+    def __init__(self):
+        self.sent = []
+        self.closed_with = None
+
+    async def send_text(self, data):
+        self.sent.append(data)
+
+    async def send_bytes(self, data):
+        self.sent.append(data)
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+def event(event_type, test_run_id, **data):
+    return mcp_protocol.create_event(event_type, {"test_run_id": test_run_id, **data})
+
+def event_types(connection):
+    return [
+        (message["content"]["event_type"], message["content"]["data"].get("n"))
+        for message, _ in connection.queue
+        if message["message_type"] == "event"
+    ]
+
+def connection(policy, max_size=3):
+    return MCPConnection(FakeSocket(), max_size, policy, get_codec("json"))
+
+async def test_drop_oldest_keeps_responses():
+    conn = connection("drop_oldest")
+    response = mcp_protocol.create_response("r", "success", {})
+    conn.enqueue(response)
+    for n in range(4):
+        conn.enqueue(event("test_progress", 1, n=n))
+
+    assert conn.queue[0][0] is response
+    assert event_types(conn) == [("test_progress", 2), ("test_progress", 3)]
+    assert conn.dropped == 2
+
+async def test_coalesce_replaces_the_same_event_of_the_same_run():
+    conn = connection("coalesce")
+    conn.enqueue(event("test_progress", 1, n=0))
+    conn.enqueue(event("test_progress", 2, n=0))
+    conn.enqueue(event("test_item_completed", 1, n=0))
+    conn.enqueue(event("test_progress", 1, n=1))
+
+    assert event_types(conn) == [("test_progress", 1), ("test_progress", 0), ("test_item_completed", 0)]
+    assert conn.coalesced == 1
+    # 병합할 이벤트가 없으면 가장 오래된 이벤트를 버림
+    conn.enqueue(event("test_started", 3, n=9))
+    assert event_types(conn)[-1] == ("test_started", 9) and conn.dropped == 1
+
+async def test_disconnect_policy_closes_slow_consumer():
+    conn = connection("disconnect", max_size=1)
+    assert conn.enqueue(event("test_progress", 1)) is True
+    assert conn.enqueue(event("test_progress", 1)) is False
+    assert conn.closed and conn.overflowed
+
+async def test_batch_window_merges_item_events_before_other_events():
+    conn = connection("drop_oldest", max_size=100)
+    conn.set_batch_window(1000)
+    conn.enqueue(event("test_item_started", 1))
+    for n in range(3):
+        completed = event("test_item_completed", 1, n=n)
+        completed["content"]["seq"] = 10 + n
+        conn.enqueue(completed)
+    assert len(conn.queue) == 0
+
+    conn.enqueue(event("test_completed", 1))
+    batch, _ = conn.queue[0]
+    assert batch["content"]["event_type"] == "test_items_completed"
+    assert [item["n"] for item in batch["content"]["data"]["items"]] == [0, 1, 2]
+    assert batch["content"]["seq"] == 12
+    assert conn.queue[1][0]["content"]["event_type"] == "test_completed"
+    conn.close()
+
+async def test_sender_encodes_and_sends_in_order():
+    conn = connection("drop_oldest", max_size=10)
+    conn.start()
+    for n in range(3):
+        conn.enqueue(event("test_progress", 1, n=n))
+    while conn.queue:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    conn.close()
+
+    codec = get_codec("json")
+    assert [codec.decode(data)["content"]["data"]["n"] for data in conn.websocket.sent] == [0, 1, 2]
+
+@pytest.fixture
+def handler():
+    handler = MCPHandler()
+    log = []
+
+    def recorder(name):
+        async def handle(params, websocket):
+            log.append(("start", name, params.get("i")))
+            await asyncio.sleep(params.get("delay", 0))
+            log.append(("end", name, params.get("i")))
+            return {"status": "success", "i": params.get("i")}
+        return handle
+
+    handler.register_handler("work", recorder("work"))
+    handler.register_handler("set_state", recorder("set_state"), concurrent=False)
+    handler.log = log
+    return handler
+
+async def test_batch_runs_requests_concurrently_with_serial_barriers(handler):
+    messages = []
+    for action, i, delay in [("work", 0, 0.02), ("work", 1, 0.01), ("set_state", 2, 0), ("work", 3, 0)]:
+        message = mcp_protocol.create_request(action, {"i": i, "delay": delay})
+        message["content"]["request_id"] = str(i)
+        messages.append(message)
+
+    responses = await handler.execute_batch(messages)
+
+    assert [response["content"]["request_id"] for response in responses] == ["0", "1", "2", "3"]
+    log = handler.log
+    # 앞선 두 요청은 동시에 시작
+    assert log[:2] == [("start", "work", 0), ("start", "work", 1)]
+    # 순서가 중요한 요청은 앞선 요청이 모두 끝난 뒤 단독 실행
+    serial_start = log.index(("start", "set_state", 2))
+    assert log.index(("end", "work", 0)) < serial_start
+    assert log[serial_start + 1] == ("end", "set_state", 2)
+    assert log.index(("start", "work", 3)) > serial_start
+
+@pytest.mark.parametrize("item", [
+    "text",
+    None,
+    {"mcp_version": "1.0", "message_type": "request", "content": ["not", "object"]},
+    {"mcp_version": "1.0", "message_type": "event", "content": {"request_id": "e"}},
+])
+async def test_batch_returns_invalid_request_for_bad_items(handler, item):
+    responses = await handler.execute_batch([item, mcp_protocol.create_request("ping", {})])
+
+    assert responses[0]["message_type"] == "error"
+    assert responses[0]["content"]["details"]["index"] == 0
+    assert responses[1]["content"]["status"] == "success"
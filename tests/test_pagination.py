@@ -0,0 +1,27 @@
+import base64
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.pagination import decode_cursor, encode_cursor
+
+def test_cursor_round_trip():
+    cursor = encode_cursor([42, "2026-01-01"])
+    assert "=" not in cursor
+    assert decode_cursor(cursor, 2) == [42, "2026-01-01"]
+    assert decode_cursor(encode_cursor([7]), 1, (int,)) == [7]
+
+@pytest.mark.parametrize("cursor", [
+    "not base64 !!",
+    base64.urlsafe_b64encode(b"{not json").decode(),
+    encode_cursor({"a": 1}),
+    encode_cursor([1, 2]),
+    encode_cursor(["1"]),
+    encode_cursor([True]),
+    encode_cursor([1.5]),
+])
+def test_invalid_cursor_is_rejected_with_400(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor, 1, (int,))
+    assert error.value.status_code == 400
+    assert error.value.detail == "Invalid cursor"
@@ -0,0 +1,83 @@
+import copy
+import io
+import json
+
+import pytest
+from sqlalchemy import func, select
+
+from app.config import settings
+from app.models.api import ApiInfo, ApiTestCase, ApiTestData
+from app.models.collection import CollectionTestCase
+from app.services.postman_parser import PostmanParser
+
+def collection(size):
+    return {
+        "info": {"name": "C", "description": "d"},
+        "item": [
+            {"name": "F", "item": [
+                {"name": f"r{i}", "request": {"method": "GET", "url": f"http://x/{i}"}} for i in range(size)
+            ]},
+            {"id": "abc", "name": "with id", "request": {"url": "http://y"}}
+        ]
+    }
+
+async def counts(db):
+    return [
+        await db.scalar(select(func.count()).select_from(table))
+        for table in (ApiInfo, ApiTestCase, ApiTestData, CollectionTestCase)
+    ]
+
+@pytest.fixture
+def parser(monkeypatch):
+    # 여러 번의 일괄 INSERT 로 나뉘도록 배치 크기 축소
+    monkeypatch.setattr(settings, "POSTMAN_IMPORT_BATCH_SIZE", 2)
+    return PostmanParser()
+
+async def test_import_creates_rows_for_every_request(db, parser):
+    result = await parser.parse_and_save(db, collection(5))
+
+    assert result["collection_info"]["name"] == "C"
+    assert (result["version"], result["inserted"], result["api_count"]) == (1, 6, 6)
+    assert await counts(db) == [6, 6, 6, 6]
+    names = (await db.execute(select(ApiInfo.name).order_by(ApiInfo.api_id))).scalars().all()
+    assert names == ["F/r0", "F/r1", "F/r2", "F/r3", "F/r4", "with id"]
+
+async def test_reupload_applies_only_the_diff(db, parser):
+    first = await parser.parse_and_save(db, collection(5))
+    collection_id = first["collection_info"]["id"]
+    original = dict((await db.execute(select(ApiInfo.name, ApiInfo.api_id))).all())
+
+    changed = collection(6)
+    changed["item"][0]["item"][2]["request"]["method"] = "POST"
+    del changed["item"][0]["item"][4]
+    # item id 가 같으면 이름이 바뀌어도 같은 item
+    changed["item"][1]["name"] = "renamed"
+
+    result = await parser.parse_and_save(db, io.BytesIO(json.dumps(changed).encode()), collection_id=collection_id)
+    assert {key: result[key] for key in ("version", "inserted", "updated", "deleted", "unchanged")} == {
+        "version": 2, "inserted": 1, "updated": 2, "deleted": 1, "unchanged": 3
+    }
+    assert await counts(db) == [6, 6, 6, 6]
+
+    rows = dict((await db.execute(select(ApiInfo.name, ApiInfo.method))).all())
+    assert rows["F/r2"] == "POST"
+    assert "F/r4" not in rows and "F/r5" in rows
+    current = dict((await db.execute(select(ApiInfo.name, ApiInfo.api_id))).all())
+    # 바뀌지 않은 item 과 수정된 item 은 기존 행 유지
+    assert current["F/r0"] == original["F/r0"]
+    assert current["renamed"] == original["with id"]
+
+    unchanged = await parser.parse_and_save(db, copy.deepcopy(changed), collection_id=collection_id)
+    assert (unchanged["version"], unchanged["unchanged"], unchanged["inserted"]) == (3, 6, 0)
+
+async def test_reupload_with_no_items_deletes_everything(db, parser):
+    first = await parser.parse_and_save(db, collection(3))
+    result = await parser.parse_and_save(
+        db, {"info": {"name": "E"}, "item": []}, collection_id=first["collection_info"]["id"]
+    )
+    assert result["deleted"] == 4
+    assert await counts(db) == [0, 0, 0, 0]
+
+async def test_reupload_of_unknown_collection_fails(db, parser):
+    with pytest.raises(ValueError, match="Collection 999 not found"):
+        await parser.parse_and_save(db, collection(1), collection_id=999)
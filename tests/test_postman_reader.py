@@ -0,0 +1,100 @@
+import io
+import json
+
+import pytest
+
+from app.core import postman_reader
+from app.core.postman_reader import CollectionReader, ItemKeys, content_hash, item_hash, load_json_file
+
+# 재귀 호출 한도(기본 1000)보다 깊은 중첩
+DEPTH = 1500
+
+COLLECTION = {
+    "info": {"name": "C"},
+    "item": [
+        {"name": "r0", "request": {"url": "http://x/0"}},
+        {"item": [
+            {"request": {"url": "http://x/1"}, "name": "r1"},
+            {"name": "empty", "item": []},
+            {"name": "no request"},
+            {"item": [{"name": "r2", "request": "http://x/2"}], "name": "inner"}
+        ], "name": "outer"},
+        {"name": "r3", "request": {"url": "http://x/3"}, "item": None}
+    ]
+}
+
+def as_file(value):
+    return io.BytesIO(json.dumps(value).encode())
+
+def deep_collection_json(depth):
+    # json.dumps 는 깊은 중첩을 직렬화하지 못하므로 직접 조합
+    request = '{"name": "deep", "request": {"url": "http://x/deep"}}'
+    return ('{"info": {"name": "D"}, "item": [' + '{"name": "f", "item": [' * depth
+            + request + "]}" * depth + "]}").encode()
+
+def deep_collection(depth):
+    items = [{"name": "deep", "request": {"url": "http://x/deep"}}]
+    for _ in range(depth):
+        items = [{"name": "f", "item": items}]
+    return {"info": {"name": "D"}, "item": items}
+
+def readers():
+    params = [pytest.param(False, id="parsed")]
+    if postman_reader.ijson is not None:
+        params.append(pytest.param(True, id="streaming"))
+    return params
+
+@pytest.mark.parametrize("streaming", readers())
+def test_reader_yields_requests_with_folder_paths(streaming):
+    reader = CollectionReader(as_file(COLLECTION) if streaming else COLLECTION)
+    assert [(path, item["name"]) for path, item in reader] == [
+        ("", "r0"), ("outer", "r1"), ("outer/inner", "r2"), ("", "r3")
+    ]
+    assert reader.info == {"name": "C"}
+
+def test_streaming_and_parsed_readers_agree():
+    if postman_reader.ijson is None:
+        pytest.skip("ijson is not installed")
+    assert list(CollectionReader(as_file(COLLECTION))) == list(CollectionReader(COLLECTION))
+
+def test_reader_handles_deep_nesting_without_recursion():
+    items = list(CollectionReader(deep_collection(DEPTH)))
+    assert len(items) == 1
+    path, item = items[0]
+    assert path == "/".join(["f"] * DEPTH)
+    assert item["name"] == "deep"
+
+def test_streaming_reader_handles_deep_nesting():
+    if postman_reader.ijson is None:
+        pytest.skip("ijson is not installed")
+    items = list(CollectionReader(io.BytesIO(deep_collection_json(DEPTH))))
+    assert [(path.count("/") + 1, item["name"]) for path, item in items] == [(DEPTH, "deep")]
+
+@pytest.mark.parametrize("data, message", [
+    (b"[]", "Collection must be a JSON object"),
+    (b'{"item": [1]}', "Collection item must be a JSON object"),
+    (b'{"item": [', "Invalid JSON format"),
+])
+def test_streaming_reader_rejects_invalid_documents(data, message):
+    if postman_reader.ijson is None:
+        pytest.skip("ijson is not installed")
+    with pytest.raises(ValueError, match=message):
+        list(CollectionReader(io.BytesIO(data)))
+
+def test_load_json_file():
+    assert load_json_file(as_file(COLLECTION)) == COLLECTION
+    with pytest.raises(ValueError):
+        load_json_file(io.BytesIO(b"{bad"))
+
+def test_hashes_ignore_key_order_and_identity_fields():
+    assert content_hash({"a": 1, "b": [1, 2]}) == content_hash({"b": [1, 2], "a": 1})
+    assert content_hash({"a": 1}) != content_hash({"a": 2})
+    item = {"name": "r", "request": {"url": "x"}}
+    assert item_hash({**item, "id": "1", "_postman_id": "2"}) == item_hash(item)
+
+def test_item_keys_prefer_id_and_number_duplicates():
+    keys = ItemKeys()
+    assert keys.key("F/r", {"id": "abc"}) == "abc"
+    assert keys.key("F/r", {}) == "F/r"
+    assert keys.key("F/r", {}) == "F/r#2"
+    assert keys.key("G/r", {"id": "abc"}) == "abc#2"
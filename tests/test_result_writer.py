@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+
+from app.config import settings
+from app.core.result_writer import ResultWriter
+from app.models import test_run as models
+
+def row(test_run_id, name="r"):
+    return {
+        "test_run_id": test_run_id,
+        "iteration": 0,
+        "request_name": name,
+        "request_url": "http://x",
+        "request_method": "GET",
+        "test_status": "passed"
+    }
+
+@pytest.fixture
+async def writer(db_engine, monkeypatch):
+    monkeypatch.setattr(settings, "RESULT_WRITER_BATCH_SIZE", 3)
+    monkeypatch.setattr(settings, "RESULT_WRITER_FLUSH_INTERVAL_MS", 10)
+    writer = ResultWriter()
+    await writer.start()
+    yield writer
+    await writer.stop()
+
+async def count_results(db):
+    return await db.scalar(select(func.count()).select_from(models.TestResult))
+
+async def test_flush_waits_for_all_rows(writer, db):
+    for index in range(7):
+        await writer.write(row(1, f"r{index}"))
+    await writer.flush()
+
+    assert await count_results(db) == 7
+    assert writer.pop_failures(1) == 0
+
+async def test_failed_batch_is_retried_row_by_row(writer, db):
+    await writer.write(row(1, "a"))
+    await writer.write(row(1, None))  # NOT NULL 위반
+    await writer.write(row(2, "b"))
+    await writer.flush()
+
+    assert await count_results(db) == 2
+    assert writer.pop_failures(1) == 1
+    assert writer.pop_failures(1) == 0
+    assert writer.pop_failures(2) == 0
+
+async def test_flush_raises_instead_of_hanging_when_writer_died(writer):
+    writer._task.cancel()
+    await asyncio.gather(writer._task, return_exceptions=True)
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(writer.flush(), 1)
+
+async def test_writer_dying_during_flush_fails_waiters_and_counts_rows(writer, monkeypatch):
+    started = asyncio.Event()
+
+    async def never(db, rows):
+        started.set()
+        await asyncio.sleep(3600)
+
+    monkeypatch.setattr(writer, "_write_rows", never)
+    await writer.write(row(1))
+    await started.wait()
+    # 기록 중에 대기열에 남은 행
+    await writer.write(row(1))
+
+    flush = asyncio.create_task(writer.flush())
+    await asyncio.sleep(0)
+    writer._task.cancel()
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(flush, 1)
+    assert writer.pop_failures(1) == 1
+
+async def test_write_restarts_a_dead_writer(writer, db):
+    writer._task.cancel()
+    await asyncio.gather(writer._task, return_exceptions=True)
+
+    await writer.write(row(1))
+    await writer.flush()
+    assert await count_results(db) == 1
@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from app.core.script_evaluator import ScriptEvaluator
+from app.core.template_engine import VariableScope
+
+@pytest.fixture
+def evaluator():
+    return ScriptEvaluator()
+
+@pytest.mark.parametrize("script", [
+    'pm.environment.set("token", "abc");',
+    'pm.environment.set("token", "abc")',
+    'pm.environment.set("token", "abc"); // save token',
+    'pm.environment.set("token", "abc") /* save */',
+    'pm.environment.set("token", "abc"); pm.globals.set("other", 1);',
+])
+def test_prerequest_set_accepts_trailing_statements_and_comments(evaluator, script):
+    variables = VariableScope()
+    evaluator.run_prerequest(script, variables)
+    assert variables.layers["environment"] == {"token": "abc"}
+
+def test_set_writes_to_the_matching_scope(evaluator):
+    variables = VariableScope()
+    evaluator.run_prerequest(
+        'pm.globals.set("a", 1);\n'
+        'pm.collectionVariables.set("b", true);\n'
+        "pm.variables.set('c', 'x');",
+        variables
+    )
+    assert variables.layers["global"] == {"a": 1}
+    assert variables.layers["collection"] == {"b": True}
+    assert variables.layers["local"] == {"c": "x"}
+
+def test_non_literal_prerequest_values_are_ignored(evaluator):
+    variables = VariableScope()
+    evaluator.run_prerequest('pm.environment.set("ts", Date.now());', variables)
+    assert "ts" not in variables
+
+def test_run_tests_sets_variables_from_response_json(evaluator):
+    variables = VariableScope()
+    response = {"code": 200, "headers": [("X-Id", "7")], "body": json.dumps({"data": {"items": [{"id": 5}]}})}
+    evaluator.run_tests(
+        "var jsonData = pm.response.json();\n"
+        'pm.environment.set("first", jsonData.data.items[0].id);\n'
+        'pm.environment.set("header", pm.response.headers.get("x-id"));',
+        response,
+        variables
+    )
+    assert variables["first"] == 5
+    assert variables["header"] == "7"
+
+def test_run_tests_assertion_statuses(evaluator):
+    response = {"code": 404, "headers": [], "body": "not here", "response_time": 10}
+    results = evaluator.run_tests(
+        'pm.test("status", function () { pm.response.to.have.status(200); });\n'
+        'pm.test("body", function () { pm.expect(pm.response.text()).to.include("here"); });\n'
+        'pm.test("custom", function () { doSomething(); });\n'
+        'tests["legacy"] = responseCode.code === 404;',
+        response,
+        {}
+    )
+    assert [(r["name"], r["status"]) for r in results] == [
+        ("status", "failed"), ("body", "passed"), ("custom", "skipped"), ("legacy", "passed")
+    ]
+
+def test_run_tests_without_response_fails(evaluator):
+    results = evaluator.run_tests('pm.test("ok", function () { pm.response.to.be.ok; });', None, {})
+    assert results == [{"name": "ok", "status": "failed", "message": "No response received"}]
@@ -0,0 +1,61 @@
+import pickle
+
+from app.core.template_engine import VariableScope, compile_template
+
+def test_higher_scope_wins_regardless_of_load_order():
+    variables = VariableScope()
+    variables.set("host", "local", "local")
+    variables.set("host", "env", "environment")
+    variables.set("host", "global", "global")
+    assert variables["host"] == "local"
+
+    variables.load("data", {"host": "data", "id": 1})
+    assert variables["host"] == "local"
+    assert variables["id"] == 1
+
+def test_unset_reveals_lower_scope():
+    variables = VariableScope({"collection": {"token": "c"}, "environment": {"token": "e"}})
+    assert variables["token"] == "e"
+
+    variables.unset("token", "environment")
+    assert variables["token"] == "c"
+    variables.unset("token", "collection")
+    assert "token" not in variables
+
+def test_plain_dict_writes_go_to_local_scope():
+    variables = VariableScope({"environment": {"a": 1}})
+    variables["a"] = 2
+    variables.update(b=3)
+    assert variables.layers["local"] == {"a": 2, "b": 3}
+    assert variables.layers["environment"] == {"a": 1}
+
+    del variables["a"]
+    assert "a" not in variables
+    assert all("a" not in values for values in variables.layers.values())
+
+def test_copy_is_independent_and_changes_are_per_scope():
+    base = VariableScope({"environment": {"a": 1, "b": 2}})
+    changed = base.copy()
+    changed.set("a", 10, "environment")
+    changed.set("c", 3, "global")
+    changed.set("b", 2, "environment")
+
+    assert base["a"] == 1
+    assert changed.changes(base) == {"environment": {"a": 10}, "global": {"c": 3}}
+
+def test_pickle_round_trip_keeps_layers():
+    variables = VariableScope({"collection": {"a": 1}, "local": {"a": 2}})
+    restored = pickle.loads(pickle.dumps(variables))
+    assert isinstance(restored, VariableScope)
+    assert restored.layers == variables.layers
+    assert restored["a"] == 2
+
+def test_template_renders_repeated_and_missing_variables():
+    template = compile_template("{{host}}/a/{{ id }}/{{host}}?q={{missing}}")
+    assert set(template.keys) == {"host", "id", "missing"}
+    assert template.render({"host": "h", "id": 7}) == "h/a/7/h?q={{missing}}"
+
+def test_compile_template_shares_and_normalizes_values():
+    assert compile_template("x{{a}}") is compile_template("x{{a}}")
+    assert compile_template(None).render({}) == ""
+    assert compile_template(5).render({}) == "5"
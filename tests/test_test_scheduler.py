@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from app.config import settings
+from app.core import test_handler as test_handler_module
+from app.core import test_scheduler as scheduler_module
+from app.models import test_run as models
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    monkeypatch.setattr(settings, "TEST_MAX_CONCURRENT_RUNS", 4)
+    monkeypatch.setattr(settings, "TEST_MAX_RUNS_PER_USER", 2)
+    monkeypatch.setattr(settings, "TEST_QUEUE_SCAN_LIMIT", 3)
+    return scheduler_module.TestScheduler()
+
+async def add_run(db, user_id, priority=0):
+    run = models.TestRun(collection_id=1, user_id=user_id, status="queued")
+    db.add(run)
+    await db.flush()
+    return run
+
+async def test_enqueue_returns_position_by_priority(db, scheduler):
+    positions = []
+    for priority in (0, 0, 5):
+        run = await add_run(db, user_id=1)
+        positions.append(await scheduler.enqueue(db, run, priority, {}))
+    await db.commit()
+    assert positions == [1, 2, 1]
+
+async def test_dispatch_skips_saturated_users_beyond_the_scan_limit(db, scheduler, monkeypatch):
+    started = []
+
+    async def execute(queue_id, test_run_id, user_id, options):
+        started.append((user_id, test_run_id))
+        await asyncio.sleep(3600)
+
+    monkeypatch.setattr(scheduler, "_execute", execute)
+    # 사용자 1 의 항목이 스캔 한도보다 많이 앞에 있음
+    for _ in range(10):
+        await scheduler.enqueue(db, await add_run(db, user_id=1), 5, {})
+    for _ in range(3):
+        await scheduler.enqueue(db, await add_run(db, user_id=2), 0, {})
+    await db.commit()
+
+    await scheduler._dispatch()
+    await asyncio.sleep(0)
+    try:
+        assert scheduler.running_per_user == {1: 2, 2: 2}
+        assert sorted(user_id for user_id, _ in started) == [1, 1, 2, 2]
+        statuses = (await db.execute(
+            select(models.TestRunQueue.user_id, models.TestRunQueue.status).where(models.TestRunQueue.status == "running")
+        )).all()
+        assert len(statuses) == 4
+    finally:
+        await scheduler.stop()
+
+async def test_execute_marks_entry_done_and_releases_slot(db, scheduler, monkeypatch):
+    executed = []
+
+    async def execute_queued_run(test_run_id, options):
+        executed.append((test_run_id, options))
+
+    monkeypatch.setattr(test_handler_module.test_handler, "execute_queued_run", execute_queued_run)
+    run = await add_run(db, user_id=1)
+    await scheduler.enqueue(db, run, 0, {"concurrency": 2})
+    await db.commit()
+
+    await scheduler._dispatch()
+    await asyncio.gather(*scheduler.running.values())
+
+    assert executed == [(run.test_run_id, {"concurrency": 2})]
+    assert scheduler.running == {} and scheduler.running_per_user == {}
+    db.expire_all()
+    assert await db.scalar(select(models.TestRunQueue.status)) == "done"
+
+async def test_start_requeues_interrupted_runs(db, scheduler, monkeypatch):
+    run = await add_run(db, user_id=1)
+    db.add(models.TestRunQueue(test_run_id=run.test_run_id, user_id=1, status="running"))
+    run.status = "running"
+    await db.commit()
+
+    async def idle():
+        await asyncio.sleep(3600)
+
+    monkeypatch.setattr(scheduler, "_run_loop", idle)
+    await scheduler.start()
+    await scheduler.stop()
+
+    db.expire_all()
+    assert await db.scalar(select(models.TestRunQueue.status)) == "queued"
+    assert await db.scalar(select(models.TestRun.status)) == "queued"